@@ -2,144 +2,129 @@
 """
 Solution 1: Render chapters separately and concatenate them.
 This is the most reliable approach that preserves audio and visual quality.
+Chapters are rendered concurrently, each in its own media directory.
 """
 
+import argparse
 import subprocess
 import os
 from pathlib import Path
 
-def render_complete_video():
+from pipeline import (
+    CHAPTERS,
+    assemble_video,
+    check_identities,
+    package_video,
+    presynthesize,
+    prewarm_text,
+    render_chapters,
+    rendition_file,
+    renditions,
+    run_benchmark,
+    timing_dry_run,
+    write_timeline,
+)
+
+def render_complete_video(quality="-qh", jobs=None, use_cache=True, package=False):
     """
-    Render all chapters separately and concatenate them into a single video.
+    Render all chapters in parallel and concatenate them into a single video.
+    With package, also cut the renders into HLS/DASH segments at section boundaries.
     """
     
-    # Define all chapters in order
-    chapters = [
-        ("scenes/ch01_basics", "BasicsWithVoiceover"),
-        ("scenes/ch02_subsets", "SubsetsWithVoiceover"), 
-        ("scenes/ch03_empty_set", "EmptySetWithVoiceover"),
-        ("scenes/ch04_union_and_intersection", "UnionAndIntersectionWithVoiceover"),
-        ("scenes/ch05_complement", "TheComplementWithVoiceover"),
-        ("scenes/ch06_de_morgan_laws", "DeMorganLawsWithVoiceover"),
-        ("scenes/ch07_sets_of_sets_and_power_sets", "SetsOfSetsPowerSetsIndexedFamiliesWithVoiceover"),
-        ("scenes/ch08_russells_paradox", "RussellsParadoxWithVoiceover"),
-    ]
-    
     # Output and temporary directories
     output_dir = Path("media/videos")
     output_dir.mkdir(parents=True, exist_ok=True)
     temp_dir = Path("temp_chapters")
     temp_dir.mkdir(exist_ok=True)
     
-    # Video quality settings
-    quality = "-qh"  # high quality
-    
-    rendered_files = []
-    
-    print("Rendering individual chapters...")
-    
-    # Step 1: Render each chapter individually
-    for i, (module, class_name) in enumerate(chapters, 1):
-        print(f"Rendering Chapter {i}: {class_name}")
-        
-        # Check if the file exists
+    # Check that every scene file exists before starting any render
+    for module, class_name in CHAPTERS:
         scene_file = Path(f"{module}.py")
         if not scene_file.exists():
             print(f"Error: Scene file {scene_file} does not exist!")
             print(f"Current working directory: {Path.cwd()}")
             print(f"Looking for: {scene_file.absolute()}")
             return False
-        
-        print(f"Found scene file: {scene_file}")
-        
-        # Construct the corrected manim command
-        cmd = [
-            "manim",
-            "render",  # Add explicit render command
-            quality,
-            f"{module}.py",
-            class_name,
-            "-o", f"chapter_{i:02d}_{class_name}"  # Correct output flag syntax
-        ]
-        
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            print(f"Chapter {i} rendered successfully")
-            
-            # Find the generated video file
-            chapter_file = find_generated_video(class_name, i)
-            if chapter_file:
-                rendered_files.append(chapter_file)
-            else:
-                print(f"Could not find output file for Chapter {i}")
-                
-        except subprocess.CalledProcessError as e:
-            print(f"Error rendering Chapter {i}: {e}")
-            print(f"STDOUT: {e.stdout}")
-            print(f"STDERR: {e.stderr}")
-            return False
     
-    if len(rendered_files) != len(chapters):
-        print(f"Only {len(rendered_files)} of {len(chapters)} chapters rendered successfully")
+    # A wrong law on screen is cheaper to catch here than after a full render
+    if check_identities([Path(f"{module}.py") for module, _ in CHAPTERS]):
+        print("Fix the displayed identities above before rendering")
         return False
     
-    print(f"All {len(chapters)} chapters rendered successfully")
+    # Step 0: Synthesize every voiceover line up front so renders only read cached audio
+    if not presynthesize([Path(f"{module}.py") for module, _ in CHAPTERS]):
+        print("Voiceover synthesis failed")
+        return False
     
-    # Step 2: Create file list for ffmpeg
-    file_list_path = temp_dir / "file_list.txt"
-    with open(file_list_path, 'w') as f:
-        for video_file in rendered_files:
-            f.write(f"file '{video_file.absolute()}'\n")
+    # Lay out every literal text once, so parallel renders only load cached glyphs
+    prewarm_text([Path(f"{module}.py") for module, _ in CHAPTERS], jobs=jobs)
+    
+    print("Rendering individual chapters...")
     
-    # Step 3: Concatenate videos using ffmpeg
+    # Step 1: Render the changed chapters concurrently, results come back in chapter order
+    rendered_files = render_chapters(CHAPTERS, quality=quality, jobs=jobs, use_cache=use_cache)
+    if rendered_files is None:
+        print("Some chapters failed to render")
+        return False
+    
+    print(f"All {len(CHAPTERS)} chapters rendered successfully")
+    
+    # Step 2: Probe the chapters and concatenate them, re-encoding only mismatched ones
     print("Concatenating chapters into final video...")
     
     final_output = output_dir / "SetTheoryCompleteVideo.mp4"
+    if not assemble_video(rendered_files, final_output, temp_dir):
+        return False
     
-    ffmpeg_cmd = [
-        "ffmpeg",
-        "-f", "concat",
-        "-safe", "0",
-        "-i", str(file_list_path),
-        "-c", "copy",
-        "-y",
-        str(final_output)
-    ]
+    print(f"Final video created: {final_output}")
     
-    try:
-        result = subprocess.run(ffmpeg_cmd, capture_output=True, text=True, check=True)
-        print(f"Final video created: {final_output}")
-        
-        # Clean up temporary files
-        cleanup_temp_files(temp_dir)
-        
-        return True
-        
-    except subprocess.CalledProcessError as e:
-        print(f"Error concatenating videos: {e}")
-        print(f"STDERR: {e.stderr}")
+    # Chapter, section and voiceover markers, from the manifests cached with each render
+    print(f"Timeline written to {write_timeline(CHAPTERS, rendered_files, final_output)}")
+    
+    # Every rendition was rendered alongside the main video and is assembled the same way
+    for label in renditions(quality):
+        print(f"Concatenating the {label} rendition...")
+        rendition_output = rendition_file(final_output, label)
+        if not assemble_video([rendition_file(video, label) for video in rendered_files], rendition_output, temp_dir):
+            return False
+        print(f"Final video created: {rendition_output}")
+    
+    # Step 3: Stream segments come straight from the cached sections, not the final file
+    if package and not package_video(CHAPTERS, quality=quality):
         return False
+    
+    # Clean up temporary files
+    cleanup_temp_files(temp_dir)
+    
+    return True
 
-def find_generated_video(class_name, chapter_num):
-    """Find the generated video file for a chapter."""
-    
-    possible_paths = [
-        Path("media/videos") / f"chapter_{chapter_num:02d}_{class_name}.mp4",
-        Path("media/videos") / f"{class_name}.mp4",
-    ]
-    
-    for path in possible_paths:
-        if path.exists():
-            return path
-    
-    # Search recursively in media directory
-    media_dir = Path("media")
-    if media_dir.exists():
-        for video_file in media_dir.rglob("*.mp4"):
-            if class_name in video_file.name or f"chapter_{chapter_num:02d}" in video_file.name:
-                return video_file
-    
-    return None
+def check_timing(quality="-qh"):
+    """
+    Compute every chapter's voiceover timeline without rendering any frame.
+    Returns False when a voiceover's animations outrun its audio.
+    """
+    if not presynthesize([Path(f"{module}.py") for module, _ in CHAPTERS]):
+        print("Voiceover synthesis failed")
+        return False
+    
+    return timing_dry_run(CHAPTERS, quality=quality) == 0
+
+def benchmark(quality="-qh", sections=False, baseline=None):
+    """
+    Render every chapter (or section) one at a time and report its cost.
+    Voiceovers are synthesized first so speech requests do not count as render time.
+    """
+    if not presynthesize([Path(f"{module}.py") for module, _ in CHAPTERS]):
+        print("Voiceover synthesis failed")
+        return False
+    
+    problems = run_benchmark(
+        CHAPTERS,
+        quality=quality,
+        sections=sections,
+        baseline_file=Path(baseline) if baseline else None
+    )
+    return problems == 0
 
 def cleanup_temp_files(temp_dir):
     """Clean up temporary files."""
@@ -171,16 +156,124 @@ def test_manim_command():
         print(f"Error testing manim command: {e}")
         return False
 
+def parse_args():
+    """Parse the command line options of the build."""
+    parser = argparse.ArgumentParser(description="Render the complete set theory video.")
+    parser.add_argument(
+        "-q", "--quality",
+        default="h",
+        choices=["l", "m", "h", "p", "k"],
+        help="manim quality used for every chapter (l, m, h, p or k as in -ql ... -qk)"
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=None,
+        help="number of chapters rendered at the same time (default: one per core)"
+    )
+    parser.add_argument(
+        "--raster-jobs",
+        type=int,
+        default=None,
+        help="processes rasterizing the frames of one animation (default: the cores left idle by -j)"
+    )
+    parser.add_argument(
+        "--renditions",
+        default=None,
+        help="extra heights encoded from the same render, e.g. 720,480 (default: $SET_THEORY_RENDITIONS)"
+    )
+    parser.add_argument(
+        "--package",
+        action="store_true",
+        help="also package the video as HLS and DASH segments in media/package/"
+    )
+    parser.add_argument(
+        "--tts",
+        choices=["gtts", "offline"],
+        default=None,
+        help="speech backend for the voiceovers (default: $SET_THEORY_TTS or gtts)"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="only compute the voiceover timeline of every chapter, without rendering"
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="only check the set identities displayed by every chapter"
+    )
+    parser.add_argument(
+        "--prewarm",
+        action="store_true",
+        help="only lay out the texts of every chapter into the shared text cache"
+    )
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="render the chapters one at a time and report time, memory and frame rate"
+    )
+    parser.add_argument(
+        "--benchmark-sections",
+        action="store_true",
+        help="with --benchmark, measure every section of every chapter separately"
+    )
+    parser.add_argument(
+        "--baseline",
+        default=None,
+        help="with --benchmark, report to compare against (created if it does not exist)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="re-render every chapter even if its cached build is up to date"
+    )
+    return parser.parse_args()
+
 if __name__ == "__main__":
+    args = parse_args()
+    if args.tts:
+        # Read by the chapter scenes in every render process
+        os.environ["SET_THEORY_TTS"] = args.tts
+    if args.renditions:
+        # Read by scenes.rendering in every render process
+        os.environ["SET_THEORY_RENDITIONS"] = args.renditions
+    if args.raster_jobs:
+        # Read by scenes.rendering in every render process
+        os.environ["SET_THEORY_RASTER_JOBS"] = str(args.raster_jobs)
+    
     # List scene files for debugging
     list_scene_files()
     
+    if args.check:
+        exit(1 if check_identities([Path(f"{module}.py") for module, _ in CHAPTERS]) else 0)
+    
+    if args.prewarm:
+        prewarm_text([Path(f"{module}.py") for module, _ in CHAPTERS], jobs=args.jobs)
+        exit(0)
+    
+    if args.dry_run:
+        exit(0 if check_timing(quality=f"-q{args.quality}") else 1)
+    
     # Test manim first
     if not test_manim_command():
         print("Manim command test failed. Please check your installation.")
         exit(1)
     
-    success = render_complete_video()
+    if args.benchmark:
+        success = benchmark(
+            quality=f"-q{args.quality}",
+            sections=args.benchmark_sections,
+            baseline=args.baseline
+        )
+        exit(0 if success else 1)
+    
+    success = render_complete_video(
+        quality=f"-q{args.quality}",
+        jobs=args.jobs,
+        use_cache=not args.no_cache,
+        package=args.package
+    )
     if success:
         print("Complete video rendering finished successfully")
     else:
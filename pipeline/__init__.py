@@ -0,0 +1,26 @@
+from pipeline.assemble import assemble_video
+from pipeline.benchmark import run_benchmark
+from pipeline.cache import rendition_file, renditions
+from pipeline.chapters import CHAPTERS
+from pipeline.identities import check_identities
+from pipeline.package import package_video
+from pipeline.prewarm import prewarm_text
+from pipeline.scheduler import render_chapters
+from pipeline.timeline import write_timeline
+from pipeline.timing import timing_dry_run
+from pipeline.voiceovers import presynthesize
+
+__all__ = [
+    "CHAPTERS",
+    "assemble_video",
+    "check_identities",
+    "package_video",
+    "presynthesize",
+    "prewarm_text",
+    "render_chapters",
+    "rendition_file",
+    "renditions",
+    "run_benchmark",
+    "timing_dry_run",
+    "write_timeline",
+]
@@ -0,0 +1,154 @@
+"""Final assembly: probe the chapter streams, conform the odd ones out, concatenate."""
+
+import json
+import subprocess
+import time
+from collections import Counter
+
+# Stream parameters that must match for the concat demuxer to stream-copy safely
+VIDEO_KEYS = ("codec_name", "profile", "width", "height", "pix_fmt", "r_frame_rate", "time_base")
+AUDIO_KEYS = ("codec_name", "sample_rate", "channels")
+
+ENCODERS = {
+    "h264": "libx264",
+    "hevc": "libx265",
+    "vp9": "libvpx-vp9",
+    "aac": "aac",
+    "mp3": "libmp3lame",
+    "opus": "libopus",
+}
+
+H264_PROFILES = {
+    "Constrained Baseline": "baseline",
+    "Baseline": "baseline",
+    "Main": "main",
+    "High": "high",
+    "High 10": "high10",
+    "High 4:2:2": "high422",
+    "High 4:4:4 Predictive": "high444",
+}
+
+def run_ffprobe(args):
+    """Run ffprobe and return its parsed JSON output."""
+    result = subprocess.run(
+        ["ffprobe", "-v", "error", "-of", "json", *args],
+        capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout)
+
+def stream_profile(video_file):
+    """Return the video and audio stream parameters of a file (audio is None if absent)."""
+    streams = run_ffprobe(["-show_streams", str(video_file)])["streams"]
+    video = next((s for s in streams if s["codec_type"] == "video"), None)
+    audio = next((s for s in streams if s["codec_type"] == "audio"), None)
+    if video is None:
+        raise ValueError(f"{video_file} has no video stream")
+    return {
+        "video": {key: video.get(key) for key in VIDEO_KEYS},
+        "audio": {key: audio.get(key) for key in AUDIO_KEYS} if audio else None,
+    }
+
+def starts_with_keyframe(video_file):
+    """Check that the first video packet is a keyframe, so the file can be cut in front of it."""
+    packets = run_ffprobe([
+        "-select_streams", "v:0",
+        "-read_intervals", "%+#1",
+        "-show_entries", "packet=flags",
+        str(video_file)
+    ])["packets"]
+    return bool(packets) and "K" in packets[0].get("flags", "")
+
+def common_profile(profiles):
+    """Pick the stream profile shared by most chapters, the first chapter's on a tie."""
+    counts = Counter(json.dumps(profile, sort_keys=True) for profile in profiles)
+    best = max(counts.values())
+    for profile in profiles:
+        if counts[json.dumps(profile, sort_keys=True)] == best:
+            return profile
+
+def conform(video_file, profile, output):
+    """Re-encode one chapter to the common stream profile."""
+    video = profile["video"]
+    audio = profile["audio"]
+    source_has_audio = stream_profile(video_file)["audio"] is not None
+    
+    cmd = ["ffmpeg", "-i", str(video_file)]
+    if audio and not source_has_audio:
+        # Give a silent chapter the soundtrack the others have
+        layout = "mono" if audio["channels"] == 1 else "stereo"
+        cmd += ["-f", "lavfi", "-i", f"anullsrc=r={audio['sample_rate']}:cl={layout}", "-shortest"]
+    
+    cmd += ["-map", "0:v:0"]
+    if audio:
+        cmd += ["-map", "0:a:0" if source_has_audio else "1:a:0"]
+    
+    cmd += [
+        "-c:v", ENCODERS.get(video["codec_name"], video["codec_name"]),
+        "-pix_fmt", video["pix_fmt"],
+        "-s", f"{video['width']}x{video['height']}",
+        "-r", video["r_frame_rate"],
+        "-video_track_timescale", video["time_base"].split("/")[1],
+    ]
+    if video["codec_name"] == "h264" and video["profile"] in H264_PROFILES:
+        cmd += ["-profile:v", H264_PROFILES[video["profile"]]]
+    if audio:
+        cmd += [
+            "-c:a", ENCODERS.get(audio["codec_name"], audio["codec_name"]),
+            "-ar", str(audio["sample_rate"]),
+            "-ac", str(audio["channels"]),
+        ]
+    cmd += ["-y", str(output)]
+    
+    subprocess.run(cmd, capture_output=True, text=True, check=True)
+    return output
+
+def concat_copy(videos, output, list_file):
+    """Concatenate videos with identical stream parameters without re-encoding."""
+    with open(list_file, "w") as f:
+        for video_file in videos:
+            f.write(f"file '{video_file.absolute()}'\n")
+    
+    subprocess.run(
+        ["ffmpeg", "-f", "concat", "-safe", "0", "-i", str(list_file), "-c", "copy", "-y", str(output)],
+        capture_output=True, text=True, check=True
+    )
+    return output
+
+def assemble_video(videos, output, temp_dir):
+    """
+    Concatenate the chapter videos into the final video.
+    Every chapter is probed first; chapters that differ from the common stream
+    profile, or do not start on a keyframe, are re-encoded to it one by one, and the
+    result is joined with a stream copy. Returns True on success.
+    """
+    try:
+        start = time.perf_counter()
+        profiles = [stream_profile(video_file) for video_file in videos]
+        keyframes = [starts_with_keyframe(video_file) for video_file in videos]
+        profile = common_profile(profiles)
+        print(f"Probed {len(videos)} chapters in {time.perf_counter() - start:.2f}s")
+        
+        parts = []
+        for number, (video_file, chapter_profile, keyframe) in enumerate(zip(videos, profiles, keyframes), 1):
+            if chapter_profile == profile and keyframe:
+                parts.append(video_file)
+                continue
+            
+            reason = "stream parameters differ" if chapter_profile != profile else "no leading keyframe"
+            print(f"Re-encoding Chapter {number} ({reason})...")
+            start = time.perf_counter()
+            parts.append(conform(video_file, profile, temp_dir / f"conformed_{number:02d}.mp4"))
+            print(f"Re-encoded Chapter {number} in {time.perf_counter() - start:.2f}s")
+        
+        start = time.perf_counter()
+        concat_copy(parts, output, temp_dir / "file_list.txt")
+        print(f"Concatenated {len(parts)} chapters in {time.perf_counter() - start:.2f}s")
+        return True
+    
+    except subprocess.CalledProcessError as e:
+        print(f"Error assembling video: {e}")
+        print(f"STDERR: {e.stderr}")
+        return False
+    except ValueError as e:
+        print(f"Error assembling video: {e}")
+        return False
@@ -0,0 +1,161 @@
+"""Render benchmark: wall-clock, CPU time, peak memory and frame rate per chapter and section."""
+
+import csv
+import json
+import os
+import subprocess
+import time
+from pathlib import Path
+
+from pipeline.scheduler import generated_video, render_command, render_env
+from pipeline.sections import parse_chapter, section_names
+
+BENCHMARK_MEDIA_DIR = Path("media/benchmark")
+
+# A run is flagged when it is this much slower (or bigger) than the baseline
+REGRESSION_THRESHOLD = 0.10
+
+# Measurements compared against the baseline
+COMPARED_FIELDS = ("wall", "cpu", "max_rss_mb")
+
+REPORT_FIELDS = [
+    "chapter", "class_name", "section", "wall", "cpu_user", "cpu_system", "cpu",
+    "max_rss_mb", "frames", "fps", "error",
+]
+
+def measure_render(number, module, class_name, quality, media_dir, section=None):
+    """
+    Render one chapter or section with manim's own caching disabled and measure it.
+    CPU time and peak RSS come from wait4() on the render process, so they cover
+    the render and the LaTeX processes it waited for.
+    """
+    cmd, manifest_file = render_command(number, module, class_name, quality, media_dir, section)
+    cmd.append("--disable_caching")
+    
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        env=render_env(manifest_file, section)
+    )
+    # Drain stderr ourselves: communicate() would reap the process and lose its rusage
+    stderr = process.stderr.read()
+    process.stderr.close()
+    _, status, usage = os.wait4(process.pid, 0)
+    process.returncode = os.waitstatus_to_exitcode(status)
+    wall = time.perf_counter() - start
+    
+    result = {
+        "chapter": number,
+        "class_name": class_name,
+        "section": section or "",
+        "wall": round(wall, 3),
+        "cpu_user": round(usage.ru_utime, 3),
+        "cpu_system": round(usage.ru_stime, 3),
+        "cpu": round(usage.ru_utime + usage.ru_stime, 3),
+        # ru_maxrss is in kilobytes on Linux
+        "max_rss_mb": round(usage.ru_maxrss / 1024, 1),
+        "frames": None,
+        "fps": None,
+        "error": "",
+    }
+    
+    if process.returncode != 0:
+        lines = stderr.decode(errors="replace").strip().splitlines()
+        result["error"] = lines[-1] if lines else f"manim exited with {process.returncode}"
+        return result
+    if generated_video(manifest_file) is None:
+        result["error"] = f"no output reported in {manifest_file}"
+        return result
+    
+    with open(manifest_file) as f:
+        frames = json.load(f)["frames"]
+    result["frames"] = frames
+    result["fps"] = round(frames / wall, 2) if wall > 0 else None
+    return result
+
+def print_result(result):
+    """Print one benchmark row."""
+    name = result["class_name"] + (f" [{result['section']}]" if result["section"] else "")
+    if result["error"]:
+        print(f"  {name}: FAILED ({result['error']})")
+        return
+    print(
+        f"  {name}: {result['wall']:.1f}s wall, {result['cpu']:.1f}s cpu, "
+        f"{result['max_rss_mb']:.0f} MB, {result['frames']} frames, {result['fps']} fps"
+    )
+
+def write_report(results, report_file):
+    """Write the benchmark results as JSON, with a CSV copy next to it."""
+    report_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(report_file, "w") as f:
+        json.dump(results, f, indent=2)
+    with open(report_file.with_suffix(".csv"), "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=REPORT_FIELDS)
+        writer.writeheader()
+        writer.writerows(results)
+    print(f"Benchmark report written to {report_file} and {report_file.with_suffix('.csv')}")
+
+def compare_reports(results, baseline, threshold=REGRESSION_THRESHOLD):
+    """
+    Compare benchmark results with a baseline report.
+    Returns (chapter, class, section, field, baseline, current) for every regression.
+    """
+    previous = {(row["chapter"], row["section"]): row for row in baseline if not row.get("error")}
+    regressions = []
+    for row in results:
+        before = previous.get((row["chapter"], row["section"]))
+        if before is None or row["error"]:
+            continue
+        for field in COMPARED_FIELDS:
+            if before[field] and row[field] > before[field] * (1 + threshold):
+                regressions.append(
+                    (row["chapter"], row["class_name"], row["section"], field, before[field], row[field])
+                )
+    return regressions
+
+def run_benchmark(chapters, quality="-qh", sections=False, baseline_file=None,
+                  report_file=BENCHMARK_MEDIA_DIR / "report.json", threshold=REGRESSION_THRESHOLD):
+    """
+    Render every chapter one after another, or every section of every chapter,
+    and report the measurements. Renders run sequentially so they do not compete
+    for cores. With a baseline file, regressions against it are printed; a missing
+    baseline is created from this run.
+    Returns the number of failed renders plus the number of regressions.
+    """
+    results = []
+    for number, (module, class_name) in enumerate(chapters, 1):
+        media_dir = BENCHMARK_MEDIA_DIR / f"chapter_{number:02d}"
+        print(f"Chapter {number}: {class_name}")
+        
+        names = [None]
+        if sections:
+            names = section_names(parse_chapter(module, class_name)[1]) or [None]
+        for section in names:
+            section_dir = media_dir / section if section else media_dir
+            result = measure_render(number, module, class_name, quality, section_dir, section)
+            print_result(result)
+            results.append(result)
+    
+    write_report(results, report_file)
+    failures = sum(1 for row in results if row["error"])
+    
+    if baseline_file is None:
+        return failures
+    if not baseline_file.exists():
+        write_report(results, baseline_file)
+        print(f"No baseline found, saved this run as {baseline_file}")
+        return failures
+    
+    with open(baseline_file) as f:
+        baseline = json.load(f)
+    regressions = compare_reports(results, baseline, threshold)
+    for number, class_name, section, field, before, after in regressions:
+        name = class_name + (f" [{section}]" if section else "")
+        print(f"!! Chapter {number} {name}: {field} {before} -> {after} (+{(after / before - 1) * 100:.0f}%)")
+    if regressions:
+        print(f"{len(regressions)} regressions above {threshold * 100:.0f}% against {baseline_file}")
+    else:
+        print(f"No regressions against {baseline_file}")
+    return failures + len(regressions)
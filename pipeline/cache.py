@@ -0,0 +1,165 @@
+"""Content-hash cache of rendered chapter and section videos."""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+from importlib import metadata
+from pathlib import Path
+
+from pipeline.chapters import scene_file
+
+CACHE_ROOT = Path(".render_cache")
+CHAPTER_CACHE_DIR = CACHE_ROOT / "chapters"
+SECTION_CACHE_DIR = CACHE_ROOT / "sections"
+
+# Packages whose version changes the rendered output
+RENDER_PACKAGES = ("manim", "manim-voiceover")
+
+# Same variable and default as scenes.speech, the TTS backend changes the soundtrack
+TTS_ENV = "SET_THEORY_TTS"
+DEFAULT_TTS = "gtts"
+
+# Same variable as scenes.rendering, extra resolutions written next to every video
+RENDITIONS_ENV = "SET_THEORY_RENDITIONS"
+
+# Frame height of each quality flag; renditions are only made below it
+QUALITY_HEIGHTS = {"-ql": 480, "-qm": 720, "-qh": 1080, "-qp": 1440, "-qk": 2160}
+
+IMAGE_PATTERN = re.compile(r"""["'](images/[^"']+)["']""")
+CHAPTER_PATTERN = re.compile(r"ch\d\d_")
+
+def package_version(name):
+    """Return the installed version of a package, or 'missing'."""
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return "missing"
+
+def renditions(quality=None):
+    """
+    Labels of the extra renditions requested through SET_THEORY_RENDITIONS, e.g.
+    ["720p", "480p"], keeping only those smaller than the quality's frame when given.
+    """
+    labels = []
+    for value in os.environ.get(RENDITIONS_ENV, "").split(","):
+        value = value.strip().removesuffix("p")
+        if not value.isdigit() or f"{value}p" in labels:
+            continue
+        if quality is None or int(value) < QUALITY_HEIGHTS.get(quality, 0):
+            labels.append(f"{value}p")
+    return labels
+
+def rendition_file(video_file, label):
+    """The rendition of a video with the given label, written next to it as <stem>_<label>.mp4."""
+    return video_file.with_name(f"{video_file.stem}_{label}{video_file.suffix}")
+
+def image_assets(source):
+    """Return the image files referenced by a piece of source, sorted and deduplicated."""
+    return sorted({Path(match) for match in IMAGE_PATTERN.findall(source)})
+
+def shared_scene_files():
+    """Return the helper modules under scenes/ that every chapter depends on."""
+    return sorted(
+        path for path in Path("scenes").glob("*.py")
+        if not CHAPTER_PATTERN.match(path.name)
+    )
+
+def content_key(sources, quality):
+    """
+    Hash a list of (label, text) sources together with everything they render with:
+    the images they reference, the shared scene helpers, the quality flag, the TTS
+    backend, the extra renditions and the render package versions.
+    """
+    digest = hashlib.sha256()
+    
+    def feed(label, data):
+        digest.update(label.encode("utf-8"))
+        digest.update(len(data).to_bytes(8, "little"))
+        digest.update(data)
+    
+    for label, text in sources:
+        feed(label, text.encode("utf-8"))
+    
+    for image in image_assets("\n".join(text for _, text in sources)):
+        feed(f"image:{image.as_posix()}", image.read_bytes() if image.exists() else b"")
+    
+    for helper in shared_scene_files():
+        feed(f"helper:{helper.as_posix()}", helper.read_bytes())
+    
+    feed("quality", quality.encode("utf-8"))
+    feed("tts", os.environ.get(TTS_ENV, DEFAULT_TTS).encode("utf-8"))
+    feed("renditions", ",".join(renditions(quality)).encode("utf-8"))
+    for package in RENDER_PACKAGES:
+        feed(f"package:{package}", package_version(package).encode("utf-8"))
+    
+    return digest.hexdigest()
+
+def chapter_key(module, quality):
+    """Hash everything a whole chapter render depends on."""
+    return content_key([("source", scene_file(module).read_text(encoding="utf-8"))], quality)
+
+def cached_video(directory, key):
+    """
+    Return the cached video stored under a key, or None if it was never stored
+    (or was stored without the manifest its timeline comes from).
+    """
+    video_file = directory / f"{key}.mp4"
+    if video_file.exists() and video_file.with_suffix(".json").exists():
+        return video_file
+    return None
+
+def video_manifest(video_file):
+    """Return the render manifest stored next to a cached video."""
+    with open(video_file.with_suffix(".json")) as f:
+        return json.load(f)
+
+def store_video(directory, key, video_file, manifest):
+    """
+    Copy a freshly rendered video, and its renditions, into a cache directory with its
+    render manifest and drop its older builds. Returns the path of the cached copy.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    
+    # The manifest records which build it describes
+    manifest_file = directory / f"{key}.json"
+    partial = manifest_file.with_name(f"{manifest_file.name}.tmp")
+    with open(partial, "w") as f:
+        json.dump({**manifest, "key": key}, f, indent=2)
+    os.replace(partial, manifest_file)
+    
+    cached = directory / f"{key}.mp4"
+    copies = [(video_file, cached)]
+    for label in renditions():
+        if rendition_file(video_file, label).exists():
+            copies.append((rendition_file(video_file, label), rendition_file(cached, label)))
+    
+    # Renditions first, so a build is only visible once all its files are in place
+    for source, target in reversed(copies):
+        partial = target.with_name(f"{target.name}.tmp")
+        shutil.copy2(source, partial)
+        os.replace(partial, target)
+    
+    kept = {target for _, target in copies} | {manifest_file}
+    for old in [*directory.glob("*.mp4"), *directory.glob("*.json")]:
+        if old not in kept:
+            old.unlink()
+    
+    return cached
+
+def cached_chapter(class_name, key):
+    """Return the cached video of a chapter build, or None if it was never stored."""
+    return cached_video(CHAPTER_CACHE_DIR / class_name, key)
+
+def store_chapter(class_name, key, video_file, manifest):
+    """Store a chapter build in the cache and return the cached copy."""
+    return store_video(CHAPTER_CACHE_DIR / class_name, key, video_file, manifest)
+
+def cached_section(class_name, section, key):
+    """Return the cached video of a section build, or None if it was never stored."""
+    return cached_video(SECTION_CACHE_DIR / class_name / section, key)
+
+def store_section(class_name, section, key, video_file, manifest):
+    """Store a section build in the cache and return the cached copy."""
+    return store_video(SECTION_CACHE_DIR / class_name / section, key, video_file, manifest)
@@ -0,0 +1,31 @@
+"""Chapter list shared by the render pipeline."""
+
+from pathlib import Path
+
+# Define all chapters in order
+CHAPTERS = [
+    ("scenes/ch01_basics", "BasicsWithVoiceover"),
+    ("scenes/ch02_subsets", "SubsetsWithVoiceover"),
+    ("scenes/ch03_empty_set", "EmptySetWithVoiceover"),
+    ("scenes/ch04_union_and_intersection", "UnionAndIntersectionWithVoiceover"),
+    ("scenes/ch05_complement", "TheComplementWithVoiceover"),
+    ("scenes/ch06_de_morgan_laws", "DeMorganLawsWithVoiceover"),
+    ("scenes/ch07_sets_of_sets_and_power_sets", "SetsOfSetsPowerSetsIndexedFamiliesWithVoiceover"),
+    ("scenes/ch08_russells_paradox", "RussellsParadoxWithVoiceover"),
+]
+
+def scene_file(module):
+    """Return the source file of a chapter module."""
+    return Path(f"{module}.py")
+
+def output_name(number, class_name):
+    """Return the output name manim uses for a chapter video."""
+    return f"chapter_{number:02d}_{class_name}"
+
+def estimated_cost(module):
+    """Estimate how long a chapter takes to render from its number of source lines."""
+    try:
+        with open(scene_file(module), encoding="utf-8") as f:
+            return sum(1 for _ in f)
+    except OSError:
+        return 0
@@ -0,0 +1,136 @@
+"""Identity check: every set law displayed by the scenes is verified before anything renders."""
+
+import ast
+import re
+from pathlib import Path
+
+import numpy as np
+
+from scenes.formulas import formula_constants, formula_value
+from scenes.set_expressions import expression_sets, parse_expression, truth_table
+
+TEX_CLASSES = {"MathTex", "Tex"}
+
+# Wrappers that only change the typeface of their argument
+FONT_COMMANDS = ("\\mathbf", "\\mathrm", "\\mathit", "\\boldsymbol")
+
+SPACING = re.compile(r"\\(?:quad|qquad|left|right|[Bb]ig[lr]?)\b|\\[,;:! ]")
+
+# "1. " in front of a numbered property
+NUMBERING = re.compile(r"^\s*\d+\.\s*")
+
+# Formulas about elements, sizes, subsets or explicit sets are not identities between expressions
+NOT_IDENTITY = re.compile(r"\\\{|\\text|\\mathbb|\\mid|\\in\b|\\notin|\\subset|\\neg|[|<>+_0-9]")
+
+# A formula without any of these only names sets, as in "A = B"
+SET_OPERATOR = re.compile(r"\\(?:cup|cap|setminus|triangle|Delta|varnothing|emptyset)|\^|[∪∩ᶜΔ∅']")
+
+# Regions listed for an identity that does not hold
+MAX_COUNTEREXAMPLES = 3
+
+def unwrap(formula, command, template="{}"):
+    """Replace every command{argument} in a formula by the template filled with the argument."""
+    while (start := formula.find(command + "{")) >= 0:
+        depth = 0
+        for end in range(start + len(command), len(formula)):
+            depth += {"{": 1, "}": -1}.get(formula[end], 0)
+            if depth == 0:
+                break
+        argument = formula[start + len(command) + 1:end]
+        formula = formula[:start] + template.format(argument) + formula[end + 1:]
+    return formula
+
+def identity_sides(formula):
+    """
+    Return the sides of a displayed set identity as set expressions,
+    or None when the formula is not an identity between set expressions.
+    """
+    for command in FONT_COMMANDS:
+        formula = unwrap(formula, command)
+    formula = unwrap(formula, "\\overline", "({})^c")
+    formula = NUMBERING.sub("", SPACING.sub(" ", formula))
+    if "=" not in formula or not SET_OPERATOR.search(formula) or NOT_IDENTITY.search(formula):
+        return None
+    
+    formula = formula.replace("^{c}", "^c").replace("{", "(").replace("}", ")")
+    return [side.strip() for side in formula.split("=")]
+
+def displayed_identities(path):
+    """Return (line, formula, sides) for every MathTex/Tex identity built from literals or formula constants."""
+    tree = ast.parse(Path(path).read_text(encoding="utf-8"))
+    constants = formula_constants(tree)
+    identities = []
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in TEX_CLASSES):
+            continue
+        try:
+            parts = [formula_value(arg, constants) for arg in node.args]
+        except (ValueError, TypeError, SyntaxError):
+            continue
+        if not parts or not all(isinstance(part, str) for part in parts):
+            continue
+        
+        # MathTex joins its parts with spaces
+        formula = " ".join(parts)
+        sides = identity_sides(formula)
+        if sides is not None:
+            identities.append((node.lineno, formula, sides))
+    return sorted(identities)
+
+def counterexamples(sides):
+    """
+    Evaluate every side over all 2^n regions of the sets involved.
+    Returns the set names, the truth table of each side and the regions where the sides disagree.
+    """
+    names = []
+    for side in sides:
+        names.extend(name for name in expression_sets(parse_expression(side)) if name not in names)
+    tables = [truth_table(side, names) for side in sides]
+    differ = np.logical_or.reduce([table != tables[0] for table in tables[1:]])
+    return names, tables, np.flatnonzero(differ)
+
+def describe_region(region, names):
+    """Describe a region by the sets it lies in and outside of."""
+    inside = [name for i, name in enumerate(names) if region >> i & 1]
+    outside = [name for i, name in enumerate(names) if not region >> i & 1]
+    parts = []
+    if inside:
+        parts.append(f"in {', '.join(inside)}")
+    if outside:
+        parts.append(f"outside {', '.join(outside)}")
+    return " and ".join(parts) or "everywhere"
+
+def check_identities(scene_files):
+    """
+    Check every set identity displayed by the given scenes on all combinations of its sets.
+    Prints the identities that are false or unreadable, with counterexample regions.
+    Returns the number of such identities.
+    """
+    checked = 0
+    problems = 0
+    for path in scene_files:
+        for line, formula, sides in displayed_identities(path):
+            checked += 1
+            try:
+                names, tables, regions = counterexamples(sides)
+            except ValueError as e:
+                print(f"{path}:{line}: cannot read {formula}: {e}")
+                problems += 1
+                continue
+            if len(regions) == 0:
+                continue
+            
+            problems += 1
+            print(f"{path}:{line}: {formula} does not hold")
+            for region in regions[:MAX_COUNTEREXAMPLES]:
+                holding = [side for side, table in zip(sides, tables) if table[region]]
+                missing = [side for side, table in zip(sides, tables) if not table[region]]
+                print(
+                    f"    {describe_region(region, names)}: "
+                    f"inside {' and '.join(holding)}, not inside {' and '.join(missing)}"
+                )
+            if len(regions) > MAX_COUNTEREXAMPLES:
+                print(f"    ... and {len(regions) - MAX_COUNTEREXAMPLES} more regions")
+    
+    print(f"Checked {checked} displayed identities, {problems} problems")
+    return problems
@@ -0,0 +1,237 @@
+"""
+Segmented packaging: HLS and DASH streams of the final video, cut at section boundaries.
+
+Every section video (or whole chapter video, for chapters without sections) is split
+into fMP4 segments with a stream copy, so segments start on the keyframes manim already
+wrote and a new section always starts a new segment. The segments of a section live in
+a directory named after its cache key: an edited section (and any section that builds
+on it) gets a new directory, the others are reused as they are, and only the new
+segments need uploading. The top-level
+playlists then list the sections in order, one DASH period per section and an HLS
+discontinuity between sections.
+"""
+
+import math
+import re
+import shutil
+import subprocess
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+from pipeline.assemble import starts_with_keyframe
+from pipeline.cache import cached_chapter, cached_section, chapter_key
+from pipeline.chapters import output_name
+from pipeline.sections import chapter_sections
+
+PACKAGE_DIR = Path("media/package")
+SEGMENT_DIR = PACKAGE_DIR / "segments"
+
+# Target segment length; a stream copy can only cut on keyframes, so segments run longer
+SEGMENT_SECONDS = 6
+
+MPD_NAMESPACE = "urn:mpeg:dash:schema:mpd:2011"
+ISO_DURATION = re.compile(r"PT(?:([\d.]+)H)?(?:([\d.]+)M)?(?:([\d.]+)S)?")
+
+# Representation 0 is the video, 1 the audio, in the manifests ffmpeg writes per section
+TRACKS = ("video", "audio")
+
+def packaged_parts(chapters, quality):
+    """
+    List (label, video) for every section of every chapter in playback order, from the
+    render caches. A chapter with no sections, or with a section missing from the
+    cache, is packaged as a single part.
+    """
+    parts = []
+    for index, (module, class_name) in enumerate(chapters):
+        name = output_name(index + 1, class_name)
+        sections = [
+            (f"{name}_{section}", cached_section(class_name, section, key))
+            for section, key, _ in chapter_sections(module, class_name, quality)
+        ]
+        if sections and all(video for _, video in sections):
+            parts.extend(sections)
+            continue
+        
+        video = cached_chapter(class_name, chapter_key(module, quality))
+        if video is None:
+            raise ValueError(f"Chapter {index + 1} has no cached render, run the build first")
+        parts.append((name, video))
+    return parts
+
+def segment_video(video_file, directory):
+    """
+    Split one video into fMP4 segments with a DASH manifest and HLS playlists that share
+    them. Returns False if the segments of this build already exist.
+    """
+    if (directory / "manifest.mpd").exists():
+        return False
+    if not starts_with_keyframe(video_file):
+        raise ValueError(f"{video_file} does not start on a keyframe")
+    
+    # Segment into a scratch directory, so an interrupted run leaves no half-built part
+    partial = directory.with_name(f"{directory.name}.tmp")
+    shutil.rmtree(partial, ignore_errors=True)
+    partial.mkdir(parents=True)
+    
+    cmd = [
+        "ffmpeg",
+        "-i", str(video_file.absolute()),
+        "-map", "0:v:0",
+        "-map", "0:a:0",
+        "-c", "copy",
+        "-f", "dash",
+        "-seg_duration", str(SEGMENT_SECONDS),
+        "-use_template", "1",
+        "-use_timeline", "1",
+        "-hls_playlist", "1",
+        "-adaptation_sets", "id=0,streams=v id=1,streams=a",
+        "-init_seg_name", "init-$RepresentationID$.m4s",
+        "-media_seg_name", "chunk-$RepresentationID$-$Number%05d$.m4s",
+        "-y",
+        "manifest.mpd"
+    ]
+    subprocess.run(cmd, cwd=partial, capture_output=True, text=True, check=True)
+    partial.rename(directory)
+    return True
+
+def media_playlist(directory, track):
+    """Return the init segment and the (duration, segment) list of one track of a part."""
+    init = None
+    segments = []
+    duration = None
+    for line in (directory / f"media_{track}.m3u8").read_text().splitlines():
+        if line.startswith("#EXT-X-MAP:"):
+            init = re.search(r'URI="([^"]+)"', line).group(1)
+        elif line.startswith("#EXTINF:"):
+            duration = float(line[len("#EXTINF:"):].split(",")[0])
+        elif line and not line.startswith("#") and duration is not None:
+            segments.append((duration, line))
+            duration = None
+    return init, segments
+
+def write_media_playlist(path, directories, track):
+    """
+    Join the playlists of one track of every part, with a discontinuity (and the next
+    part's init segment) at each boundary. Returns the peak segment bitrate in bit/s.
+    """
+    lines = []
+    target = 1
+    peak = 0
+    for k, directory in enumerate(directories):
+        init, segments = media_playlist(directory, track)
+        prefix = directory.relative_to(path.parent).as_posix()
+        if k:
+            lines.append("#EXT-X-DISCONTINUITY")
+        lines.append(f'#EXT-X-MAP:URI="{prefix}/{init}"')
+        for duration, segment in segments:
+            lines.append(f"#EXTINF:{duration:.6f},")
+            lines.append(f"{prefix}/{segment}")
+            target = max(target, math.ceil(duration))
+            peak = max(peak, (directory / segment).stat().st_size * 8 / max(duration, 1e-3))
+    
+    header = [
+        "#EXTM3U",
+        "#EXT-X-VERSION:7",
+        f"#EXT-X-TARGETDURATION:{target}",
+        "#EXT-X-MEDIA-SEQUENCE:0",
+        "#EXT-X-PLAYLIST-TYPE:VOD",
+    ]
+    path.write_text("\n".join(header + lines + ["#EXT-X-ENDLIST"]) + "\n")
+    return math.ceil(peak)
+
+def representations(directory):
+    """Return the Representation elements of a part's DASH manifest, video first."""
+    root = ET.parse(directory / "manifest.mpd").getroot()
+    return root.findall(f".//{{{MPD_NAMESPACE}}}Representation")
+
+def write_master_playlist(path, directories, bandwidths):
+    """Write the HLS master playlist: the video variant with the audio as a rendition group."""
+    video, audio = representations(directories[0])
+    codecs = ",".join(filter(None, [video.get("codecs"), audio.get("codecs")]))
+    lines = [
+        "#EXTM3U",
+        "#EXT-X-VERSION:7",
+        "#EXT-X-INDEPENDENT-SEGMENTS",
+        '#EXT-X-MEDIA:TYPE=AUDIO,GROUP-ID="audio",NAME="main",DEFAULT=YES,AUTOSELECT=YES,URI="audio.m3u8"',
+        f'#EXT-X-STREAM-INF:BANDWIDTH={sum(bandwidths)},RESOLUTION={video.get("width")}x{video.get("height")},'
+        f'CODECS="{codecs}",AUDIO="audio"',
+        "video.m3u8",
+    ]
+    path.write_text("\n".join(lines) + "\n")
+
+def iso_seconds(text):
+    """Parse an ISO 8601 duration such as PT1M3.5S into seconds."""
+    hours, minutes, seconds = ISO_DURATION.fullmatch(text).groups()
+    return float(hours or 0) * 3600 + float(minutes or 0) * 60 + float(seconds or 0)
+
+def write_mpd(path, parts):
+    """
+    Join the DASH manifests of every part into one static MPD with one period per part,
+    each pointing at its own segment directory.
+    """
+    ET.register_namespace("", MPD_NAMESPACE)
+    root = None
+    periods = []
+    start = 0.0
+    for label, directory in parts:
+        part_root = ET.parse(directory / "manifest.mpd").getroot()
+        duration = iso_seconds(part_root.get("mediaPresentationDuration"))
+        for period in part_root.findall(f"{{{MPD_NAMESPACE}}}Period"):
+            period.set("id", label)
+            period.set("start", f"PT{start:.3f}S")
+            period.set("duration", f"PT{duration:.3f}S")
+            base_url = ET.Element(f"{{{MPD_NAMESPACE}}}BaseURL")
+            base_url.text = directory.relative_to(path.parent).as_posix() + "/"
+            period.insert(0, base_url)
+            periods.append(period)
+        if root is None:
+            root = part_root
+        start += duration
+    
+    # The first part's manifest carries the MPD attributes, with every period in it
+    for period in root.findall(f"{{{MPD_NAMESPACE}}}Period"):
+        root.remove(period)
+    root.extend(periods)
+    root.set("mediaPresentationDuration", f"PT{start:.3f}S")
+    ET.ElementTree(root).write(path, encoding="utf-8", xml_declaration=True)
+
+def package_video(chapters, quality="-qh", package_dir=PACKAGE_DIR):
+    """
+    Package the cached chapter and section renders as HLS (master.m3u8) and DASH
+    (manifest.mpd) in package_dir. Only parts whose cache key is new are segmented;
+    segment directories no longer used are removed. Returns True on success.
+    """
+    segment_dir = package_dir / SEGMENT_DIR.relative_to(PACKAGE_DIR)
+    try:
+        parts = packaged_parts(chapters, quality)
+        segmented = 0
+        directories = []
+        for label, video_file in parts:
+            # Cached videos are named after their content key
+            directory = segment_dir / video_file.stem
+            segmented += segment_video(video_file, directory)
+            directories.append(directory)
+        print(f"Segmented {segmented} of {len(parts)} parts, the others are unchanged")
+        
+        bandwidths = [
+            write_media_playlist(package_dir / f"{kind}.m3u8", directories, track)
+            for track, kind in enumerate(TRACKS)
+        ]
+        write_master_playlist(package_dir / "master.m3u8", directories, bandwidths)
+        write_mpd(package_dir / "manifest.mpd", list(zip([label for label, _ in parts], directories)))
+    
+    except subprocess.CalledProcessError as e:
+        print(f"Error packaging video: {e}")
+        print(f"STDERR: {e.stderr}")
+        return False
+    except ValueError as e:
+        print(f"Error packaging video: {e}")
+        return False
+    
+    used = set(directories)
+    for old in segment_dir.iterdir():
+        if old not in used:
+            shutil.rmtree(old)
+    
+    print(f"Packaged {len(parts)} parts into {package_dir}: master.m3u8 and manifest.mpd")
+    return True
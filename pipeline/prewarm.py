@@ -0,0 +1,34 @@
+"""Text pre-warm: lay out every literal Text and MarkupText of the scenes before rendering."""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+def collect_text_calls(scene_files):
+    """Return the distinct text calls of the given scene files."""
+    from scenes.text_cache import text_calls
+    
+    calls = {}
+    for path in scene_files:
+        for class_name, args, kwargs in text_calls(path):
+            calls.setdefault(repr((class_name, args, sorted(kwargs.items()))), (class_name, args, kwargs))
+    return list(calls.values())
+
+def prewarm_text(scene_files, jobs=None):
+    """
+    Fill the shared text layout and geometry caches with every text of the given
+    scenes, in parallel processes. Strings built at runtime are laid out during
+    the render as usual. Returns the number of texts laid out.
+    """
+    # Imported here so the pipeline only needs manim when it lays out text
+    from scenes.text_cache import lay_out
+    
+    calls = collect_text_calls(scene_files)
+    workers = max(1, min(len(calls), jobs or os.cpu_count() or 1))
+    print(f"Laying out {len(calls)} texts with {workers} processes...")
+    
+    chunks = [calls[i::workers] for i in range(workers)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        built = sum(executor.map(lay_out, chunks))
+    
+    print(f"{built} of {len(calls)} texts are cached")
+    return built
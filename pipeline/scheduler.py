@@ -0,0 +1,253 @@
+"""Concurrent chapter rendering with a process pool."""
+
+import json
+import os
+import subprocess
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+from pipeline.cache import (
+    cached_chapter,
+    cached_section,
+    chapter_key,
+    rendition_file,
+    renditions,
+    store_chapter,
+    store_section,
+    video_manifest,
+)
+from pipeline.chapters import estimated_cost, output_name, scene_file
+from pipeline.sections import chapter_sections, splice_sections
+from pipeline.timeline import splice_manifests
+
+MEDIA_ROOT = Path("media/chapters")
+
+# Same variables as scenes.base and scenes.rendering, read by the chapter scenes
+SECTIONS_ENV = "SET_THEORY_SECTIONS"
+MANIFEST_ENV = "SET_THEORY_MANIFEST"
+RASTER_JOBS_ENV = "SET_THEORY_RASTER_JOBS"
+
+def default_jobs(jobs):
+    """Use one worker per core, but never more workers than render jobs."""
+    return max(1, min(len(jobs), os.cpu_count() or 1))
+
+def render_env(manifest_file, section=None, raster_jobs=None):
+    """
+    Environment of a render process: repo root importable, where to write the
+    render manifest, optionally the only section to render, and the number of
+    frame rasterizers unless SET_THEORY_RASTER_JOBS already sets it.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(Path.cwd()), env.get("PYTHONPATH")]))
+    env[MANIFEST_ENV] = str(manifest_file.absolute())
+    env.pop(SECTIONS_ENV, None)
+    if section:
+        env[SECTIONS_ENV] = section
+    if raster_jobs:
+        env.setdefault(RASTER_JOBS_ENV, str(raster_jobs))
+    return env
+
+def job_names(number, class_name, media_dir, section=None):
+    """Return the output name of a chapter or section render and the manifest file it writes."""
+    name = output_name(number, class_name)
+    if section:
+        name = f"{name}_{section}"
+    return name, media_dir / f"{name}.json"
+
+def job_output(number, class_name, media_dir, section=None):
+    """
+    Return the output name of a chapter or section render and the manifest file
+    it will write, removing any manifest left by an earlier render.
+    """
+    name, manifest_file = job_names(number, class_name, media_dir, section)
+    manifest_file.unlink(missing_ok=True)
+    return name, manifest_file
+
+def render_command(number, module, class_name, quality, media_dir, section=None):
+    """
+    Build the manim command of one chapter or section render.
+    Returns the command and the manifest file the render will write.
+    """
+    name, manifest_file = job_output(number, class_name, media_dir, section)
+    cmd = [
+        "manim",
+        "render",
+        quality,
+        str(scene_file(module)),
+        class_name,
+        "-o", name,
+        "--media_dir", str(media_dir)
+    ]
+    return cmd, manifest_file
+
+def render_chapter(number, module, class_name, quality, media_dir, section=None, raster_jobs=None):
+    """
+    Render one chapter, or a single section of it, into its own media directory.
+    Returns a (video_path, error) pair where exactly one of them is None.
+    """
+    cmd, manifest_file = render_command(number, module, class_name, quality, media_dir, section)
+    
+    try:
+        subprocess.run(cmd, capture_output=True, text=True, check=True, env=render_env(manifest_file, section, raster_jobs))
+    except subprocess.CalledProcessError as e:
+        return None, f"{e}\nSTDOUT: {e.stdout}\nSTDERR: {e.stderr}"
+    
+    video_file = generated_video(manifest_file)
+    if video_file is None:
+        return None, f"Render did not report an existing output file in {manifest_file}"
+    return video_file, None
+
+def read_manifest(manifest_file):
+    """Return the contents of a render manifest, or None if it is missing or unreadable."""
+    try:
+        with open(manifest_file) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def generated_video(manifest_file):
+    """Return the output video recorded in a render manifest, or None if it is missing."""
+    movie_file = (read_manifest(manifest_file) or {}).get("movie_file")
+    if movie_file and Path(movie_file).exists():
+        return Path(movie_file)
+    return None
+
+def plan_chapter(index, module, class_name, quality, media_root, use_cache):
+    """
+    Work out what a chapter needs: nothing when its build is cached, otherwise one
+    job per stale section (or one job for the whole chapter if it has no sections).
+    Returns (chapter_key, cached_video, sections, jobs) where sections lists
+    (name, key, cached_video) in chapter order.
+    """
+    number = index + 1
+    key = chapter_key(module, quality)
+    cached = cached_chapter(class_name, key) if use_cache else None
+    if cached:
+        return key, cached, [], []
+    
+    media_dir = media_root / f"chapter_{number:02d}"
+    sections = []
+    jobs = []
+    for name, section_key, cost in chapter_sections(module, class_name, quality):
+        section_video = cached_section(class_name, name, section_key) if use_cache else None
+        sections.append((name, section_key, section_video))
+        if section_video is None:
+            jobs.append((cost, index, name, media_dir / name))
+    
+    if not sections:
+        jobs.append((estimated_cost(module), index, None, media_dir))
+    return key, None, sections, jobs
+
+def render_chapters(chapters, quality="-qh", jobs=None, media_root=MEDIA_ROOT, use_cache=True):
+    """
+    Render chapters concurrently, longest job first.
+    Chapters whose content hash matches a cached build are not rendered again, and
+    inside a changed chapter only the sections whose own hash changed are rendered;
+    the others are spliced in from the section cache.
+    Returns the rendered video paths in chapter order, or None if any chapter failed.
+    """
+    results = {}
+    keys = {}
+    plans = {}
+    render_jobs = []
+    for index, (module, class_name) in enumerate(chapters):
+        key, cached, sections, chapter_jobs = plan_chapter(index, module, class_name, quality, media_root, use_cache)
+        keys[index] = key
+        if cached:
+            print(f"Chapter {index + 1} unchanged, using cached render: {cached}")
+            results[index] = cached
+            continue
+        plans[index] = sections
+        render_jobs.extend(chapter_jobs)
+        if sections:
+            print(f"Chapter {index + 1}: {len(chapter_jobs)} of {len(sections)} sections to render")
+    
+    # Longest jobs first so the biggest chapters and sections do not finish last
+    render_jobs.sort(key=lambda job: job[0], reverse=True)
+    
+    rendered = {}
+    failed = False
+    if render_jobs:
+        # Imported here because the worker module builds on this one
+        from pipeline.worker import render_with_worker, worker_running
+        
+        workers = jobs or default_jobs(render_jobs)
+        
+        # Cores the render jobs leave idle rasterize the frames of each animation in parallel
+        raster_jobs = max(1, (os.cpu_count() or 1) // min(workers, len(render_jobs)))
+        
+        render = render_chapter
+        executor_class = ProcessPoolExecutor
+        if worker_running():
+            # The warm worker forks one process per job, so threads only wait for replies
+            render = render_with_worker
+            executor_class = ThreadPoolExecutor
+            print("Sending jobs to the running render worker")
+        print(f"Rendering {len(render_jobs)} jobs with {workers} workers...")
+        
+        with executor_class(max_workers=workers) as executor:
+            futures = {}
+            for cost, index, section, media_dir in render_jobs:
+                module, class_name = chapters[index]
+                label = f"Chapter {index + 1}" + (f" section {section}" if section else "")
+                print(f"Queued {label}: {class_name}")
+                future = executor.submit(render, index + 1, module, class_name, quality, media_dir, section, raster_jobs)
+                futures[future] = (index, section, label, media_dir)
+            
+            for future in as_completed(futures):
+                index, section, label, media_dir = futures[future]
+                video_file, error = future.result()
+                if error:
+                    print(f"Error rendering {label}: {error}")
+                    failed = True
+                    for pending in futures:
+                        pending.cancel()
+                    continue
+                print(f"{label} rendered successfully: {video_file}")
+                
+                # The manifest travels with the video into the cache, for the timeline
+                _, manifest_file = job_names(index + 1, chapters[index][1], media_dir, section)
+                rendered[(index, section)] = (video_file, read_manifest(manifest_file))
+    
+    if failed:
+        return None
+    
+    # Store fresh sections and splice every changed chapter back together
+    for index, sections in plans.items():
+        module, class_name = chapters[index]
+        number = index + 1
+        
+        if not sections:
+            results[index] = store_chapter(class_name, keys[index], *rendered[(index, None)])
+            continue
+        
+        videos = []
+        for name, section_key, section_video in sections:
+            if section_video is None:
+                section_video = store_section(class_name, name, section_key, *rendered[(index, name)])
+            videos.append(section_video)
+        
+        chapter_video = media_root / f"chapter_{number:02d}" / f"{output_name(number, class_name)}.mp4"
+        chapter_video.parent.mkdir(parents=True, exist_ok=True)
+        chapter_video, error = splice_sections(videos, chapter_video)
+        if error:
+            print(f"Error splicing Chapter {number}: {error}")
+            return None
+        
+        for label in renditions(quality):
+            _, error = splice_sections(
+                [rendition_file(video, label) for video in videos],
+                rendition_file(chapter_video, label)
+            )
+            if error:
+                print(f"Error splicing the {label} rendition of Chapter {number}: {error}")
+                return None
+        print(f"Chapter {number} spliced from {len(videos)} sections")
+        manifest = splice_manifests([
+            (section_key, video_manifest(video))
+            for (_, section_key, _), video in zip(sections, videos)
+        ])
+        results[index] = store_chapter(class_name, keys[index], chapter_video, manifest)
+    
+    # Gather in the original order for the concat step
+    return [results[index] for index in range(len(chapters))]
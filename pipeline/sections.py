@@ -0,0 +1,165 @@
+"""Section discovery, per-section cache keys and splicing of section videos."""
+
+import ast
+import subprocess
+
+from pipeline.cache import content_key
+from pipeline.chapters import scene_file
+
+def parse_chapter(module, class_name):
+    """Return the source of a chapter module and the class node of its scene."""
+    source = scene_file(module).read_text(encoding="utf-8")
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.ClassDef) and node.name == class_name:
+            return source, node
+    raise ValueError(f"{class_name} is not defined in {scene_file(module)}")
+
+def class_methods(class_node):
+    """Map method names to their function nodes."""
+    return {
+        node.name: node for node in class_node.body
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+    }
+
+def self_calls(node):
+    """Return the names of the methods called as self.<name>(...) inside a node."""
+    names = set()
+    for child in ast.walk(node):
+        if (isinstance(child, ast.Call)
+                and isinstance(child.func, ast.Attribute)
+                and isinstance(child.func.value, ast.Name)
+                and child.func.value.id == "self"):
+            names.add(child.func.attr)
+    return names
+
+def self_root(node):
+    """Name of the self attribute an expression such as self.a.b[0] starts from, or None."""
+    while isinstance(node, (ast.Attribute, ast.Subscript)):
+        if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id == "self":
+            return node.attr
+        node = node.value
+    return None
+
+def self_attributes(nodes):
+    """Return the self attributes the nodes assign (self.a = ..., self.a.b = ...) and those they read."""
+    written = set()
+    read = set()
+    for node in nodes:
+        for child in ast.walk(node):
+            if not isinstance(child, (ast.Attribute, ast.Subscript)):
+                continue
+            root = self_root(child)
+            if root is None:
+                continue
+            if isinstance(child.ctx, (ast.Store, ast.Del)):
+                written.add(root)
+            else:
+                read.add(root)
+    return written, read
+
+def section_names(class_node):
+    """Return the names given to self.next_section(...) in construct(), in call order."""
+    construct = class_methods(class_node).get("construct")
+    if construct is None:
+        return []
+    
+    calls = [
+        child for child in ast.walk(construct)
+        if isinstance(child, ast.Call)
+        and isinstance(child.func, ast.Attribute)
+        and child.func.attr == "next_section"
+        and child.args
+        and isinstance(child.args[0], ast.Constant)
+    ]
+    calls.sort(key=lambda call: (call.lineno, call.col_offset))
+    return [call.args[0].value for call in calls]
+
+def section_methods(name, methods, sections):
+    """
+    Return the method nodes a section depends on: the method named after the section
+    and every helper it calls, but not other sections.
+    """
+    found = {}
+    pending = [name]
+    while pending:
+        current = pending.pop()
+        if current in found or current not in methods:
+            continue
+        if current in sections and current != name:
+            continue
+        found[current] = methods[current]
+        pending.extend(self_calls(methods[current]))
+    return [found[key] for key in sorted(found)]
+
+def chapter_sections(module, class_name, quality):
+    """
+    List the sections of a chapter as (name, cache key, estimated cost) tuples.
+    A section key covers its own methods plus the chapter code outside any section
+    method, so editing one section re-renders only that section. A section that
+    reads a self attribute an earlier section assigns, or reads self.mobjects (what
+    the section before it left on screen), also covers the keys of those sections.
+    """
+    source, class_node = parse_chapter(module, class_name)
+    names = section_names(class_node)
+    methods = class_methods(class_node)
+    
+    # Everything that is not a section or one of its helpers is shared by all sections
+    owned = set()
+    for name in names:
+        owned.update(node.name for node in section_methods(name, methods, names))
+    owned.discard("construct")
+    
+    module_node = ast.parse(source)
+    shared = []
+    for node in module_node.body:
+        if isinstance(node, ast.ClassDef) and node.name == class_name:
+            shared.extend(
+                ast.get_source_segment(source, child) for child in node.body
+                if getattr(child, "name", None) not in owned
+            )
+        else:
+            shared.append(ast.get_source_segment(source, node))
+    shared_source = "\n".join(shared)
+    
+    sections = []
+    written = {}
+    for index, name in enumerate(names):
+        nodes = section_methods(name, methods, names)
+        writes, reads = self_attributes(nodes)
+        sources = [("shared", shared_source), ("section", name)]
+        sources.extend((f"method:{node.name}", ast.get_source_segment(source, node)) for node in nodes)
+        for earlier, earlier_key, _ in sections:
+            if written[earlier] & reads or ("mobjects" in reads and earlier == names[index - 1]):
+                sources.append((f"after:{earlier}", earlier_key))
+        cost = sum(node.end_lineno - node.lineno + 1 for node in nodes)
+        written[name] = writes
+        sections.append((name, content_key(sources, quality), cost))
+    return sections
+
+def splice_sections(videos, output):
+    """
+    Concatenate section videos into one chapter video without re-encoding.
+    Returns a (video_path, error) pair where exactly one of them is None.
+    """
+    list_file = output.with_suffix(".txt")
+    with open(list_file, "w") as f:
+        for video_file in videos:
+            f.write(f"file '{video_file.absolute()}'\n")
+    
+    ffmpeg_cmd = [
+        "ffmpeg",
+        "-f", "concat",
+        "-safe", "0",
+        "-i", str(list_file),
+        "-c", "copy",
+        "-y",
+        str(output)
+    ]
+    
+    try:
+        subprocess.run(ffmpeg_cmd, capture_output=True, text=True, check=True)
+    except subprocess.CalledProcessError as e:
+        return None, f"{e}\nSTDERR: {e.stderr}"
+    finally:
+        list_file.unlink(missing_ok=True)
+    return output, None
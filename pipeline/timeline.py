@@ -0,0 +1,115 @@
+"""
+Timeline manifest: where every chapter, section and voiceover lies in the final video.
+
+Each render manifest lists its sections and voiceovers in seconds of its own video. A
+spliced chapter's manifest shifts the section markers by the length of the sections in
+front of them, and the final timeline does the same with the chapters, so the
+timestamps come from frame counts already known to the build, never from probing video.
+"""
+
+import json
+import os
+
+from pipeline.cache import video_manifest
+
+def shift_marker(marker, offset):
+    """A section or voiceover marker moved later by offset seconds."""
+    shifted = {**marker, "start": marker["start"] + offset, "end": marker["end"] + offset}
+    if "voiceovers" in marker:
+        shifted["voiceovers"] = [shift_marker(voiceover, offset) for voiceover in marker["voiceovers"]]
+    return shifted
+
+def splice_manifests(parts):
+    """
+    Manifest of a chapter spliced from the (key, manifest) pairs of its sections: the
+    frame counts add up and every section marker, tagged with its section's cache key,
+    moves to where its section starts in the chapter.
+    """
+    frame_rate = parts[0][1]["frame_rate"]
+    frames = 0
+    timeline = []
+    for key, manifest in parts:
+        offset = frames / frame_rate
+        timeline.extend(shift_marker({**marker, "key": key}, offset) for marker in manifest["timeline"])
+        frames += manifest["frames"]
+    
+    return {
+        "scene": parts[0][1]["scene"],
+        "sections": [marker["section"] for marker in timeline],
+        "duration": frames / frame_rate,
+        "frame_rate": frame_rate,
+        "frames": frames,
+        "timeline": timeline,
+    }
+
+def frame_span(marker, offset, frame_rate):
+    """Absolute start and end of a marker, in seconds and as a half-open frame range."""
+    start_frame = round((marker["start"] + offset) * frame_rate)
+    end_frame = round((marker["end"] + offset) * frame_rate)
+    return {
+        "start": start_frame / frame_rate,
+        "end": end_frame / frame_rate,
+        "start_frame": start_frame,
+        "end_frame": end_frame,
+    }
+
+def video_timeline(chapters, videos, video_file):
+    """
+    Timeline of the final video from the cached manifests of its chapter videos:
+    chapters, their sections and voiceover lines with times, frame ranges and the cache
+    keys they were built from (the TTS cache key for voiceovers).
+    """
+    manifests = [video_manifest(chapter_video) for chapter_video in videos]
+    frame_rate = manifests[0]["frame_rate"]
+    
+    entries = []
+    start_frame = 0
+    for number, ((module, class_name), manifest) in enumerate(zip(chapters, manifests), 1):
+        offset = start_frame / frame_rate
+        sections = []
+        for marker in manifest["timeline"]:
+            voiceovers = [
+                {
+                    "text": voiceover["text"],
+                    "audio_key": voiceover["audio_key"],
+                    "audio": voiceover["audio"],
+                    **frame_span(voiceover, offset, frame_rate),
+                }
+                for voiceover in marker["voiceovers"]
+            ]
+            sections.append({
+                "section": marker["section"],
+                "key": marker.get("key"),
+                **frame_span(marker, offset, frame_rate),
+                "voiceovers": voiceovers,
+            })
+        
+        entries.append({
+            "chapter": number,
+            "class_name": class_name,
+            "module": module,
+            "key": manifest["key"],
+            **frame_span({"start": 0, "end": manifest["frames"] / frame_rate}, offset, frame_rate),
+            "sections": sections,
+        })
+        start_frame += manifest["frames"]
+    
+    return {
+        "video": str(video_file),
+        "frame_rate": frame_rate,
+        "duration": start_frame / frame_rate,
+        "frames": start_frame,
+        "chapters": entries,
+    }
+
+def write_timeline(chapters, videos, video_file):
+    """
+    Write the timeline of the final video next to it as <stem>.timeline.json.
+    Returns the path of the timeline file.
+    """
+    timeline_file = video_file.with_name(f"{video_file.stem}.timeline.json")
+    partial = timeline_file.with_name(f"{timeline_file.name}.tmp")
+    with open(partial, "w") as f:
+        json.dump(video_timeline(chapters, videos, video_file), f, indent=2)
+    os.replace(partial, timeline_file)
+    return timeline_file
@@ -0,0 +1,74 @@
+"""Timing dry run: chapter timelines computed without rendering a single frame."""
+
+import importlib
+import json
+from pathlib import Path
+
+TIMING_MEDIA_DIR = Path("media/timing")
+
+# manim configuration names of the quality flags
+QUALITY_NAMES = {
+    "-ql": "low_quality",
+    "-qm": "medium_quality",
+    "-qh": "high_quality",
+    "-qp": "production_quality",
+    "-qk": "fourk_quality",
+}
+
+def chapter_timeline(module, class_name, quality="-qh"):
+    """
+    Run a chapter's construct() in dry-run mode.
+    Returns its voiceover timeline and its total duration in seconds.
+    """
+    from manim import tempconfig
+    
+    scene_class = getattr(importlib.import_module(module.replace("/", ".")), class_name)
+    options = {
+        "dry_run": True,
+        "disable_caching": True,
+        "quality": QUALITY_NAMES[quality],
+        "media_dir": str(TIMING_MEDIA_DIR),
+        "verbosity": "WARNING",
+    }
+    with tempconfig(options):
+        scene = scene_class()
+        scene.render()
+    return scene.voiceover_timeline, scene.renderer.time
+
+def print_timeline(number, class_name, timeline, duration):
+    """Print one line per voiceover, flagging the blocks whose animations outrun the audio."""
+    print(f"Chapter {number}: {class_name} ({duration:.1f}s)")
+    print(f"  {'start':>8} {'audio':>6} {'anim':>6} {'slack':>6}  text")
+    for entry in timeline:
+        flag = "!!" if entry["slack"] < 0 else "  "
+        print(
+            f"{flag}{entry['start']:8.2f} {entry['audio']:6.2f} {entry['animation']:6.2f} "
+            f"{entry['slack']:6.2f}  {entry['text'][:60]}"
+        )
+
+def timing_dry_run(chapters, quality="-qh", report_file=TIMING_MEDIA_DIR / "timeline.json"):
+    """
+    Compute the timeline of every chapter without rendering and write it as JSON.
+    Returns the number of voiceover blocks whose animations are longer than their audio.
+    """
+    report = []
+    overruns = 0
+    for number, (module, class_name) in enumerate(chapters, 1):
+        timeline, duration = chapter_timeline(module, class_name, quality)
+        print_timeline(number, class_name, timeline, duration)
+        overruns += sum(1 for entry in timeline if entry["slack"] < 0)
+        report.append({
+            "chapter": number,
+            "class_name": class_name,
+            "duration": duration,
+            "voiceovers": timeline,
+        })
+    
+    report_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(report_file, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Timeline written to {report_file}")
+    
+    if overruns:
+        print(f"{overruns} voiceover blocks have animations longer than their audio")
+    return overruns
@@ -0,0 +1,60 @@
+"""Batch synthesis of every voiceover line before rendering starts."""
+
+import ast
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+def voiceover_texts(path):
+    """Return the literal text of every self.voiceover(text=...) call in a scene file."""
+    tree = ast.parse(Path(path).read_text(encoding="utf-8"))
+    texts = []
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.Call)
+                and isinstance(node.func, ast.Attribute)
+                and node.func.attr == "voiceover"):
+            continue
+        
+        text = next((keyword.value for keyword in node.keywords if keyword.arg == "text"), None)
+        if text is None and node.args:
+            text = node.args[0]
+        if isinstance(text, ast.Constant) and isinstance(text.value, str):
+            texts.append((node.lineno, text.value))
+    
+    return [text for _, text in sorted(texts)]
+
+def collect_voiceovers(scene_files):
+    """Return the unique voiceover texts of several scene files, in first-use order."""
+    texts = {}
+    for path in scene_files:
+        for text in voiceover_texts(path):
+            texts.setdefault(text, path)
+    return list(texts)
+
+def presynthesize(scene_files, jobs=8, backend_name=None):
+    """
+    Warm the TTS cache with every voiceover line of the given scenes, in parallel.
+    Returns True when every line has cached audio afterwards.
+    """
+    # Imported here so the pipeline only needs manim_voiceover when it synthesizes
+    from scenes.speech import build_backend, synthesize_line
+    
+    backend = build_backend(backend_name)
+    texts = collect_voiceovers(scene_files)
+    print(f"Synthesizing {len(texts)} voiceover lines with {backend.name} ({jobs} threads)...")
+    
+    failures = 0
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {executor.submit(synthesize_line, text, backend): text for text in texts}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                failures += 1
+                print(f"Could not synthesize {futures[future][:60]!r}: {e}")
+    
+    if failures:
+        print(f"{failures} of {len(texts)} voiceover lines failed")
+        return False
+    
+    print(f"All {len(texts)} voiceover lines are cached")
+    return True
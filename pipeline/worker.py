@@ -0,0 +1,317 @@
+"""
+Warm render worker: a local daemon that imports manim once and forks a process
+per render job, so a job starts without paying manim's import and setup cost.
+
+Start it from the repository root with `python -m pipeline.worker`; while it is
+running, render_chapters sends its jobs to it instead of starting `manim` processes.
+"""
+
+import argparse
+import importlib
+import os
+import queue
+import socket
+import struct
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from multiprocessing.connection import AuthenticationError, Client, Listener, answer_challenge, deliver_challenge
+from pathlib import Path
+
+from pipeline.cache import CACHE_ROOT
+from pipeline.chapters import scene_file
+from pipeline.scheduler import generated_video, job_output, render_chapter, render_env
+from pipeline.timing import QUALITY_NAMES
+
+WORKER_ADDRESS = ("127.0.0.1", 47130)
+
+# Shared secret between the daemon and its clients, readable by the local user only
+WORKER_KEY_FILE = CACHE_ROOT / "worker.key"
+
+# Seconds a client waits to connect and for the worker to acknowledge a message;
+# a worker that does not answer in time is treated as not running. The daemon
+# gives a connecting client as long to authenticate and send its request.
+WORKER_TIMEOUT = 5
+
+# Seconds between checks for finished jobs while no request comes in
+WORKER_POLL = 0.5
+
+def worker_key(create=False):
+    """Return the worker's authentication key, creating a new one for a new daemon."""
+    if create:
+        WORKER_KEY_FILE.parent.mkdir(parents=True, exist_ok=True)
+        key = os.urandom(32)
+        fd = os.open(WORKER_KEY_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(key)
+        return key
+    try:
+        return WORKER_KEY_FILE.read_bytes()
+    except OSError:
+        return None
+
+def worker_connection(address=WORKER_ADDRESS, timeout=WORKER_TIMEOUT):
+    """
+    Connect and authenticate to the worker, or return None if it does not answer.
+    Client has no timeout of its own, so it runs in a thread that is abandoned if
+    the handshake stalls.
+    """
+    key = worker_key()
+    if key is None:
+        return None
+    
+    connections = []
+    def connect():
+        try:
+            connections.append(Client(address, authkey=key))
+        except (OSError, EOFError, AuthenticationError):
+            pass
+    
+    thread = threading.Thread(target=connect, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive() or not connections:
+        return None
+    return connections[0]
+
+def worker_request(message, address=WORKER_ADDRESS, timeout=WORKER_TIMEOUT):
+    """
+    Send one message to the worker and return its reply, or None if no worker answers.
+    The worker acknowledges a job at once, even when every slot is busy; the reply
+    then comes when the job has rendered, however long it waits for a slot.
+    """
+    conn = worker_connection(address, timeout)
+    if conn is None:
+        return None
+    with conn:
+        try:
+            conn.send(message)
+            if not conn.poll(timeout):
+                return None
+            reply = conn.recv()
+            if reply.get("queued"):
+                reply = conn.recv()
+            return reply
+        except (OSError, EOFError):
+            return None
+
+def worker_running(address=WORKER_ADDRESS):
+    """Check whether a render worker is listening."""
+    return worker_request({"ping": True}, address) is not None
+
+def render_with_worker(number, module, class_name, quality, media_dir, section=None, raster_jobs=None):
+    """
+    Render one chapter or section in the warm worker.
+    Same contract as scheduler.render_chapter, which is used if the worker went away.
+    """
+    name, manifest_file = job_output(number, class_name, media_dir, section)
+    job = {
+        "cwd": str(Path.cwd()),
+        "env": render_env(manifest_file, section, raster_jobs),
+        "module": module,
+        "class_name": class_name,
+        "quality": quality,
+        "media_dir": str(media_dir),
+        "output": name,
+        "log_file": str(media_dir / f"{name}.log"),
+    }
+    reply = worker_request(job)
+    if reply is None:
+        return render_chapter(number, module, class_name, quality, media_dir, section, raster_jobs)
+    if reply["error"]:
+        return None, f"{reply['error']}\nLOG: {job['log_file']}"
+    
+    video_file = generated_video(manifest_file)
+    if video_file is None:
+        return None, f"Render did not report an existing output file in {manifest_file}"
+    return video_file, None
+
+def preload():
+    """Import manim, manim-voiceover and the scene helpers, and warm their caches."""
+    import manimpango
+    from manim import config
+    
+    import scenes.base
+    import scenes.speech
+    
+    # Font discovery and the default LaTeX template are computed once and kept
+    manimpango.list_fonts()
+    config.tex_template
+
+def run_job(job):
+    """
+    Render one job inside a forked worker process.
+    The chapter module and the scene helpers are imported again from source, so
+    edits made since the daemon started are picked up; manim itself stays loaded.
+    """
+    from manim import tempconfig
+    
+    os.chdir(job["cwd"])
+    os.environ.clear()
+    os.environ.update(job["env"])
+    sys.path.insert(0, job["cwd"])
+    
+    media_dir = Path(job["media_dir"])
+    media_dir.mkdir(parents=True, exist_ok=True)
+    log = os.open(job["log_file"], os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    os.dup2(log, 1)
+    os.dup2(log, 2)
+    
+    for name in [name for name in sys.modules if name.startswith("scenes.")]:
+        del sys.modules[name]
+    scene_class = getattr(importlib.import_module(job["module"].replace("/", ".")), job["class_name"])
+    
+    options = {
+        "quality": QUALITY_NAMES[job["quality"]],
+        "media_dir": job["media_dir"],
+        "input_file": str(scene_file(job["module"])),
+        "output_file": job["output"],
+    }
+    with tempconfig(options):
+        scene_class().render()
+
+def set_socket_timeout(conn, seconds):
+    """Make blocking reads and writes on a connection fail after seconds; 0 waits forever."""
+    value = struct.pack("ll", int(seconds), int(seconds % 1 * 1e6))
+    with socket.socket(fileno=os.dup(conn.fileno())) as sock:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVTIMEO, value)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDTIMEO, value)
+
+def receive_request(conn, key, requests, timeout=WORKER_TIMEOUT):
+    """
+    Authenticate a new connection and queue it with its request for the daemon.
+    Runs on a thread of its own and every read gives up after timeout, so a client
+    that stalls the handshake holds up nothing but this thread.
+    """
+    try:
+        set_socket_timeout(conn, timeout)
+        deliver_challenge(conn, key)
+        answer_challenge(conn, key)
+        if not conn.poll(timeout):
+            raise EOFError("no request received")
+        request = conn.recv()
+        set_socket_timeout(conn, 0)
+    except (OSError, EOFError, AuthenticationError) as e:
+        print(f"Rejected connection: {e}")
+        conn.close()
+        return
+    requests.put((conn, request))
+
+def accept_requests(listener, key, requests, stopping):
+    """Accept connections until stopping is set, each one read on its own thread."""
+    while not stopping.is_set():
+        try:
+            conn = listener.accept()
+        except OSError as e:
+            if not stopping.is_set():
+                print(f"Accept failed: {e}")
+                time.sleep(WORKER_POLL)
+            continue
+        threading.Thread(target=receive_request, args=(conn, key, requests), daemon=True).start()
+
+def reap(running):
+    """
+    Collect finished job processes without waiting, freeing their slots in running
+    (pid to job name) whether they exited or were killed.
+    """
+    while running:
+        pid, status = os.waitpid(-1, os.WNOHANG)
+        if pid == 0:
+            return
+        name = running.pop(pid, None)
+        if name is not None and os.WIFSIGNALED(status):
+            print(f"{name} was killed by signal {os.WTERMSIG(status)}")
+
+def serve_job(job, conn):
+    """Body of a forked job process: render, then send the reply."""
+    try:
+        print(f"Rendering {job['output']}")
+        sys.stdout.flush()
+        run_job(job)
+        reply = {"error": None}
+    except BaseException:
+        reply = {"error": traceback.format_exc()}
+    sys.stdout.flush()
+    sys.stderr.flush()
+    conn.send(reply)
+
+def answer_request(conn, job, running, waiting):
+    """Answer a ping, or acknowledge a job and add it to the jobs waiting for a slot."""
+    try:
+        conn.send({"ok": True, "jobs": len(running) + len(waiting)} if job.get("ping") else {"queued": True})
+    except OSError as e:
+        print(f"Client went away: {e}")
+        conn.close()
+        return
+    if job.get("ping"):
+        conn.close()
+        return
+    waiting.append((conn, job))
+    print(f"Queued {job['output']} ({len(running)} running, {len(waiting)} waiting)")
+
+def start_job(job, conn, listener, waiting):
+    """Fork the process of a job and return its pid; the child renders and never returns."""
+    pid = os.fork()
+    if pid == 0:
+        # The child keeps only its own client's connection
+        listener.close()
+        for other, _ in waiting:
+            other.close()
+        serve_job(job, conn)
+        os._exit(0)
+    conn.close()
+    return pid
+
+def serve(workers=None, address=WORKER_ADDRESS):
+    """
+    Run the worker until interrupted: accept jobs on a local socket and fork a
+    process per job, with at most `workers` jobs rendering at the same time.
+    Connections are authenticated and read on their own threads, and jobs beyond
+    the limit wait in the daemon, so pings and new jobs are always answered
+    straight away.
+    """
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    preload()
+    print(f"manim preloaded in {time.perf_counter() - start:.1f}s")
+    
+    running = {}
+    waiting = deque()
+    requests = queue.Queue()
+    stopping = threading.Event()
+    key = worker_key(create=True)
+    with Listener(address) as listener:
+        print(f"Render worker listening on {address[0]}:{address[1]} with {workers} workers")
+        threading.Thread(target=accept_requests, args=(listener, key, requests, stopping), daemon=True).start()
+        try:
+            while True:
+                try:
+                    conn, job = requests.get(timeout=WORKER_POLL)
+                except queue.Empty:
+                    conn = None
+                reap(running)
+                
+                if conn is not None:
+                    answer_request(conn, job, running, waiting)
+                
+                while waiting and len(running) < workers:
+                    conn, job = waiting.popleft()
+                    running[start_job(job, conn, listener, waiting)] = job["output"]
+                sys.stdout.flush()
+        except KeyboardInterrupt:
+            print("Render worker stopped")
+        finally:
+            stopping.set()
+    WORKER_KEY_FILE.unlink(missing_ok=True)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Keep manim loaded and render chapter jobs on demand.")
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=None,
+        help="number of jobs rendered at the same time (default: one per core)"
+    )
+    serve(workers=parser.parse_args().jobs)
@@ -1,11 +1,22 @@
-from scenes.ch01_basics import BasicsWithVoiceover
-from scenes.ch02_subsets import SubsetsWithVoiceover
-from scenes.ch03_empty_set import EmptySetWithVoiceover
-from scenes.ch04_union_and_intersection import UnionAndIntersectionWithVoiceover
-from scenes.ch05_complement import TheComplementWithVoiceover
-from scenes.ch06_de_morgan_laws import DeMorganLawsWithVoiceover
-from scenes.ch07_sets_of_sets_and_power_sets import SetsOfSetsPowerSetsIndexedFamiliesWithVoiceover
-from scenes.ch08_russells_paradox import RussellsParadoxWithVoiceover
+import importlib
+
+# Chapters are imported on first access: they import helpers such as scenes.base
+# themselves, and manim loads them straight from their files
+_CHAPTER_MODULES = {
+    "BasicsWithVoiceover": "scenes.ch01_basics",
+    "SubsetsWithVoiceover": "scenes.ch02_subsets",
+    "EmptySetWithVoiceover": "scenes.ch03_empty_set",
+    "UnionAndIntersectionWithVoiceover": "scenes.ch04_union_and_intersection",
+    "TheComplementWithVoiceover": "scenes.ch05_complement",
+    "DeMorganLawsWithVoiceover": "scenes.ch06_de_morgan_laws",
+    "SetsOfSetsPowerSetsIndexedFamiliesWithVoiceover": "scenes.ch07_sets_of_sets_and_power_sets",
+    "RussellsParadoxWithVoiceover": "scenes.ch08_russells_paradox",
+}
+
+def __getattr__(name):
+    if name in _CHAPTER_MODULES:
+        return getattr(importlib.import_module(_CHAPTER_MODULES[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     "BasicsWithVoiceover",
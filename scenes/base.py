@@ -0,0 +1,264 @@
+"""Shared base class for the chapter scenes."""
+
+import inspect
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+
+from manim import *
+from manim_voiceover import VoiceoverScene
+from pydub import AudioSegment
+
+from scenes.rendering import (
+    can_rasterize_in_parallel,
+    chapter_renderer,
+    play_frames_in_parallel,
+    raster_jobs,
+    rendition_file,
+    rendition_heights,
+)
+from scenes.speech import line_key
+from scenes.tex_batch import precompile_tex
+from scenes.tex_cache import TEX_CACHE_STATS, install_tex_cache
+
+# Comma separated section names to render, every other section is fast-forwarded
+SECTIONS_ENV = "SET_THEORY_SECTIONS"
+
+# Where the render writes its manifest (output path, duration, frames) when set
+MANIFEST_ENV = "SET_THEORY_MANIFEST"
+
+def selected_sections():
+    """Return the section names requested through SET_THEORY_SECTIONS, or None for all."""
+    value = os.environ.get(SECTIONS_ENV, "")
+    names = {name.strip() for name in value.split(",") if name.strip()}
+    return names or None
+
+class ChapterScene(VoiceoverScene):
+    """
+    Voiceover scene made of named sections.
+    
+    Chapters call ``self.next_section("show_...")`` before each section method. When
+    SET_THEORY_SECTIONS lists some sections, only those are rendered: the others still
+    run so the scene is in the right state, but they produce no frames and no sound,
+    and the sound of the rendered sections is shifted to match.
+    
+    Every voiceover block is recorded in ``voiceover_timeline`` with its start time,
+    audio length, animation time and slack. The run time of the play() and wait()
+    calls made inside a block is accounted automatically, and leaving the block waits
+    only for the rest of the narration, so scenes never compute waits by hand. In a dry run (``config.dry_run``) no
+    frame is rendered at all, so the timeline of a whole chapter takes seconds.
+    
+    ``section_timeline`` marks where each rendered section and its voiceovers start and
+    end in the output video, skipped sections taking no time; it goes into the render
+    manifest.
+    """
+    
+    def __init__(self, renderer=None, camera_class=Camera, skip_animations=False, **kwargs):
+        # Held frames of frozen waits are converted once instead of once per repeat
+        if renderer is None and config.renderer == RendererType.CAIRO:
+            renderer = chapter_renderer(camera_class, skip_animations)
+        super().__init__(renderer=renderer, camera_class=camera_class, skip_animations=skip_animations, **kwargs)
+    
+    def setup(self):
+        super().setup()
+        self.rendered_sections = selected_sections()
+        self.skipped_time = 0.0
+        self.skipping_since = None
+        self.current_section = None
+        self.voiceover_timeline = []
+        self.current_voiceover = None
+        self.section_timeline = []
+        self.current_section_marker = None
+        
+        # Typeset the chapter's formulas in one LaTeX run before construct() needs them,
+        # reusing the ones any render has compiled before
+        install_tex_cache()
+        if not config.dry_run:
+            precompile_tex(inspect.getsourcefile(type(self)))
+        
+        # Dry runs only need the timings, so skip frame rendering entirely
+        if config.dry_run:
+            self.renderer._original_skipping_status = True
+            self.renderer.skip_animations = True
+        
+        # Setup code before the first section runs in every render, but plays nothing
+        if self.rendered_sections is not None:
+            self.next_section("preamble", skip_animations=True)
+    
+    def next_section(self, name="unnamed", section_type=DefaultSectionType.NORMAL, skip_animations=False):
+        """
+        Start a section, skipping it when it was not selected for rendering.
+        Playing anything before the first section is an error: a spliced chapter is made
+        of its sections only, so it would be missing from the video.
+        """
+        if self.current_section in (None, "preamble") and self.renderer.time > 0:
+            raise ValueError(
+                f"{type(self).__name__} plays {self.renderer.time:.2f}s before its first "
+                f"section; move it into a self.next_section(...) block"
+            )
+        if self.rendered_sections is not None and name not in self.rendered_sections:
+            skip_animations = True
+        
+        self.close_skipped_span()
+        self.close_section_marker()
+        if skip_animations:
+            self.skipping_since = self.renderer.time
+        else:
+            self.current_section_marker = {"section": name, "start": self.video_time(), "voiceovers": []}
+            self.section_timeline.append(self.current_section_marker)
+        self.current_section = name
+        
+        super().next_section(name, section_type, skip_animations)
+    
+    def close_skipped_span(self):
+        """Add the time spent in the current skipped section to the skipped total."""
+        if self.skipping_since is not None:
+            self.skipped_time += self.renderer.time - self.skipping_since
+            self.skipping_since = None
+    
+    def video_time(self):
+        """Current time in the output video, which leaves out the skipped sections."""
+        return self.renderer.time - self.skipped_time
+    
+    def close_section_marker(self):
+        """End the marker of the section being rendered, if any, at the current video time."""
+        if self.current_section_marker is not None:
+            self.current_section_marker["end"] = self.video_time()
+            self.current_section_marker = None
+    
+    @contextmanager
+    def voiceover(self, text=None, ssml=None, **kwargs):
+        """Voiceover block that records its timings in voiceover_timeline."""
+        entry = {
+            "section": self.current_section,
+            "text": text if text is not None else ssml,
+            "start": self.renderer.time,
+            "audio": 0.0,
+            "animation": 0.0,
+            "wait": 0.0,
+        }
+        self.voiceover_timeline.append(entry)
+        self.current_voiceover = entry
+        
+        # Voiceovers of skipped sections are not in the video
+        marker = None
+        if self.current_section_marker is not None:
+            backend = getattr(getattr(self, "speech_service", None), "backend", None)
+            marker = {
+                "text": entry["text"],
+                "audio_key": line_key(text, backend) if text is not None and backend else None,
+                "start": self.video_time(),
+            }
+            self.current_section_marker["voiceovers"].append(marker)
+        try:
+            with super().voiceover(text=text, ssml=ssml, **kwargs) as tracker:
+                entry["audio"] = tracker.duration
+                yield tracker
+        finally:
+            self.current_voiceover = None
+            entry["end"] = self.renderer.time
+            entry["slack"] = entry["audio"] - entry["animation"]
+            if marker is not None:
+                marker["end"] = self.video_time()
+                marker["audio"] = entry["audio"]
+    
+    def wait_for_voiceover(self):
+        """
+        Wait until the narration of the current voiceover block has finished.
+        Waits shorter than one frame are skipped.
+        """
+        entry = self.current_voiceover
+        if entry is None:
+            super().wait_for_voiceover()
+            return
+        self.safe_wait(entry["audio"] - entry["animation"] - entry["wait"])
+    
+    def play(self, *args, **kwargs):
+        start = self.renderer.time
+        super().play(*args, **kwargs)
+        
+        # Split the time spent inside a voiceover block into animations and waits
+        if self.current_voiceover is not None:
+            kind = "wait" if all(isinstance(arg, Wait) for arg in args) else "animation"
+            self.current_voiceover[kind] += self.renderer.time - start
+    
+    def play_internal(self, skip_rendering=False):
+        """
+        Run the current play(), rasterizing its frames in several processes when
+        SET_THEORY_RASTER_JOBS asks for it and the frames do not depend on each other.
+        """
+        jobs = raster_jobs()
+        if (jobs == 1 or skip_rendering or self.renderer.skip_animations or self.skip_animation_preview
+                or not can_rasterize_in_parallel(self, jobs)):
+            super().play_internal(skip_rendering)
+            return
+        
+        self.duration = self.get_run_time(self.animations)
+        self.time_progression = self._get_animation_time_progression(self.animations, self.duration)
+        play_frames_in_parallel(self, self.time_progression, jobs)
+        
+        for animation in self.animations:
+            animation.finish()
+            animation.clean_up_from_scene(self)
+        self.update_mobjects(0)
+        self.renderer.static_image = None
+        self.time_progression.close()
+    
+    def add_sound(self, sound_file, time_offset=0, gain=None, **kwargs):
+        # manim_voiceover resets the skipping status before adding its audio,
+        # so skipped sections have to drop their sounds here
+        if self.skipping_since is not None:
+            return
+        super().add_sound(sound_file, time_offset - self.skipped_time, gain, **kwargs)
+    
+    def render(self, preview=False):
+        super().render(preview)
+        
+        manifest_file = os.environ.get(MANIFEST_ENV)
+        if manifest_file:
+            self.write_manifest(Path(manifest_file))
+    
+    def render_manifest(self):
+        """
+        Describe the finished render: its exact output files, duration, frame count and
+        where each section and voiceover lies in the video.
+        """
+        movie_file = getattr(self.renderer.file_writer, "movie_file_path", None)
+        duration = self.renderer.time - self.skipped_time
+        return {
+            "scene": type(self).__name__,
+            "movie_file": str(Path(movie_file).absolute()) if movie_file else None,
+            "sections": sorted(self.rendered_sections) if self.rendered_sections is not None else None,
+            "duration": duration,
+            "frame_rate": config.frame_rate,
+            "frames": round(duration * config.frame_rate),
+            "animations": self.renderer.num_plays,
+            "held_frames": getattr(self.renderer.file_writer, "held_frames", 0),
+            "tex_cache": dict(TEX_CACHE_STATS),
+            "renditions": {
+                f"{height}p": str(rendition_file(movie_file, height).absolute())
+                for height in (rendition_heights() if movie_file else [])
+            },
+            "timeline": self.section_timeline,
+        }
+    
+    def write_manifest(self, path):
+        """Write the render manifest atomically, so readers never see half a file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_name(path.name + ".tmp")
+        with open(partial, "w") as f:
+            json.dump(self.render_manifest(), f, indent=2)
+        os.replace(partial, path)
+    
+    def tear_down(self):
+        self.close_skipped_span()
+        self.close_section_marker()
+        
+        # Pad the soundtrack to the video length so every render, even a section
+        # without narration, has an audio stream that concatenates cleanly
+        self.renderer.file_writer.add_audio_segment(
+            AudioSegment.silent(0),
+            time=self.renderer.time - self.skipped_time
+        )
+        super().tear_down()
@@ -1,59 +1,73 @@
 from manim import *
-from manim_voiceover import VoiceoverScene
-from manim_voiceover.services.gtts import GTTSService
 
-class BasicsWithVoiceover(VoiceoverScene):
+from scenes.base import ChapterScene
+from scenes.speech import build_speech_service
+from scenes.svg_cache import CachedSVGMobject
+from scenes.text_cache import CachedMarkupText, CachedText
+
+class BasicsWithVoiceover(ChapterScene):
     def construct(self):
         # Set up TTS service
-        self.set_speech_service(GTTSService(lang="en", tld="com"), create_subcaption=False)
+        self.set_speech_service(build_speech_service(), create_subcaption=False)
         
         # Scene 1: Set Theory Introduction
+        self.next_section("set_theory_intro")
         self.set_theory_intro()
         self.clear()
         
         # Scene 2: Set Definition
+        self.next_section("set_definition")
         self.set_definition()
         self.clear()
         
         # Scene 3: Set of Triangles
+        self.next_section("set_of_triangles")
         self.set_of_triangles()
         self.clear()
         
         # Scene 4: Set Notation
+        self.next_section("set_notation")
         self.set_notation()
         self.clear()
         
         # Scene 5: Element Of Symbol
+        self.next_section("element_of_symbol")
         self.element_of_symbol()
         self.clear()
         
         # Scene 6: Set Builder Notation
+        self.next_section("set_builder_notation")
         self.set_builder_notation()
         self.clear()
         
         # Scene 7: Number Sets Declaration
+        self.next_section("number_sets_declaration")
         self.number_sets_declaration()
         self.clear()
         
         # Scene 8: Set Equality
+        self.next_section("set_equality")
         self.set_equality()
         self.clear()
         
         # Scene 9: Order Doesn't Matter
+        self.next_section("order_doesnt_matter")
         self.order_doesnt_matter()
         self.clear()
         
         # Scene 10: Repeated Elements Don't Matter
+        self.next_section("repeated_elements_dont_matter")
         self.repeated_elements_dont_matter()
         self.clear()
         
         # Scene 11: Set Cardinality
+        self.next_section("set_cardinality")
         self.set_cardinality()
 
     def set_theory_intro(self):
         self.camera.background_color = "#F0F0F0"
         
-        main_title = Text(
+        main_title = CachedText(
             "Set Theory",
             font_size=50,
             color=BLACK,
@@ -89,7 +103,7 @@ class BasicsWithVoiceover(VoiceoverScene):
         youtube_logo = VGroup(youtube_bg, play_triangle)
         
         full_name = "Stephane KPOVIESSI"
-        author_name = Text(
+        author_name = CachedText(
             full_name,
             font_size=20,
             color=BLACK,
@@ -116,7 +130,7 @@ class BasicsWithVoiceover(VoiceoverScene):
         
         for i in range(len(full_name)):
             if i < len(full_name) - 1:
-                new_text = Text(
+                new_text = CachedText(
                     full_name[i+1:],
                     font_size=20,
                     color=BLACK,
@@ -146,7 +160,7 @@ class BasicsWithVoiceover(VoiceoverScene):
     def set_definition(self):
         self.camera.background_color = "#F0F0F0"
         
-        definition = Text(
+        definition = CachedText(
             "A set is a collection of objects (elements).",
             font_size=36,
             color="#505050",
@@ -168,11 +182,11 @@ class BasicsWithVoiceover(VoiceoverScene):
         group = VGroup(definition, circle)
         group.shift(UP * 1.0)
 
-        car = SVGMobject("images/car-svgrepo-com.svg")
+        car = CachedSVGMobject("images/car-svgrepo-com.svg")
         car.scale(0.3)
         car.move_to(circle.get_center() + LEFT * 1.5)
         
-        atom = SVGMobject("images/atom-symbol-svgrepo-com.svg")
+        atom = CachedSVGMobject("images/atom-symbol-svgrepo-com.svg")
         atom.set_color(BLACK)
         atom.set_fill(BLACK, 1)
         atom.scale(0.4)
@@ -187,10 +201,6 @@ class BasicsWithVoiceover(VoiceoverScene):
             self.play(Write(definition), run_time=2.0)
             # Circle at natural speed
             self.play(Create(circle), run_time=1.2)
-            # Wait for remaining audio only if there's significant time left
-            remaining_time = tracker.duration - 3.2
-            if remaining_time > 0.1:
-                self.wait(remaining_time)
         
         with self.voiceover(text="That could mean physical objects") as tracker:
             # Car appears exactly when "physical objects" is mentioned
@@ -218,7 +228,7 @@ class BasicsWithVoiceover(VoiceoverScene):
         )
         circle.shift(RIGHT * 1)
         
-        set_text = Text(
+        set_text = CachedText(
             "The set of all\ntriangles",
             font_size=36,
             color=BLACK,
@@ -252,7 +262,7 @@ class BasicsWithVoiceover(VoiceoverScene):
         pentagon.scale(0.7) 
         pentagon.move_to(RIGHT * 5 + UP * 1.2)
         
-        sides_text = Text(
+        sides_text = CachedText(
             "3 sides",
             font_size=30,
             color="#666666",
@@ -262,12 +272,12 @@ class BasicsWithVoiceover(VoiceoverScene):
         )
         sides_text.move_to(LEFT * 4.5 + DOWN * 2.5)
         
-        check = SVGMobject("images/check.svg")
+        check = CachedSVGMobject("images/check.svg")
         check.set_color("#008000")
         check.scale(0.3)
         check.next_to(sides_text, RIGHT, buff=0.2)
         
-        angles_text = Text(
+        angles_text = CachedText(
             "sum of internal\nangles is 360°",
             font_size=30,
             color="#666666",
@@ -277,7 +287,7 @@ class BasicsWithVoiceover(VoiceoverScene):
         )
         angles_text.move_to(RIGHT * 4 + DOWN * 2.5)
         
-        x_mark = SVGMobject("images/cross.svg")
+        x_mark = CachedSVGMobject("images/cross.svg")
         x_mark.set_color("#FF0000")
         x_mark.scale(0.3)
         x_mark.next_to(angles_text, RIGHT, buff=0.2)
@@ -287,10 +297,6 @@ class BasicsWithVoiceover(VoiceoverScene):
             self.play(Create(circle), run_time=1.0)
             self.play(Write(set_text), run_time=1.2)
             self.play(Create(arrow), run_time=0.8)
-            # Wait for remaining audio only if there's significant time left
-            remaining_time = tracker.duration - 3.0
-            if remaining_time > 0.1:
-                self.wait(remaining_time)
         
         with self.voiceover(text="We can unambiguously state whether something is or isn't in this set.") as tracker:
             self.wait(tracker.duration)
@@ -298,26 +304,14 @@ class BasicsWithVoiceover(VoiceoverScene):
         with self.voiceover(text="This is in") as tracker:
             # Triangle at normal speed
             self.play(Create(small_triangle), run_time=0.8)
-            # Wait for remaining audio only if there's significant time left
-            remaining_time = tracker.duration - 0.8
-            if remaining_time > 0.1:
-                self.wait(remaining_time)
         
         with self.voiceover(text="so is this") as tracker:
             # Triangle at normal speed
             self.play(Create(right_triangle), run_time=0.8)
-            # Wait for remaining audio only if there's significant time left
-            remaining_time = tracker.duration - 0.8
-            if remaining_time > 0.1:
-                self.wait(remaining_time)
         
         with self.voiceover(text="but this shape isn't. It's not a triangle.") as tracker:
             # Pentagon at normal speed
             self.play(Create(pentagon), run_time=1.0)
-            # Wait for remaining audio only if there's significant time left
-            remaining_time = tracker.duration - 1.0
-            if remaining_time > 0.1:
-                self.wait(remaining_time)
         
         with self.voiceover(text="This lack of ambiguity in what is or what isn't in a set is foundational to set theory.") as tracker:
             self.wait(tracker.duration)
@@ -329,24 +323,16 @@ class BasicsWithVoiceover(VoiceoverScene):
             # Text and check mark at reasonable speed
             self.play(Write(sides_text), run_time=1.5)
             self.play(FadeIn(check), run_time=0.5)
-            # Wait for remaining audio only if there's significant time left
-            remaining_time = tracker.duration - 2.0
-            if remaining_time > 0.1:
-                self.wait(remaining_time)
         
         with self.voiceover(text="But it's not true that the sum of the internal angles is 360 degrees.") as tracker:
             # Text and X mark at reasonable speed
             self.play(Write(angles_text), run_time=1.5)
             self.play(FadeIn(x_mark), run_time=0.5)
-            # Wait for remaining audio only if there's significant time left
-            remaining_time = tracker.duration - 2.0
-            if remaining_time > 0.1:
-                self.wait(remaining_time)
 
     def set_notation(self):
         self.camera.background_color = "#F0F0F0"
         
-        explanation1 = Text(
+        explanation1 = CachedText(
             "A set containing the numbers 1, 2, 3\nwould be written",
             font_size=36,
             color="#505050",
@@ -364,7 +350,7 @@ class BasicsWithVoiceover(VoiceoverScene):
         )
         set_notation.next_to(explanation1, DOWN, buff=1.0)
         
-        explanation2 = Text(
+        explanation2 = CachedText(
             "We can also name the set.",
             font_size=36,
             color="#505050",
@@ -389,45 +375,33 @@ class BasicsWithVoiceover(VoiceoverScene):
         with self.voiceover(text="like this with curly brackets and the elements separated by commas.") as tracker:
             # Mathematical notation at reasonable speed
             self.play(Write(set_notation), run_time=1.5)
-            # Wait for remaining audio only if there's significant time left
-            remaining_time = tracker.duration - 1.5
-            if remaining_time > 0.1:
-                self.wait(remaining_time)
         
         with self.voiceover(text="We can name the set.") as tracker:
             # Text at reasonable speed
             self.play(Write(explanation2), run_time=1.2)
-            # Wait for remaining audio only if there's significant time left
-            remaining_time = tracker.duration - 1.2
-            if remaining_time > 0.1:
-                self.wait(remaining_time)
         
         with self.voiceover(text="In this case if we say A is equal to the set 1, 2, and 3, we can just refer to the set as A, which is much easier than saying the set containing 1, 2, and 3 again and again.") as tracker:
             # Mathematical notation at reasonable speed
             self.play(Write(named_set), run_time=1.8)
-            # Wait for remaining audio only if there's significant time left
-            remaining_time = tracker.duration - 1.8
-            if remaining_time > 0.1:
-                self.wait(remaining_time)
 
     def element_of_symbol(self):
         self.camera.background_color = "#F0F0F0"
         
-        line1 = MarkupText(
+        line1 = CachedMarkupText(
             '<b><i>To express symbolically that an element</i></b>',
             color="#505050",
             font_size=36,
             font="sans-serif"
         )
         
-        line2 = MarkupText(
+        line2 = CachedMarkupText(
             '<b><i>belongs to a set we use </i></b>',
             color="#505050",
             font_size=36,
             font="sans-serif"
         )
         
-        symbol_part = MarkupText(
+        symbol_part = CachedMarkupText(
             '<b><i> ∈</i></b>',
             color="#505050",
             font_size=36,
@@ -442,7 +416,7 @@ class BasicsWithVoiceover(VoiceoverScene):
         
         full_text = VGroup(line1, line2, symbol_part)
         
-        example_text = MarkupText(
+        example_text = CachedMarkupText(
             '<b><i>For example:</i></b>',
             color="#505050",
             font_size=36,
@@ -450,7 +424,7 @@ class BasicsWithVoiceover(VoiceoverScene):
         )
         example_text.next_to(line2, DOWN, aligned_edge=LEFT, buff=0.8)
         
-        set_definition = MarkupText(
+        set_definition = CachedMarkupText(
             '<b><i>If A = {1, 2, 3},</i></b>',
             color="#505050",
             font_size=36,
@@ -459,7 +433,7 @@ class BasicsWithVoiceover(VoiceoverScene):
         set_definition.next_to(example_text, DOWN, aligned_edge=LEFT, buff=0.5)
         set_definition.shift(RIGHT * 1.5)
         
-        membership_math = MarkupText(
+        membership_math = CachedMarkupText(
             '<b><i>then 1 ∈ A, 2 ∈ A</i></b>',
             color="#505050",
             font_size=36,
@@ -467,7 +441,7 @@ class BasicsWithVoiceover(VoiceoverScene):
         )
         membership_math.next_to(set_definition, DOWN, aligned_edge=LEFT, buff=0.5)
         
-        membership_english = MarkupText(
+        membership_english = CachedMarkupText(
             '<b><i>"1 in A, 2 in A"</i></b>',
             color="#505050",
             font_size=36,
@@ -475,7 +449,7 @@ class BasicsWithVoiceover(VoiceoverScene):
         )
         membership_english.move_to(RIGHT * 3 + membership_math.get_center()[1] * UP)
         
-        non_membership_math = MarkupText(
+        non_membership_math = CachedMarkupText(
             '<b><i>but 4 ∉ A</i></b>',
             color="#505050",
             font_size=36,
@@ -483,7 +457,7 @@ class BasicsWithVoiceover(VoiceoverScene):
         )
         non_membership_math.next_to(membership_math, DOWN, aligned_edge=LEFT, buff=0.5)
         
-        non_membership_english = MarkupText(
+        non_membership_english = CachedMarkupText(
             '<b><i>"4 not in A"</i></b>',
             color="#505050",
             font_size=36,
@@ -507,62 +481,46 @@ class BasicsWithVoiceover(VoiceoverScene):
                 run_time=0.8
             )
             self.play(Write(example_text), run_time=1.0)
-            # Wait for remaining audio only if there's significant time left
-            remaining_time = tracker.duration - 1.8
-            if remaining_time > 0.1:
-                self.wait(remaining_time)
         
         with self.voiceover(text="if A is the set containing 1, 2, and 3") as tracker:
             # Mathematical notation at reasonable speed
             self.play(Write(set_definition), run_time=1.5)
-            # Wait for remaining audio only if there's significant time left
-            remaining_time = tracker.duration - 1.5
-            if remaining_time > 0.1:
-                self.wait(remaining_time)
         
         with self.voiceover(text="then 1 is in A and 2 is in A") as tracker:
             # Mathematical expressions at reasonable speed
             self.play(Write(membership_math), run_time=1.2)
             self.play(Write(membership_english), run_time=1.0)
-            # Wait for remaining audio only if there's significant time left
-            remaining_time = tracker.duration - 2.2
-            if remaining_time > 0.1:
-                self.wait(remaining_time)
         
         with self.voiceover(text="but 4 is not in A. And we use the symbol for in but with a line through it to denote not in.") as tracker:
             # Mathematical expressions at reasonable speed
             self.play(Write(non_membership_math), run_time=1.2)
             self.play(Write(non_membership_english), run_time=1.0)
-            # Wait for remaining audio only if there's significant time left
-            remaining_time = tracker.duration - 2.2
-            if remaining_time > 0.1:
-                self.wait(remaining_time)
 
     def set_builder_notation(self):
         self.camera.background_color = "#F0F0F0"
         
-        intro_line1 = MarkupText(
+        intro_line1 = CachedMarkupText(
             '<b><i>In most cases we don\'t write out all the</i></b>',
             color="#505050",
             font_size=36,
             font="sans-serif"
         )
         
-        intro_line2 = MarkupText(
+        intro_line2 = CachedMarkupText(
             '<b><i>elements in a set but will write a shorthand</i></b>',
             color="#505050",
             font_size=36,
             font="sans-serif"
         )
         
-        intro_line3 = MarkupText(
+        intro_line3 = CachedMarkupText(
             '<b><i>description using </i></b>',
             color="#505050",
             font_size=36,
             font="sans-serif"
         )
         
-        underlined_text = MarkupText(
+        underlined_text = CachedMarkupText(
             '<b><i><u>set builder notation</u>.</i></b>',
             color="#505050",
             font_size=36,
@@ -576,14 +534,14 @@ class BasicsWithVoiceover(VoiceoverScene):
         intro_line3.next_to(intro_line2, DOWN, aligned_edge=LEFT, buff=0.1)
         underlined_text.next_to(intro_line3, RIGHT, buff=0.1)
         
-        example_intro = MarkupText(
+        example_intro = CachedMarkupText(
             '<b><i>For example the set of prime numbers</i></b>',
             color="#505050",
             font_size=36,
             font="sans-serif"
         )
         
-        example_intro2 = MarkupText(
+        example_intro2 = CachedMarkupText(
             '<b><i>could be written as</i></b>',
             color="#505050",
             font_size=36,
@@ -593,7 +551,7 @@ class BasicsWithVoiceover(VoiceoverScene):
         example_intro.next_to(intro_line3, DOWN, aligned_edge=LEFT, buff=0.8)
         example_intro2.next_to(example_intro, DOWN, aligned_edge=LEFT, buff=0.1)
         
-        math_notation = MarkupText(
+        math_notation = CachedMarkupText(
             '<b><i>P = {p | p is a prime}</i></b>',
             color="#505050",
             font_size=36,
@@ -602,7 +560,7 @@ class BasicsWithVoiceover(VoiceoverScene):
         math_notation.next_to(example_intro2, DOWN, buff=0.8)
         math_notation.shift(RIGHT * 1.5)
         
-        english_explanation = MarkupText(
+        english_explanation = CachedMarkupText(
             '<b><i>"p such that p is a prime"</i></b>',
             color="#505050",
             font_size=36,
@@ -611,7 +569,7 @@ class BasicsWithVoiceover(VoiceoverScene):
         english_explanation.next_to(math_notation, DOWN, buff=0.6)
         english_explanation.shift(RIGHT * 0.5)
         
-        predicate_label = MarkupText(
+        predicate_label = CachedMarkupText(
             '<b><i>Predicate</i></b>',
             color="#1853A2",
             font_size=36,
@@ -634,18 +592,10 @@ class BasicsWithVoiceover(VoiceoverScene):
         with self.voiceover(text="For example the set of prime numbers could be written as") as tracker:
             # Introductory text at reasonable speed
             self.play(Write(VGroup(example_intro, example_intro2)), run_time=1.8)
-            # Wait for remaining audio only if there's significant time left
-            remaining_time = tracker.duration - 1.8
-            if remaining_time > 0.1:
-                self.wait(remaining_time)
         
         with self.voiceover(text="capital P is the set of little p such that little p is prime") as tracker:
             # Mathematical notation at reasonable speed
             self.play(Write(math_notation), run_time=1.5)
-            # Wait for remaining audio only if there's significant time left
-            remaining_time = tracker.duration - 1.5
-            if remaining_time > 0.1:
-                self.wait(remaining_time)
         
         with self.voiceover(text="Here the little p is a variable which must satisfy some criterion we call the predicate") as tracker:
             # English explanation and predicate label at reasonable speed
@@ -655,10 +605,6 @@ class BasicsWithVoiceover(VoiceoverScene):
                 Write(predicate_label),
                 run_time=1.0
             )
-            # Wait for remaining audio only if there's significant time left
-            remaining_time = tracker.duration - 2.2
-            if remaining_time > 0.1:
-                self.wait(remaining_time)
         
         with self.voiceover(text="since its belonging to the set is predicated on this criterion. In this case the predicate is being a prime number. Also notice we have a shorthand for the phrase such that which is this vertical line.") as tracker:
             self.wait(tracker.duration)
@@ -666,21 +612,21 @@ class BasicsWithVoiceover(VoiceoverScene):
     def number_sets_declaration(self):
         self.camera.background_color = "#F0F0F0"
         
-        intro_line1 = MarkupText(
+        intro_line1 = CachedMarkupText(
             '<b><i>Its good practice when dealing with sets of</i></b>',
             color="#505050",
             font_size=36,
             font="sans-serif"
         )
         
-        intro_line2 = MarkupText(
+        intro_line2 = CachedMarkupText(
             '<b><i>numbers to declare explicitly which sets you</i></b>',
             color="#505050",
             font_size=36,
             font="sans-serif"
         )
         
-        intro_line3 = MarkupText(
+        intro_line3 = CachedMarkupText(
             '<b><i>are starting with</i></b>',
             color="#505050",
             font_size=36,
@@ -722,38 +668,26 @@ class BasicsWithVoiceover(VoiceoverScene):
         with self.voiceover(text="For example, p in the natural numbers such that p is less than five") as tracker:
             # Mathematical notation at reasonable speed
             self.play(Write(natural_set), run_time=1.8)
-            # Wait for remaining audio only if there's significant time left
-            remaining_time = tracker.duration - 1.8
-            if remaining_time > 0.1:
-                self.wait(remaining_time)
         
         with self.voiceover(text="is a completely different set to") as tracker:
             # Symbol at normal speed
             self.play(Write(not_equal), run_time=0.8)
-            # Wait for remaining audio only if there's significant time left
-            remaining_time = tracker.duration - 0.8
-            if remaining_time > 0.1:
-                self.wait(remaining_time)
         
         with self.voiceover(text="r in the real numbers such that r is less than five.") as tracker:
             # Mathematical notation at reasonable speed
             self.play(Write(real_set), run_time=1.8)
-            # Wait for remaining audio only if there's significant time left
-            remaining_time = tracker.duration - 1.8
-            if remaining_time > 0.1:
-                self.wait(remaining_time)
 
     def set_equality(self):
         self.camera.background_color = "#F0F0F0"
         
-        intro_line1 = MarkupText(
+        intro_line1 = CachedMarkupText(
             '<b><i>Two sets are equal if they both contain</i></b>',
             color="#505050",
             font_size=36,
             font="sans-serif"
         )
         
-        intro_line2 = MarkupText(
+        intro_line2 = CachedMarkupText(
             '<b><i>the same elements.</i></b>',
             color="#505050",
             font_size=36,
@@ -764,14 +698,14 @@ class BasicsWithVoiceover(VoiceoverScene):
         intro_line1.to_edge(LEFT, buff=0.5)
         intro_line2.next_to(intro_line1, DOWN, aligned_edge=LEFT, buff=0.1)
         
-        def_line1 = MarkupText(
+        def_line1 = CachedMarkupText(
             '<b><i>If for all a ∈ A, a ∈ B and for all b ∈ B, b ∈</i></b>',
             color="#505050",
             font_size=32,
             font="sans-serif"
         )
         
-        def_line2 = MarkupText(
+        def_line2 = CachedMarkupText(
             '<b><i>A, then A = B.</i></b>',
             color="#505050",
             font_size=32,
@@ -781,8 +715,8 @@ class BasicsWithVoiceover(VoiceoverScene):
         def_line1.next_to(intro_line2, DOWN, aligned_edge=LEFT, buff=0.8)
         def_line2.next_to(def_line1, DOWN, aligned_edge=LEFT, buff=0.1)
         
-        label_A = MarkupText('<b><i>A</i></b>', color="#00396B", font_size=28, font="sans-serif")
-        label_B = MarkupText('<b><i>B</i></b>', color="#008000", font_size=28, font="sans-serif")
+        label_A = CachedMarkupText('<b><i>A</i></b>', color="#00396B", font_size=28, font="sans-serif")
+        label_B = CachedMarkupText('<b><i>B</i></b>', color="#008000", font_size=28, font="sans-serif")
         
         label_A.move_to(LEFT * 2.5 + DOWN * 1.2)
         label_B.move_to(RIGHT * 2.5 + DOWN * 1.2)
@@ -793,10 +727,10 @@ class BasicsWithVoiceover(VoiceoverScene):
         circle_B = Circle(radius=1.5, color="#008000", stroke_width=3.0, fill_opacity=0)
         circle_B.move_to(label_B.get_center() + DOWN * 0.8)
         
-        element_a_in_A = MarkupText('<b><i>a</i></b>', color="#505050", font_size=24, font="sans-serif")
-        element_b_in_A = MarkupText('<b><i>b</i></b>', color="#505050", font_size=24, font="sans-serif")
-        element_a_in_B = MarkupText('<b><i>a</i></b>', color="#505050", font_size=24, font="sans-serif")
-        element_b_in_B = MarkupText('<b><i>b</i></b>', color="#505050", font_size=24, font="sans-serif")
+        element_a_in_A = CachedMarkupText('<b><i>a</i></b>', color="#505050", font_size=24, font="sans-serif")
+        element_b_in_A = CachedMarkupText('<b><i>b</i></b>', color="#505050", font_size=24, font="sans-serif")
+        element_a_in_B = CachedMarkupText('<b><i>a</i></b>', color="#505050", font_size=24, font="sans-serif")
+        element_b_in_B = CachedMarkupText('<b><i>b</i></b>', color="#505050", font_size=24, font="sans-serif")
         
         element_a_in_A.move_to(circle_A.get_center() + LEFT * 0.5 + UP * 0.3)
         element_b_in_A.move_to(circle_A.get_center() + LEFT * 0.5 + DOWN * 0.3)
@@ -843,31 +777,22 @@ class BasicsWithVoiceover(VoiceoverScene):
             self.play(Write(VGroup(def_line1, def_line2)))
             self.play(Write(VGroup(element_a_in_A, element_b_in_A, element_a_in_B, element_b_in_B)))
             self.play(Create(arrow_a), run_time=0.6)
-            # Wait for remaining audio only if there's significant time left
-            remaining_time = tracker.duration - 1.6
-            if remaining_time > 0.1:
-                self.wait(remaining_time)
         
         with self.voiceover(text="and for all little b in capital B, little b is also in capital A, then the sets A and B are equal.") as tracker:
             # Visual elements at natural speed
             self.play(Create(and_underline), Create(arrow_b), run_time=1.0)
-            
-            # Wait for remaining audio only if there's significant time left
-            remaining_time = tracker.duration - 1.0
-            if remaining_time > 0.1:
-                self.wait(remaining_time)
 
     def order_doesnt_matter(self):
         self.camera.background_color = "#F0F0F0"
         
-        intro_line1 = MarkupText(
+        intro_line1 = CachedMarkupText(
             '<b><i>This definition means that the order of the</i></b>',
             color="#505050",
             font_size=36,
             font="sans-serif"
         )
         
-        intro_line2 = MarkupText(
+        intro_line2 = CachedMarkupText(
             '<b><i>elements doesn\'t matter</i></b>',
             color="#505050",
             font_size=36,
@@ -943,18 +868,10 @@ class BasicsWithVoiceover(VoiceoverScene):
         with self.voiceover(text="So if A contains one, two, and three") as tracker:
             # Mathematical notation at reasonable speed
             self.play(Write(set_A), run_time=1.5)
-            # Wait for remaining audio only if there's significant time left
-            remaining_time = tracker.duration - 1.5
-            if remaining_time > 0.1:
-                self.wait(remaining_time)
         
         with self.voiceover(text="and B contains two, three, and one") as tracker:
             # Mathematical notation at reasonable speed
             self.play(Write(set_B), run_time=1.5)
-            # Wait for remaining audio only if there's significant time left
-            remaining_time = tracker.duration - 1.5
-            if remaining_time > 0.1:
-                self.wait(remaining_time)
         
         with self.voiceover(text="we say one is in A and it's also in B,") as tracker:
             # Show only the arrow for "1"
@@ -987,22 +904,18 @@ class BasicsWithVoiceover(VoiceoverScene):
         with self.voiceover(text="and so we've shown that A is equal to B.") as tracker:
             # Conclusion at reasonable speed
             self.play(Write(conclusion), run_time=1.2)
-            # Wait for remaining audio only if there's significant time left
-            remaining_time = tracker.duration - 1.2
-            if remaining_time > 0.1:
-                self.wait(remaining_time)
 
     def repeated_elements_dont_matter(self):
         self.camera.background_color = "#F0F0F0"
         
-        intro_line1 = MarkupText(
+        intro_line1 = CachedMarkupText(
             '<b><i>It also doesn\'t matter if elements are</i></b>',
             color="#505050",
             font_size=36,
             font="sans-serif"
         )
         
-        intro_line2 = MarkupText(
+        intro_line2 = CachedMarkupText(
             '<b><i>repeated</i></b>',
             color="#505050",
             font_size=36,
@@ -1022,7 +935,7 @@ class BasicsWithVoiceover(VoiceoverScene):
         conclusion_text = MathTex(r'A = B', font_size=48, color="#505050")
         conclusion_text.move_to(DOWN * 2.5 + LEFT * 0.5)
         
-        checkmark = SVGMobject("images/check.svg")
+        checkmark = CachedSVGMobject("images/check.svg")
         checkmark.set_color("#008000")
         checkmark.scale(0.4)
         checkmark.next_to(conclusion_text, RIGHT, buff=0.3)
@@ -1100,10 +1013,6 @@ class BasicsWithVoiceover(VoiceoverScene):
             # Mathematical sets at reasonable speed
             self.play(Write(set_A), run_time=1.5)
             self.play(Write(set_B), run_time=2.0)
-            # Wait for remaining audio only if there's significant time left
-            remaining_time = tracker.duration - 3.5
-            if remaining_time > 0.1:
-                self.wait(remaining_time)
         
         # Show arrows demonstrating elements from A to B
         with self.voiceover(text="Like before, as long as every element in one set can be shown to also be in the other, we still have equality.") as tracker:
@@ -1111,10 +1020,6 @@ class BasicsWithVoiceover(VoiceoverScene):
             self.play(Create(arrow_A_to_B_1), run_time=0.8)
             self.play(Create(arrow_A_to_B_2), run_time=0.8)
             self.play(Create(arrow_A_to_B_3), run_time=0.8)
-            # Wait for remaining audio only if there's significant time left
-            remaining_time = tracker.duration - 2.4
-            if remaining_time > 0.1:
-                self.wait(remaining_time)
         
         # This part doesn't have specific audio in the script - it's just a visual demonstration
         # So we can use a brief pause or minimal audio
@@ -1128,38 +1033,26 @@ class BasicsWithVoiceover(VoiceoverScene):
                 run_time=1.2
             )
             self.play(Create(arrow_B_to_A_1), run_time=0.8)
-            # Wait for remaining audio only if there's significant time left
-            remaining_time = tracker.duration - 2.8
-            if remaining_time > 0.1:
-                self.wait(remaining_time)
         
         with self.voiceover(text="Generally we just write the elements in a way that's easiest to read, which usually means without repetitions and often in some sensible order") as tracker:
             # Conclusion at reasonable speed
             self.play(Write(conclusion_text), run_time=1.5)
-            # Wait for remaining audio only if there's significant time left
-            remaining_time = tracker.duration - 1.5
-            if remaining_time > 0.1:
-                self.wait(remaining_time)
         
         with self.voiceover(text="but just to be clear it makes no difference to the set, just to us as readers.") as tracker:
             # Checkmark at normal speed
             self.play(FadeIn(checkmark), run_time=0.6)
-            # Wait for remaining audio only if there's significant time left
-            remaining_time = tracker.duration - 0.6
-            if remaining_time > 0.1:
-                self.wait(remaining_time)
 
     def set_cardinality(self):
         self.camera.background_color = "#F0F0F0"
         
-        title_line1 = MarkupText(
+        title_line1 = CachedMarkupText(
             '<b><i>The size or cardinality of a set is the</i></b>',
             color="#505050",
             font_size=36,
             font="sans-serif"
         )
         
-        title_line2 = MarkupText(
+        title_line2 = CachedMarkupText(
             '<b><i>number of elements it contains.</i></b>',
             color="#505050",
             font_size=36,
@@ -1189,31 +1082,15 @@ class BasicsWithVoiceover(VoiceoverScene):
         with self.voiceover(text="So if A contains one, two, and three, then the cardinality of A is three") as tracker:
             # Mathematical notation at reasonable speed
             self.play(Write(set_A), run_time=1.8)
-            # Wait for remaining audio only if there's significant time left
-            remaining_time = tracker.duration - 1.8
-            if remaining_time > 0.1:
-                self.wait(remaining_time)
         
         with self.voiceover(text="and we denote the cardinality of a set with two vertical lines.") as tracker:
             # Mathematical notation at reasonable speed
             self.play(Write(cardinality_A), run_time=1.5)
-            # Wait for remaining audio only if there's significant time left
-            remaining_time = tracker.duration - 1.5
-            if remaining_time > 0.1:
-                self.wait(remaining_time)
         
         with self.voiceover(text="If a set has an infinite number of elements, like the set of prime numbers for example") as tracker:
             # Mathematical notation at reasonable speed
             self.play(Write(set_P), run_time=2.0)
-            # Wait for remaining audio only if there's significant time left
-            remaining_time = tracker.duration - 2.0
-            if remaining_time > 0.1:
-                self.wait(remaining_time)
         
         with self.voiceover(text="then it's perfectly fine to write the infinity symbol as the cardinality of the set.") as tracker:
             # Mathematical notation at reasonable speed
-            self.play(Write(cardinality_P), run_time=1.5)
-            # Wait for remaining audio only if there's significant time left
-            remaining_time = tracker.duration - 1.5
-            if remaining_time > 0.1:
-                self.wait(remaining_time)
\ No newline at end of file
+            self.play(Write(cardinality_P), run_time=1.5)
\ No newline at end of file
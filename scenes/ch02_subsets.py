@@ -1,31 +1,39 @@
 from manim import *
-from manim_voiceover import VoiceoverScene
-from manim_voiceover.services.gtts import GTTSService
 
-class SubsetsWithVoiceover(VoiceoverScene):
+from scenes.base import ChapterScene
+from scenes.speech import build_speech_service
+from scenes.svg_cache import CachedSVGMobject
+from scenes.text_cache import CachedMarkupText, CachedText
+
+class SubsetsWithVoiceover(ChapterScene):
     def construct(self):
         """Main method that orchestrates the entire video with voiceover"""
         # Set up TTS service
-        self.set_speech_service(GTTSService(lang="en", tld="com"), create_subcaption=False)
+        self.set_speech_service(build_speech_service(), create_subcaption=False)
         
         # Set consistent background color for entire video
         self.camera.background_color = "#F0F0F0"
         
         # Execute all sections in sequence
+        self.next_section("show_title")
         self.show_title()
         self.clear()
+        self.next_section("show_definition")
         self.show_definition()
         self.clear()
+        self.next_section("show_question")
         self.show_question()
         self.clear()
+        self.next_section("show_equality_theorem")
         self.show_equality_theorem()
         self.clear()
+        self.next_section("show_transitivity")
         self.show_transitivity()
 
     def show_title(self):
         """Display the main title: Subsets"""
         # Create the "Subsets" title
-        subsets_title = Text(
+        subsets_title = CachedText(
             "Subsets",
             font_size=50,
             color=BLACK,
@@ -56,14 +64,14 @@ class SubsetsWithVoiceover(VoiceoverScene):
     def show_definition(self):
         """Show subset definition with visual examples and formal notation"""
         # Definition text at the top
-        definition_line1 = MarkupText(
+        definition_line1 = CachedMarkupText(
             '<b><i>A set is a subset of another if all of it\'s elements</i></b>',
             color="#505050",
             font_size=36,
             font="sans-serif"
         )
         
-        definition_line2 = MarkupText(
+        definition_line2 = CachedMarkupText(
             '<b><i>are also elements of another set.</i></b>',
             color="#505050",
             font_size=36,
@@ -94,14 +102,14 @@ class SubsetsWithVoiceover(VoiceoverScene):
         circle_A.move_to(LEFT * 0.8)  # Position to the left inside circle B
         
         # Add labels A and B
-        label_A = MarkupText(
+        label_A = CachedMarkupText(
             '<b><i>A</i></b>',
             color="#00396B",  # Blue color to match circle
             font_size=28,
             font="sans-serif"
         )
         
-        label_B = MarkupText(
+        label_B = CachedMarkupText(
             '<b><i>B</i></b>',
             color="#008000",  # Green color to match circle
             font_size=28,
@@ -114,7 +122,7 @@ class SubsetsWithVoiceover(VoiceoverScene):
         label_B.move_to(circle_B.get_center() + UP * 1.6 + RIGHT * 0.3)  # Moved up
         
         # Bottom conclusion text - aligned with the left edge of the definition
-        conclusion_text = MarkupText(
+        conclusion_text = CachedMarkupText(
             '<b><i>"A is a subset of B"</i></b>',
             color="#505050",
             font_size=36,
@@ -137,9 +145,6 @@ class SubsetsWithVoiceover(VoiceoverScene):
             )
             
             self.play(Write(conclusion_text), run_time=1.0)
-            
-            # Wait for remaining audio if needed
-            self.wait(max(0, tracker.duration - 5.0))
 
         # Fade out visual elements for next example
         self.play(
@@ -191,25 +196,19 @@ class SubsetsWithVoiceover(VoiceoverScene):
             # Sets should appear at reasonable speed
             self.play(Write(set_A), run_time=1.5)
             self.play(Write(set_B), run_time=1.5)
-            
-            # Wait for remaining audio
-            self.wait(max(0, tracker.duration - 3.0))
 
         with self.voiceover(text="then since the elements 2, 4, and 6 which are in A are also in B,") as tracker:
             # Arrows at normal speed - shouldn't be slow
             self.play(Create(arrow_2), run_time=0.8)
             self.play(Create(arrow_4), run_time=0.8)
             self.play(Create(arrow_6), run_time=0.8)
-            
-            # Wait for remaining audio
-            self.wait(max(0, tracker.duration - 2.4))
 
         # Show the subset notation A ⊆ B
         subset_notation = MathTex(r'A \subseteq B', font_size=42, color="#505050")
         subset_notation.move_to(DOWN * 1.8)
         
         # Show final conclusion
-        final_conclusion = MarkupText(
+        final_conclusion = CachedMarkupText(
             '<b><i>"A is a subset of B"</i></b>',
             color="#505050",
             font_size=36,
@@ -221,9 +220,6 @@ class SubsetsWithVoiceover(VoiceoverScene):
             # Mathematical notation at reasonable speed
             self.play(Write(subset_notation), run_time=1.0)
             self.play(Write(final_conclusion), run_time=1.5)
-            
-            # Wait for remaining audio
-            self.wait(max(0, tracker.duration - 2.5))
 
         # Create a transparent black highlight over the subset symbol
         highlight_box = RoundedRectangle(
@@ -270,14 +266,14 @@ class SubsetsWithVoiceover(VoiceoverScene):
     def show_question(self):
         """Display practice question with multiple choice answers"""
         # Question text - bigger font
-        question_line1 = MarkupText(
+        question_line1 = CachedMarkupText(
             '<b><i>Question. If B = {b ∈ ℕ | b is even}, which</i></b>',
             color="#505050",
             font_size=36,
             font="sans-serif"
         )
         
-        question_line2 = MarkupText(
+        question_line2 = CachedMarkupText(
             '<b><i>of these are subsets of B?</i></b>',
             color="#505050",
             font_size=36,
@@ -320,19 +316,16 @@ class SubsetsWithVoiceover(VoiceoverScene):
 
         with self.voiceover(text="A: 4") as tracker:
             self.play(Write(option_a), run_time=1.0)
-            self.wait(max(0, tracker.duration - 1.0))
 
         with self.voiceover(text="B: the set containing 10, 100, and 1000") as tracker:
             self.play(Write(option_b), run_time=1.5)
-            self.wait(max(0, tracker.duration - 1.5))
 
         with self.voiceover(text="or C: the set containing a such that a equals 2k, where k is in the natural numbers.") as tracker:
             self.play(Write(option_c), run_time=2.0)
-            self.wait(max(0, tracker.duration - 2.0))
         
         # Symbols positioned to align with the letters (a), (b), (c)
         # X mark for option (a) - aligned with the letter "a"
-        x_mark_a = SVGMobject("images/cross.svg")
+        x_mark_a = CachedSVGMobject("images/cross.svg")
         x_mark_a.set_color("#FF0000")
         x_mark_a.scale(0.15)
         x_mark_a.move_to([
@@ -342,7 +335,7 @@ class SubsetsWithVoiceover(VoiceoverScene):
         ])
         
         # Checkmark for option (b) - aligned with the letter "b"
-        check_mark_b = SVGMobject("images/check.svg")
+        check_mark_b = CachedSVGMobject("images/check.svg")
         check_mark_b.set_color("#008000")
         check_mark_b.scale(0.15)
         check_mark_b.move_to([
@@ -352,7 +345,7 @@ class SubsetsWithVoiceover(VoiceoverScene):
         ])
         
         # Checkmark for option (c) - aligned with the letter "c"
-        check_mark_c = SVGMobject("images/check.svg")
+        check_mark_c = CachedSVGMobject("images/check.svg")
         check_mark_c.set_color("#008000")
         check_mark_c.scale(0.15)
         check_mark_c.move_to([
@@ -364,16 +357,12 @@ class SubsetsWithVoiceover(VoiceoverScene):
         with self.voiceover(text="Well, 4 is an element of B, but not a subset. It's really easy to get mixed up between elements and subsets, but a clue is that the word subset contains the word set, and subsets are always sets themselves.") as tracker:
             # Visual feedback at normal speed
             self.play(FadeIn(x_mark_a), run_time=0.5)
-            # Wait for audio to finish
-            self.wait(max(0, tracker.duration - 0.5))
 
         with self.voiceover(text="The set containing 10, 100, and 1000 is a subset of B because these are all even numbers.") as tracker:
             self.play(FadeIn(check_mark_b), run_time=0.5)
-            self.wait(max(0, tracker.duration - 0.5))
 
         with self.voiceover(text="The set of a such that a equals 2k where k is in the natural numbers is actually another way of writing the even numbers, since 2 times any number is even. And so this is equal to B, but all the elements of this set are also in B, so technically it is a subset of B.") as tracker:
             self.play(FadeIn(check_mark_c), run_time=0.5)
-            self.wait(max(0, tracker.duration - 0.5))
 
         # Clear everything before next section
         self.play(
@@ -414,14 +403,14 @@ class SubsetsWithVoiceover(VoiceoverScene):
         circle_B.move_to(ORIGIN)
         
         # Create labels A and B
-        label_A = MarkupText(
+        label_A = CachedMarkupText(
             '<b><i>A</i></b>',
             color="#00396B",  # Blue color to match circle
             font_size=28,
             font="sans-serif"
         )
         
-        label_B = MarkupText(
+        label_B = CachedMarkupText(
             '<b><i>B</i></b>',
             color="#008000",  # Green color to match circle
             font_size=28,
@@ -444,9 +433,6 @@ class SubsetsWithVoiceover(VoiceoverScene):
                 Write(label_B),
                 run_time=1.5
             )
-            
-            # Wait for remaining audio
-            self.wait(max(0, tracker.duration - 3.5))
 
         with self.voiceover(text="This is essentially reframing the earlier definition of set equality: that all the elements in one must also be in the other, but in the language of subsets.") as tracker:
             self.wait(tracker.duration)
@@ -470,7 +456,7 @@ class SubsetsWithVoiceover(VoiceoverScene):
         new_circle_A.move_to(ORIGIN + LEFT * 0.5 + DOWN * 0.5)
         
         # New labels
-        new_label_A = MarkupText(
+        new_label_A = CachedMarkupText(
             '<b><i>A</i></b>',
             color="#00396B",
             font_size=24,
@@ -478,7 +464,7 @@ class SubsetsWithVoiceover(VoiceoverScene):
         )
         new_label_A.move_to(new_circle_A.get_center())
         
-        new_label_B = MarkupText(
+        new_label_B = CachedMarkupText(
             '<b><i>B</i></b>',
             color="#008000",
             font_size=28,
@@ -490,9 +476,6 @@ class SubsetsWithVoiceover(VoiceoverScene):
             # Smooth transition animation - fade out EVERYTHING (including theorem text), fade in new circles
             self.play(FadeOut(VGroup(theorem_text, circle_A, circle_B, label_A, label_B)), run_time=0.8)
             self.play(FadeIn(VGroup(new_circle_A, new_circle_B, new_label_A, new_label_B)), run_time=1.0)
-            
-            # Wait for remaining audio
-            self.wait(max(0, tracker.duration - 1.8))
 
         # Add the proper subset theorem text at the top
         proper_subset_text = MathTex(
@@ -511,7 +494,7 @@ class SubsetsWithVoiceover(VoiceoverScene):
         proper_subset_text.to_edge(LEFT, buff=0.5)
         
         # Add explanatory text and arrow pointing to the space between circles
-        explanation_text = MarkupText(
+        explanation_text = CachedMarkupText(
             '<b><i>Elements in B</i></b>\n<b><i>but not in A</i></b>',
             color="#505050",
             font_size=32,
@@ -538,9 +521,6 @@ class SubsetsWithVoiceover(VoiceoverScene):
                 Write(explanation_text),
                 run_time=1.2
             )
-            
-            # Wait for remaining audio
-            self.wait(max(0, tracker.duration - 3.2))
 
         # Add the notation explanation at the bottom
         notation_text = MathTex(
@@ -556,9 +536,6 @@ class SubsetsWithVoiceover(VoiceoverScene):
         with self.voiceover(text="In some textbooks, a proper subset is denoted like this, but sometimes the same symbol is used for subsets that might be equal, so you need to infer from context which they mean. Some textbooks use this symbol for proper subsets, which is more explicit about them not being equal.") as tracker:
             # Mathematical notation at reasonable speed
             self.play(Write(notation_text), run_time=2.5)
-            
-            # Wait for remaining audio
-            self.wait(max(0, tracker.duration - 2.5))
         
         # Clear everything before next section
         self.play(
@@ -611,7 +588,7 @@ class SubsetsWithVoiceover(VoiceoverScene):
         circle_A.move_to(circle_B.get_center() + LEFT * 0.3 + DOWN * 0.3)
         
         # Create labels with efficient positioning
-        label_A = MarkupText(
+        label_A = CachedMarkupText(
             '<b><i>A</i></b>',
             color="#00396B",
             font_size=28,
@@ -619,7 +596,7 @@ class SubsetsWithVoiceover(VoiceoverScene):
         )
         label_A.move_to(circle_A.get_center())
         
-        label_B = MarkupText(
+        label_B = CachedMarkupText(
             '<b><i>B</i></b>',
             color="#008000",
             font_size=32,
@@ -627,7 +604,7 @@ class SubsetsWithVoiceover(VoiceoverScene):
         )
         label_B.move_to(circle_B.get_center() + UP * 1.0 + RIGHT * 0.4)
         
-        label_C = MarkupText(
+        label_C = CachedMarkupText(
             '<b><i>C</i></b>',
             color="#CC0000",
             font_size=36,
@@ -643,25 +620,16 @@ class SubsetsWithVoiceover(VoiceoverScene):
             # Circle A at normal speed
             self.play(Create(circle_A), run_time=1.0)
             self.play(Write(label_A), run_time=0.8)
-            
-            # Wait for remaining audio
-            self.wait(max(0, tracker.duration - 1.8))
 
         with self.voiceover(text="If all of the elements in A are in B,") as tracker:
             # Circle B at normal speed
             self.play(Create(circle_B), run_time=1.0)
             self.play(Write(label_B), run_time=0.8)
-            
-            # Wait for remaining audio
-            self.wait(max(0, tracker.duration - 1.8))
 
         with self.voiceover(text="and all of the elements in B are in C, then all of the elements in A are in C.") as tracker:
             # Circle C at normal speed
             self.play(Create(circle_C), run_time=1.0)
             self.play(Write(label_C), run_time=0.8)
-            
-            # Wait for remaining audio
-            self.wait(max(0, tracker.duration - 1.8))
 
         # Remove everything from the screen with transition
         self.play(
@@ -673,7 +641,7 @@ class SubsetsWithVoiceover(VoiceoverScene):
         center = ORIGIN
         
         # Create "Odd Numbers" text first (blue)
-        odd_numbers_text = MarkupText(
+        odd_numbers_text = CachedMarkupText(
             '<b><i>Odd\nNumbers</i></b>',
             color="#00396B",  # Blue color
             font_size=36,
@@ -692,7 +660,7 @@ class SubsetsWithVoiceover(VoiceoverScene):
         odd_ellipse.move_to(center)
         
         # Create "Integers" text (green)
-        integers_text = MarkupText(
+        integers_text = CachedMarkupText(
             '<b><i>Integers</i></b>',
             color="#008000",  # Green color
             font_size=36,
@@ -713,7 +681,7 @@ class SubsetsWithVoiceover(VoiceoverScene):
         integers_ellipse.move_to(existing_group.get_center())
         
         # Create "Rational Numbers" text (red)
-        rational_text = MarkupText(
+        rational_text = CachedMarkupText(
             '<b><i>Rational Numbers</i></b>',
             color="#CC0000",  # Red color
             font_size=36,
@@ -736,22 +704,14 @@ class SubsetsWithVoiceover(VoiceoverScene):
             # Text and ellipse at reasonable speed
             self.play(Write(odd_numbers_text), run_time=1.2)
             self.play(Create(odd_ellipse), run_time=1.0)
-            
-            # Wait for remaining audio
-            self.wait(max(0, tracker.duration - 2.2))
 
         with self.voiceover(text="and all integers are rational,") as tracker:
             # Text and ellipse at reasonable speed
             self.play(Write(integers_text), run_time=1.0)
             self.play(Create(integers_ellipse), run_time=1.2)
-            
-            # Wait for remaining audio
-            self.wait(max(0, tracker.duration - 2.2))
 
         with self.voiceover(text="so we can be sure that all odd numbers are rational.") as tracker:
             # Final text and ellipse at reasonable speed
             self.play(Write(rational_text), run_time=1.2)
             self.play(Create(rational_ellipse), run_time=1.5)
-            
-            # Wait for remaining audio
-            self.wait(max(0, tracker.duration - 2.7))
\ No newline at end of file
+            
\ No newline at end of file
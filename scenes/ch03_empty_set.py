@@ -1,25 +1,30 @@
 from manim import *
-from manim_voiceover import VoiceoverScene
-from manim_voiceover.services.gtts import GTTSService
 
-class EmptySetWithVoiceover(VoiceoverScene):
+from scenes.base import ChapterScene
+from scenes.speech import build_speech_service
+from scenes.text_cache import CachedMarkupText, CachedText
+
+class EmptySetWithVoiceover(ChapterScene):
     def construct(self):
         """Main method that orchestrates the entire video with voiceover"""
         # Set up TTS service
-        self.set_speech_service(GTTSService(lang="en", tld="com"), create_subcaption=False)
+        self.set_speech_service(build_speech_service(), create_subcaption=False)
         
         # Set consistent background color for entire video
         self.camera.background_color = "#F0F0F0"
         
         # Execute all sections in sequence
+        self.next_section("show_title")
         self.show_title()
+        self.next_section("show_definition")
         self.show_definition()
+        self.next_section("show_uniqueness")
         self.show_uniqueness()
     
     def show_title(self):
         """Display the main title: The Empty Set ∅"""
         # Create the "The Empty Set ∅" title
-        empty_set_title = Text(
+        empty_set_title = CachedText(
             "The Empty Set ∅",
             font_size=50,
             color=BLACK,
@@ -50,14 +55,14 @@ class EmptySetWithVoiceover(VoiceoverScene):
     def show_definition(self):
         """Show empty set definition with subset theorem and proof"""
         # Definition text - first line
-        definition_line1 = MarkupText(
+        definition_line1 = CachedMarkupText(
             '<b><i>The empty set ∅ is a set which contains</i></b>',
             color="#505050",
             font_size=36,
             font="sans-serif"
         )
         
-        definition_line2 = MarkupText(
+        definition_line2 = CachedMarkupText(
             '<b><i>no elements.</i></b>',
             color="#505050",
             font_size=36,
@@ -72,11 +77,9 @@ class EmptySetWithVoiceover(VoiceoverScene):
         with self.voiceover(text="The empty set is a set which contains no elements.") as tracker:
             # Show definition text
             self.play(Write(VGroup(definition_line1, definition_line2)), run_time=2.5)
-            # Wait for remaining audio if needed
-            self.safe_wait(tracker.duration - 2.5)
         
         # Theorem statement - CENTERED
-        theorem_text = MarkupText(
+        theorem_text = CachedMarkupText(
             '<b><i>∅ is a subset of any set</i></b>',
             color="#505050",
             font_size=42,
@@ -87,11 +90,9 @@ class EmptySetWithVoiceover(VoiceoverScene):
         with self.voiceover(text="Firstly, the empty set is a subset of any set.") as tracker:
             # Show theorem
             self.play(Write(theorem_text), run_time=2)
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 2.0)
         
         # Proof heading
-        proof_heading = MarkupText(
+        proof_heading = CachedMarkupText(
             '<b><i>Proof:</i></b>',
             color="#505050",
             font_size=38,
@@ -104,14 +105,14 @@ class EmptySetWithVoiceover(VoiceoverScene):
         self.play(Write(proof_heading), run_time=1.5)
         
         # Proof text - first line
-        proof_line1 = MarkupText(
+        proof_line1 = CachedMarkupText(
             '<b><i>Let A be a set. Since ∅ has no elements, all the</i></b>',
             color="#505050",
             font_size=36,
             font="sans-serif"
         )
         
-        proof_line2 = MarkupText(
+        proof_line2 = CachedMarkupText(
             '<b><i>elements in ∅ must also be in A.</i></b>',
             color="#505050",
             font_size=36,
@@ -126,8 +127,6 @@ class EmptySetWithVoiceover(VoiceoverScene):
             # Show proof text
             self.play(Write(proof_line1), run_time=2)
             self.play(Write(proof_line2), run_time=2)
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 4.0)
         
         # Conclusion - positioned below the proof text
         conclusion = MathTex(
@@ -142,8 +141,6 @@ class EmptySetWithVoiceover(VoiceoverScene):
         with self.voiceover(text="Therefore, the empty set is a subset of A.") as tracker:
             # Show conclusion
             self.play(Write(conclusion), run_time=2)
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 2.0)
         
         # Clear everything before next section
         self.play(
@@ -157,7 +154,7 @@ class EmptySetWithVoiceover(VoiceoverScene):
     def show_uniqueness(self):
         """Show uniqueness proof for the empty set"""
         # Main statement at the top
-        uniqueness_statement = MarkupText(
+        uniqueness_statement = CachedMarkupText(
             '<b><i>∅ is unique</i></b>',
             color="#505050",
             font_size=48,
@@ -168,11 +165,9 @@ class EmptySetWithVoiceover(VoiceoverScene):
         with self.voiceover(text="The second property of the empty set is that it's unique.") as tracker:
             # Show main statement
             self.play(Write(uniqueness_statement), run_time=2)
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 2.0)
         
         # Proof heading
-        proof_heading = MarkupText(
+        proof_heading = CachedMarkupText(
             '<b><i>Proof</i></b>',
             color="#505050",
             font_size=40,
@@ -185,7 +180,7 @@ class EmptySetWithVoiceover(VoiceoverScene):
         self.play(Write(proof_heading), run_time=1.5)
         
         # Proof line 1
-        proof_line1 = MarkupText(
+        proof_line1 = CachedMarkupText(
             '<b><i>let ∅₁ and ∅₂ be two empty sets.</i></b>',
             color="#505050",
             font_size=36,
@@ -195,7 +190,7 @@ class EmptySetWithVoiceover(VoiceoverScene):
         proof_line1.to_edge(LEFT, buff=0.5)
         
         # Proof line 2
-        proof_line2 = MarkupText(
+        proof_line2 = CachedMarkupText(
             '<b><i>Since the empty set is a subset of all sets</i></b>',
             color="#505050",
             font_size=36,
@@ -207,13 +202,9 @@ class EmptySetWithVoiceover(VoiceoverScene):
         with self.voiceover(text="Let empty set one and empty set two be two empty sets.") as tracker:
             # Show proof text
             self.play(Write(proof_line1), run_time=2)
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 2.0)
         
         with self.voiceover(text="Since the empty set is a subset of all sets, we already can deduce that empty set one is a subset of empty set two and empty set two is a subset of empty set one.") as tracker:
             self.play(Write(proof_line2), run_time=2)
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 2.0)
         
         # Subset relations - positioned below proof text
         subset_relations = MathTex(
@@ -227,8 +218,6 @@ class EmptySetWithVoiceover(VoiceoverScene):
         with self.voiceover(text="This is the definition of equality we saw earlier.") as tracker:
             # Show subset relations
             self.play(Write(subset_relations), run_time=2.5)
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 2.5)
         
         # Final conclusion - positioned below subset relations
         conclusion = MathTex(
@@ -241,6 +230,4 @@ class EmptySetWithVoiceover(VoiceoverScene):
         
         with self.voiceover(text="If empty sets one and two are equal, then we only really had a single unique empty set to begin with, and so we can drop the subscripts one and two and just call them the empty set.") as tracker:
             # Show conclusion
-            self.play(Write(conclusion), run_time=2)
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 2.0)
\ No newline at end of file
+            self.play(Write(conclusion), run_time=2)
\ No newline at end of file
@@ -1,37 +1,55 @@
 from manim import *
-from manim_voiceover import VoiceoverScene
-from manim_voiceover.services.gtts import GTTSService
 
-class UnionAndIntersectionWithVoiceover(VoiceoverScene):
+from scenes.base import ChapterScene
+from scenes.speech import build_speech_service
+from scenes.text_cache import CachedMarkupText, CachedText
+from scenes.venn import VennIntersection, VennUnion, venn_region
+
+class UnionAndIntersectionWithVoiceover(ChapterScene):
     def construct(self):
         """Main method that orchestrates the entire video with voiceover"""
         # Set up TTS service
-        self.set_speech_service(GTTSService(lang="en", tld="com"), create_subcaption=False)
+        self.set_speech_service(build_speech_service(), create_subcaption=False)
         
         # Set consistent background color for entire video
         self.camera.background_color = "#F0F0F0"
         
         # Execute all sections in sequence
+        self.next_section("show_title")
         self.show_title()
+        self.next_section("show_introduction")
         self.show_introduction()
+        self.next_section("show_explanation")
         self.show_explanation()
+        self.next_section("show_union_definition")
         self.show_union_definition()
+        self.next_section("show_intersection_definition")
         self.show_intersection_definition()
+        self.next_section("show_examples")
         self.show_examples()
+        self.next_section("show_examples_2")
         self.show_examples_2()
+        self.next_section("show_union_properties")
         self.show_union_properties()
+        self.next_section("show_intersection_properties")
         self.show_intersection_properties()
+        self.next_section("show_cardinality")
         self.show_cardinality()
+        self.next_section("show_mixing_unions_intersections")
         self.show_mixing_unions_intersections()
+        self.next_section("show_distributive_laws_comparison")
         self.show_distributive_laws_comparison()
+        self.next_section("show_union_real_world_example")
         self.show_union_real_world_example()
+        self.next_section("show_distributive_law_proof")
         self.show_distributive_law_proof()
+        self.next_section("show_shirts_venn_diagram")
         self.show_shirts_venn_diagram()
     
     def show_title(self):
         """Display the main title: Union and Intersection"""
         # Create the "Union and Intersection" title
-        union_intersection_title = Text(
+        union_intersection_title = CachedText(
             "Union and Intersection",
             font_size=50,
             color=BLACK,
@@ -81,7 +99,7 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             circle_A.next_to(set_A_text, DOWN, buff=1.0)
             
             # Label A inside the circle
-            label_A = Text(
+            label_A = CachedText(
                 "A",
                 font_size=36,
                 color="#00396B",
@@ -93,7 +111,7 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             # Numbers inside circle A
             numbers_A = VGroup()
             for i in range(6):
-                number = Text(
+                number = CachedText(
                     str(i + 1),
                     font_size=32,
                     color="#505050",
@@ -118,9 +136,6 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             self.play(Create(circle_A), run_time=1.5)
             self.play(Write(label_A), run_time=1)
             self.play(Write(numbers_A), run_time=2)
-            
-            # Wait for remaining audio if needed
-            self.safe_wait(tracker.duration - 6.5)
         
         with self.voiceover(text="And set B containing two, four, six, and eight.") as tracker:
             # === SET B GROUP ===
@@ -141,7 +156,7 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             circle_B.next_to(set_B_text, DOWN, buff=1.0)
             
             # Label B inside the circle
-            label_B = Text(
+            label_B = CachedText(
                 "B",
                 font_size=36,
                 color="#008000",
@@ -154,7 +169,7 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             numbers_B = VGroup()
             b_values = [2, 4, 6, 8]
             for i, value in enumerate(b_values):
-                number = Text(
+                number = CachedText(
                     str(value),
                     font_size=32,
                     color="#505050",
@@ -177,9 +192,6 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             self.play(Create(circle_B), run_time=1.5)
             self.play(Write(label_B), run_time=1)
             self.play(Write(numbers_B), run_time=2)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 6.5)
 
         with self.voiceover(text="Now let's arrange these as overlapping circles to create a Venn diagram showing the relationships between these sets.") as tracker:
             # === TRANSITION TO VENN DIAGRAM ===
@@ -202,29 +214,29 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             circle_B_venn.move_to(RIGHT * 1.2)
             
             # New labels
-            label_A_venn = Text("A", font_size=36, color="#00396B", font="sans-serif", weight=BOLD)
+            label_A_venn = CachedText("A", font_size=36, color="#00396B", font="sans-serif", weight=BOLD)
             label_A_venn.move_to(LEFT + UP * 1.5)
             
-            label_B_venn = Text("B", font_size=36, color="#008000", font="sans-serif", weight=BOLD)
+            label_B_venn = CachedText("B", font_size=36, color="#008000", font="sans-serif", weight=BOLD)
             label_B_venn.move_to(RIGHT + UP * 1.5)
             
             # Numbers in regions
             # A only: 1, 3, 5
             nums_A_only = VGroup(
-                Text("1", font_size=32, color="#505050").move_to(LEFT * 2.5 + UP * 0.3),
-                Text("3", font_size=32, color="#505050").move_to(LEFT * 2.5 + DOWN * 0.3), 
-                Text("5", font_size=32, color="#505050").move_to(LEFT * 2.5 + DOWN * 0.9)
+                CachedText("1", font_size=32, color="#505050").move_to(LEFT * 2.5 + UP * 0.3),
+                CachedText("3", font_size=32, color="#505050").move_to(LEFT * 2.5 + DOWN * 0.3), 
+                CachedText("5", font_size=32, color="#505050").move_to(LEFT * 2.5 + DOWN * 0.9)
             )
             
             # Intersection: 2, 4, 6
             nums_intersection = VGroup(
-                Text("2", font_size=32, color="#505050").move_to(UP * 0.5),
-                Text("4", font_size=32, color="#505050").move_to(ORIGIN),
-                Text("6", font_size=32, color="#505050").move_to(DOWN * 0.5)
+                CachedText("2", font_size=32, color="#505050").move_to(UP * 0.5),
+                CachedText("4", font_size=32, color="#505050").move_to(ORIGIN),
+                CachedText("6", font_size=32, color="#505050").move_to(DOWN * 0.5)
             )
             
             # B only: 8
-            nums_B_only = Text("8", font_size=32, color="#505050").move_to(RIGHT * 2.5)
+            nums_B_only = CachedText("8", font_size=32, color="#505050").move_to(RIGHT * 2.5)
             
             # Replace everything in one smooth transformation
             self.play(
@@ -237,9 +249,6 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
                 FadeOut(VGroup(set_A_text, set_B_text)),
                 run_time=2.5
             )
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 2.5)
         
         # Clear everything before next section
         self.play(
@@ -255,21 +264,21 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
         """Show explanation of union and intersection"""
         with self.voiceover(text="The union and intersection are two ways of combining the elements in two sets into a new set.") as tracker:
             # Explanation text - split into multiple lines for better formatting
-            explanation_line1 = MarkupText(
+            explanation_line1 = CachedMarkupText(
                 '<b><i>The union and intersection are two ways of</i></b>',
                 color="#505050",
                 font_size=36,
                 font="sans-serif"
             )
             
-            explanation_line2 = MarkupText(
+            explanation_line2 = CachedMarkupText(
                 '<b><i>combining the elements in two sets into a new</i></b>',
                 color="#505050",
                 font_size=36,
                 font="sans-serif"
             )
             
-            explanation_line3 = MarkupText(
+            explanation_line3 = CachedMarkupText(
                 '<b><i>set.</i></b>',
                 color="#505050",
                 font_size=36,
@@ -286,9 +295,6 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             self.play(Write(explanation_line1), run_time=2)
             self.play(Write(explanation_line2), run_time=2)
             self.play(Write(explanation_line3), run_time=1.5)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 5.5)
         
         # Clear explanation before next section
         self.play(
@@ -301,21 +307,21 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
         """Show union definition with formula and Venn diagram"""
         with self.voiceover(text="The union of two sets A and B is a set containing all the elements in A as well as all the elements in B.") as tracker:
             # Definition text at the top
-            definition_line1 = MarkupText(
+            definition_line1 = CachedMarkupText(
                 '<b><i>The union of two sets A and B is the set</i></b>',
                 color="#505050",
                 font_size=36,
                 font="sans-serif"
             )
             
-            definition_line2 = MarkupText(
+            definition_line2 = CachedMarkupText(
                 '<b><i>containing all the elements in A as well as all the</i></b>',
                 color="#505050",
                 font_size=36,
                 font="sans-serif"
             )
             
-            definition_line3 = MarkupText(
+            definition_line3 = CachedMarkupText(
                 '<b><i>elements in B.</i></b>',
                 color="#505050",
                 font_size=36,
@@ -332,9 +338,6 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             self.play(Write(definition_line1), run_time=2)
             self.play(Write(definition_line2), run_time=2)
             self.play(Write(definition_line3), run_time=1.5)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 5.5)
         
         with self.voiceover(text="We write this formally as A union B, where the large U shape symbolizes the union. This is the set x such that x is in A or x is in B. The word 'or' is the most important bit here.") as tracker:
             # Union formula - split into parts for precise targeting
@@ -374,7 +377,7 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             )
             
             # "A union B" text below the arrow
-            union_text = MarkupText(
+            union_text = CachedMarkupText(
                 '<b><i>"A union B"</i></b>',
                 color="#505050",
                 font_size=32,
@@ -388,9 +391,6 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
                 Write(union_text),
                 run_time=2
             )
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 5.5)
 
         with self.voiceover(text="This is like taking all of the elements indicated in this shaded area of the Venn diagram, and notice that it includes elements in both A and B.") as tracker:
             # === TRANSITION TO VENN DIAGRAM ===
@@ -432,7 +432,7 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             circle_B.move_to(RIGHT * 1.2)
             
             # Labels
-            label_A = Text(
+            label_A = CachedText(
                 "A",
                 font_size=36,
                 color="#00396B",
@@ -441,7 +441,7 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             )
             label_A.move_to(LEFT + UP * 1.5)
             
-            label_B = Text(
+            label_B = CachedText(
                 "B", 
                 font_size=36,
                 color="#008000",
@@ -468,9 +468,6 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
                 ReplacementTransform(circle_B, filled_circle_B),
                 run_time=2
             )
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 6.0)
         
         # Clear everything before next section
         self.play(
@@ -486,14 +483,14 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
         """Show intersection definition with formula and Venn diagram"""
         with self.voiceover(text="The intersection of sets A and B is a set containing elements that are in both A and B.") as tracker:
             # Definition text at the top
-            definition_line1 = MarkupText(
+            definition_line1 = CachedMarkupText(
                 '<b><i>The intersection of sets A and B is the set</i></b>',
                 color="#505050",
                 font_size=36,
                 font="sans-serif"
             )
             
-            definition_line2 = MarkupText(
+            definition_line2 = CachedMarkupText(
                 '<b><i>containing elements that are in both A and B.</i></b>',
                 color="#505050",
                 font_size=36,
@@ -508,9 +505,6 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             # Show definition text
             self.play(Write(definition_line1), run_time=2)
             self.play(Write(definition_line2), run_time=2)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 4.0)
         
         with self.voiceover(text="The intersection of A and B, or A intersect B for short, is symbolized with an upside down union symbol and is formally defined as x such that x is in A and x is in B. The word 'and' is the most important bit.") as tracker:
             # Intersection formula - split into parts for precise targeting
@@ -550,7 +544,7 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             )
             
             # "A intersect B" text below the arrow
-            intersect_text = MarkupText(
+            intersect_text = CachedMarkupText(
                 '<b><i>"A intersect B"</i></b>',
                 color="#505050",
                 font_size=32,
@@ -564,9 +558,6 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
                 Write(intersect_text),
                 run_time=2
             )
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 5.5)
         
         with self.voiceover(text="If the elements of the intersection must be in both A and B, then we're talking about the overlapping part of the Venn diagram.") as tracker:
             # === CONTINUATION: TRANSITION TO VENN DIAGRAM ===
@@ -608,7 +599,7 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             circle_B.move_to(RIGHT * 1.2)
             
             # Labels
-            label_A = Text(
+            label_A = CachedText(
                 "A",
                 font_size=36,
                 color="#00396B",
@@ -617,7 +608,7 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             )
             label_A.move_to(LEFT + UP * 1.5)
             
-            label_B = Text(
+            label_B = CachedText(
                 "B", 
                 font_size=36,
                 color="#008000",
@@ -635,7 +626,7 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
                 run_time=2
             )
             
-            intersection_area = Intersection(circle_A, circle_B)
+            intersection_area = VennIntersection(circle_A, circle_B)
             intersection_area.set_fill(color="#A0A0A0", opacity=0.6)
             intersection_area.set_stroke(width=0)
             
@@ -644,9 +635,6 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
                 FadeIn(intersection_area),
                 run_time=2
             )
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 6.0)
         
         # Clear everything before next section
         self.play(
@@ -662,7 +650,7 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
         """Show first set of examples"""
         with self.voiceover(text="Let A be the set containing zero and one, and B be the set containing one, two, and three. What is A union B? And what is A intersect B?") as tracker:
             # Given sets at the top
-            given_sets = MarkupText(
+            given_sets = CachedMarkupText(
                 '<b><i>Let A = {0, 1} and B = {1, 2, 3}.</i></b>',
                 color="#505050",
                 font_size=36,
@@ -675,7 +663,7 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             self.play(Write(given_sets), run_time=2.5)
             
             # Question 1: Union
-            question1 = MarkupText(
+            question1 = CachedMarkupText(
                 '<b><i>1. What is A ∪ B ?</i></b>',
                 color="#505050",
                 font_size=36,
@@ -688,7 +676,7 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             self.play(Write(question1), run_time=2)
             
             # Question 2: Intersection
-            question2 = MarkupText(
+            question2 = CachedMarkupText(
                 '<b><i>2. What is A ∩ B ?</i></b>',
                 color="#505050",
                 font_size=36,
@@ -699,9 +687,6 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             
             # Show question 2
             self.play(Write(question2), run_time=2)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 6.5)
 
         with self.voiceover(text="The union of A and B contains all the elements in A, so zero and one, as well as everything in B, which is one, two, and three. So all together, and ignoring the repeating one, we have the union of A and B is the set containing zero, one, two, and three.") as tracker:
             # Answer 1: Union result
@@ -714,9 +699,6 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             
             # Show answer 1
             self.play(Write(answer1), run_time=2)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 2.0)
         
         with self.voiceover(text="The intersection of A and B will contain only elements in both A and B. In this case, only one is common to both A and B, and so the intersection of A and B is the set containing one.") as tracker:
             # Answer 2: Intersection result
@@ -729,9 +711,6 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             
             # Show answer 2
             self.play(Write(answer2), run_time=2)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 2.0)
         
         # Clear everything before next section
         self.play(
@@ -744,14 +723,14 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
         """Show second set of examples"""
         with self.voiceover(text="Let's do a second example. Let A be the set of little a in the natural numbers such that little a is odd - the odd numbers for short - and B be the set of even natural numbers. What is A union B? And what is A intersect B?") as tracker:
             # Given sets at the top - split into two lines for better readability
-            given_sets_line1 = MarkupText(
+            given_sets_line1 = CachedMarkupText(
                 '<b><i>Let A = {a ∈ ℕ | a is odd} and B = {b ∈ ℕ |</i></b>',
                 color="#505050",
                 font_size=36,
                 font="sans-serif"
             )
             
-            given_sets_line2 = MarkupText(
+            given_sets_line2 = CachedMarkupText(
                 '<b><i>b is even}.</i></b>',
                 color="#505050",
                 font_size=36,
@@ -768,7 +747,7 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             self.play(Write(given_sets_line2), run_time=2)
             
             # Question 1: Union
-            question1 = MarkupText(
+            question1 = CachedMarkupText(
                 '<b><i>1. What is A ∪ B ?</i></b>',
                 color="#505050",
                 font_size=36,
@@ -781,7 +760,7 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             self.play(Write(question1), run_time=2)
             
             # Question 2: Intersection
-            question2 = MarkupText(
+            question2 = CachedMarkupText(
                 '<b><i>2. What is A ∩ B ?</i></b>',
                 color="#505050",
                 font_size=36,
@@ -792,9 +771,6 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             
             # Show question 2
             self.play(Write(question2), run_time=2)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 8.5)
         
         with self.voiceover(text="The union of A and B will be a set that contains all the odd numbers and all the even numbers, which is the set of all natural numbers.") as tracker:
             # Answer 1: Union result (all natural numbers)
@@ -807,9 +783,6 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             
             # Show answer 1
             self.play(Write(answer1), run_time=2)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 2.0)
         
         with self.voiceover(text="The intersection of A and B would contain only numbers that are both odd and even. There aren't any numbers which fit this criterion, and so the intersection of A and B is just the empty set.") as tracker:
             # Answer 2: Intersection result (empty set)
@@ -822,9 +795,6 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             
             # Show answer 2
             self.play(Write(answer2), run_time=2)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 2.0)
         
         # Clear everything before next section
         self.play(
@@ -839,7 +809,7 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
         """Show properties of the union"""
         with self.voiceover(text="Let's look at some properties of the union. Firstly, the union of any set A with the empty set is just A, since the empty set has no elements. We have a similar situation with taking the union of any set A with itself, which just gives A.") as tracker:
             # Title at the top - centered and moved up
-            title = MarkupText(
+            title = CachedMarkupText(
                 '<b><i>Properties of the Union</i></b>',
                 color="#505050",
                 font_size=48,
@@ -866,9 +836,6 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             self.play(Write(properties[0]), run_time=2)
             # Show second property
             self.play(Write(properties[1]), run_time=2)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 6.0)
         
         with self.voiceover(text="If A is a subset of B, then the union of A and B is just B, because all of the elements in A are already in B, and so we don't add anything new to the union.") as tracker:
             self.play(Write(properties[2]), run_time=2)
@@ -891,10 +858,10 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             circle_A.move_to(circle_B.get_center() + LEFT * 0.4 + DOWN * 0.3)
             
             # Labels
-            label_A = Text("A", font_size=28, color="#00396B", font="sans-serif", weight=BOLD)
+            label_A = CachedText("A", font_size=28, color="#00396B", font="sans-serif", weight=BOLD)
             label_A.move_to(circle_A.get_center())
             
-            label_B = Text("B", font_size=28, color="#008000", font="sans-serif", weight=BOLD)
+            label_B = CachedText("B", font_size=28, color="#008000", font="sans-serif", weight=BOLD)
             label_B.move_to(circle_B.get_center() + UP * 1.3 + RIGHT * 0.3)
             
             # Create circles and labels
@@ -915,9 +882,6 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
                 ReplacementTransform(circle_A, filled_circle_A),
                 run_time=2
             )
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 6.5)
         
         with self.voiceover(text="Another example is that the union of A and B is the same thing as taking the union of B with A. The final property of unions is if we have three sets A, B, and C, we can exchange the order we take the union by moving the brackets and we'll still get the same outcome.") as tracker:
             # Property 4 - Commutative property
@@ -953,9 +917,6 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             
             # Show property 5
             self.play(Write(property5), run_time=2.5)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 6.0)
         
         with self.voiceover(text="On the left hand side we take the union of B with C first and then take the union with A. We end with all the elements in A as well as all those in B and C. Taking the right hand side, we start with the union of A and B and then take the union of that with C, and just as before we get all the elements from all three sets.") as tracker:
             # Create three-circle template
@@ -968,13 +929,13 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             circle_C = Circle(radius=1.2, color="#CC0000", stroke_width=4.0, fill_opacity=0)
             circle_C.move_to(RIGHT * 0.7 + DOWN * 1.2)
             
-            label_A = Text("A", font_size=24, color="#00396B", font="sans-serif", weight=BOLD)
+            label_A = CachedText("A", font_size=24, color="#00396B", font="sans-serif", weight=BOLD)
             label_A.move_to(circle_A.get_center() + LEFT * 0.8)
             
-            label_B = Text("B", font_size=24, color="#008000", font="sans-serif", weight=BOLD)
+            label_B = CachedText("B", font_size=24, color="#008000", font="sans-serif", weight=BOLD)
             label_B.move_to(circle_B.get_center() + UP * 0.8)
             
-            label_C = Text("C", font_size=24, color="#CC0000", font="sans-serif", weight=BOLD)
+            label_C = CachedText("C", font_size=24, color="#CC0000", font="sans-serif", weight=BOLD)
             label_C.move_to(circle_C.get_center() + RIGHT * 0.8)
             
             venn_template = VGroup(circle_A, circle_B, circle_C, label_A, label_B, label_C)
@@ -987,14 +948,14 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             self.play(FadeIn(left_diagram), run_time=2)
             
             # First show B ∪ C union
-            bc_union = Union(left_diagram[1], left_diagram[2])  # B and C circles
+            bc_union = VennUnion(left_diagram[1], left_diagram[2])  # B and C circles
             bc_union.set_fill(color="#A0A0A0", opacity=0.6)
             bc_union.set_stroke(width=0)
             
             self.play(FadeIn(bc_union), run_time=2)
             
             # Then show final A ∪ (B ∪ C) - all three circles
-            abc_union_left = Union(left_diagram[0], Union(left_diagram[1], left_diagram[2]))
+            abc_union_left = VennUnion(left_diagram[0], VennUnion(left_diagram[1], left_diagram[2]))
             abc_union_left.set_fill(color="#808080", opacity=0.8)  # Darker for final result
             abc_union_left.set_stroke(width=0)
             
@@ -1012,14 +973,14 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             self.play(FadeIn(right_diagram), run_time=2)
             
             # First show A ∪ B union
-            ab_union = Union(right_diagram[0], right_diagram[1])  # A and B circles
+            ab_union = VennUnion(right_diagram[0], right_diagram[1])  # A and B circles
             ab_union.set_fill(color="#A0A0A0", opacity=0.6)
             ab_union.set_stroke(width=0)
             
             self.play(FadeIn(ab_union), run_time=2)
             
             # Then show final (A ∪ B) ∪ C - all three circles
-            abc_union_right = Union(Union(right_diagram[0], right_diagram[1]), right_diagram[2])
+            abc_union_right = VennUnion(VennUnion(right_diagram[0], right_diagram[1]), right_diagram[2])
             abc_union_right.set_fill(color="#808080", opacity=0.8)  # Darker for final result
             abc_union_right.set_stroke(width=0)
             
@@ -1028,9 +989,6 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
                 FadeIn(abc_union_right),
                 run_time=2
             )
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 12.0)
         
         # Clear everything before next section
         self.play(
@@ -1046,7 +1004,7 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
         """Show properties of the intersection"""
         with self.voiceover(text="Some properties of the intersection now. Remember, this is all the elements common to both sets. Firstly, for any set A, the intersection of A with the empty set is just the empty set, since the empty set has no elements it can't have any elements in common with any other set. The intersection of any set with itself is just itself. If you remember, this is exactly the same as with unions.") as tracker:
             # Title at the top - centered and moved up
-            title = MarkupText(
+            title = CachedMarkupText(
                 '<b><i>Properties of the Intersection</i></b>',
                 color="#505050",
                 font_size=48,
@@ -1073,9 +1031,6 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             self.play(Write(properties[0]), run_time=2)
             # Show second property
             self.play(Write(properties[1]), run_time=2)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 4.0)
         
         with self.voiceover(text="If A is a subset of B, then the intersection of A and B is just A, the smaller set of the two, as indicated by the shaded area. This is because the elements in A are also in B.") as tracker:
             self.play(Write(properties[2]), run_time=2)
@@ -1098,10 +1053,10 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             circle_A.move_to(circle_B.get_center() + LEFT * 0.4 + DOWN * 0.3)
             
             # Labels
-            label_A = Text("A", font_size=28, color="#00396B", font="sans-serif", weight=BOLD)
+            label_A = CachedText("A", font_size=28, color="#00396B", font="sans-serif", weight=BOLD)
             label_A.move_to(circle_A.get_center() + UP * 0.5)
             
-            label_B = Text("B", font_size=28, color="#008000", font="sans-serif", weight=BOLD)
+            label_B = CachedText("B", font_size=28, color="#008000", font="sans-serif", weight=BOLD)
             label_B.move_to(circle_B.get_center() + UP * 1.3 + RIGHT * 0.3)
             
             # Create circles and labels
@@ -1120,9 +1075,6 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
                 ReplacementTransform(circle_A, filled_circle_A),
                 run_time=2
             )
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 6.5)
         
         with self.voiceover(text="And just like with the union, A intersect B is the same as B intersect A. That is, the order of the sets doesn't make any difference to the intersection. Again, like with the union, the fact that the order doesn't matter extends to three or more sets with brackets.") as tracker:
             # Property 4 - Commutative property
@@ -1158,9 +1110,6 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             
             # Show property 5
             self.play(Write(property5), run_time=2.5)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 6.0)
         
         with self.voiceover(text="We can see that B intersects C, then the intersection of the result of that with A is the same as taking the intersection of A and B and then the intersection of that with C. In both cases we end up with a set containing the elements found in A and B and C, the shaded area in the middle.") as tracker:
             # Create three-circle template for intersections
@@ -1173,13 +1122,13 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             circle_C = Circle(radius=1.2, color="#CC0000", stroke_width=4.0, fill_opacity=0)
             circle_C.move_to(RIGHT * 0.7 + DOWN * 1.2)
             
-            label_A = Text("A", font_size=24, color="#00396B", font="sans-serif", weight=BOLD)
+            label_A = CachedText("A", font_size=24, color="#00396B", font="sans-serif", weight=BOLD)
             label_A.move_to(circle_A.get_center() + LEFT * 0.8)
             
-            label_B = Text("B", font_size=24, color="#008000", font="sans-serif", weight=BOLD)
+            label_B = CachedText("B", font_size=24, color="#008000", font="sans-serif", weight=BOLD)
             label_B.move_to(circle_B.get_center() + UP * 0.8)
             
-            label_C = Text("C", font_size=24, color="#CC0000", font="sans-serif", weight=BOLD)
+            label_C = CachedText("C", font_size=24, color="#CC0000", font="sans-serif", weight=BOLD)
             label_C.move_to(circle_C.get_center() + RIGHT * 0.8)
             
             venn_template = VGroup(circle_A, circle_B, circle_C, label_A, label_B, label_C)
@@ -1192,14 +1141,14 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             self.play(FadeIn(left_diagram), run_time=2)
             
             # First show B ∩ C intersection
-            bc_intersection = Intersection(left_diagram[1], left_diagram[2])  # B and C circles
+            bc_intersection = VennIntersection(left_diagram[1], left_diagram[2])  # B and C circles
             bc_intersection.set_fill(color="#A0A0A0", opacity=0.6)
             bc_intersection.set_stroke(width=0)
             
             self.play(FadeIn(bc_intersection), run_time=2)
             
             # Then show final A ∩ (B ∩ C) - center intersection
-            abc_intersection_left = Intersection(left_diagram[0], Intersection(left_diagram[1], left_diagram[2]))
+            abc_intersection_left = VennIntersection(left_diagram[0], VennIntersection(left_diagram[1], left_diagram[2]))
             abc_intersection_left.set_fill(color="#808080", opacity=0.8)  # Darker for final result
             abc_intersection_left.set_stroke(width=0)
             
@@ -1217,14 +1166,14 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             self.play(FadeIn(right_diagram), run_time=2)
             
             # First show A ∩ B intersection
-            ab_intersection = Intersection(right_diagram[0], right_diagram[1])  # A and B circles
+            ab_intersection = VennIntersection(right_diagram[0], right_diagram[1])  # A and B circles
             ab_intersection.set_fill(color="#A0A0A0", opacity=0.6)
             ab_intersection.set_stroke(width=0)
             
             self.play(FadeIn(ab_intersection), run_time=2)
             
             # Then show final (A ∩ B) ∩ C - center intersection
-            abc_intersection_right = Intersection(Intersection(right_diagram[0], right_diagram[1]), right_diagram[2])
+            abc_intersection_right = VennIntersection(VennIntersection(right_diagram[0], right_diagram[1]), right_diagram[2])
             abc_intersection_right.set_fill(color="#808080", opacity=0.8)  # Darker for final result
             abc_intersection_right.set_stroke(width=0)
             
@@ -1233,9 +1182,6 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
                 FadeIn(abc_intersection_right),
                 run_time=2
             )
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 12.0)
         
         # Clear everything before next section
         self.play(
@@ -1272,14 +1218,14 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             circle_A.move_to(ORIGIN)
             
             # Label A
-            label_A = Text("A", font_size=32, color="#00396B", font="sans-serif", weight=BOLD)
+            label_A = CachedText("A", font_size=32, color="#00396B", font="sans-serif", weight=BOLD)
             label_A.move_to(circle_A.get_center() + UP * 1.5)
             
             # Numbers in A
             numbers_A = VGroup(
-                Text("1", font_size=28, color="#505050").move_to(LEFT * 0.8),
-                Text("2", font_size=28, color="#505050").move_to(LEFT * 0.3),
-                Text("3", font_size=28, color="#505050").move_to(RIGHT * 0.3)
+                CachedText("1", font_size=28, color="#505050").move_to(LEFT * 0.8),
+                CachedText("2", font_size=28, color="#505050").move_to(LEFT * 0.3),
+                CachedText("3", font_size=28, color="#505050").move_to(RIGHT * 0.3)
             )
             
             # Show circle A with numbers
@@ -1310,18 +1256,18 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             circle_B_venn.move_to(RIGHT * 1.2)
             
             # New labels
-            label_A_venn = Text("A", font_size=32, color="#00396B", font="sans-serif", weight=BOLD)
+            label_A_venn = CachedText("A", font_size=32, color="#00396B", font="sans-serif", weight=BOLD)
             label_A_venn.move_to(LEFT * 1.7 + UP * 1.5)
             
-            label_B_venn = Text("B", font_size=32, color="#008000", font="sans-serif", weight=BOLD)
+            label_B_venn = CachedText("B", font_size=32, color="#008000", font="sans-serif", weight=BOLD)
             label_B_venn.move_to(RIGHT * 1.7 + UP * 1.5)
             
             # New number positioning for Venn diagram
             numbers_venn = VGroup(
-                Text("1", font_size=28, color="#505050").move_to(LEFT * 2.2),      # A only
-                Text("2", font_size=28, color="#505050").move_to(LEFT * 1.7),      # A only
-                Text("3", font_size=28, color="#505050").move_to(ORIGIN),          # Intersection
-                Text("4", font_size=28, color="#505050").move_to(RIGHT * 1.7)      # B only
+                CachedText("1", font_size=28, color="#505050").move_to(LEFT * 2.2),      # A only
+                CachedText("2", font_size=28, color="#505050").move_to(LEFT * 1.7),      # A only
+                CachedText("3", font_size=28, color="#505050").move_to(ORIGIN),          # Intersection
+                CachedText("4", font_size=28, color="#505050").move_to(RIGHT * 1.7)      # B only
             )
             
             # Transform to Venn diagram
@@ -1333,9 +1279,6 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
                 Write(label_B_venn),
                 run_time=2.5
             )
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 11.0)
         
         with self.voiceover(text="And the union of A and B would contain one, two, three, and four, and so has a cardinality of four. The intersection of A and B contains only three, and so has a cardinality of one. Now notice that the two on the left added together equals the two on the right. This isn't coincidental, but it's always true.") as tracker:
             # Cardinalities at the bottom - split into parts for precise targeting
@@ -1411,9 +1354,6 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
                 Create(underline_1),
                 run_time=3
             )
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 9.5)
 
         with self.voiceover(text="The identity is usually written as the cardinality of the union of A and B is equal to the cardinality of A plus the cardinality of B minus the cardinality of the intersection of A and B. Also, because we're taking away the cardinality of A intersect B, we can also write this as an inequality.") as tracker:
             # === TRANSITION TO CARDINALITY FORMULAS ===
@@ -1431,7 +1371,7 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             )
             
             # Title
-            title = MarkupText(
+            title = CachedMarkupText(
                 '<b><i>Union and Intersection Cardinality</i></b>',
                 color="#505050",
                 font_size=48,
@@ -1475,9 +1415,6 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             
             # Show second formula
             self.play(Write(formula2), run_time=2)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 8.0)
         
         # Clear everything before next section
         self.play(
@@ -1490,7 +1427,7 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
         """Show mixing unions and intersections with distributive property"""
         with self.voiceover(text="We also have a couple of identities involving both unions and intersections for three sets A, B, and C. Taking the union of A with the intersection of B and C is the same as if we take the union of A and B and the union of A and C separately and then taking the intersection.") as tracker:
             # Title
-            title = MarkupText(
+            title = CachedMarkupText(
                 '<b><i>Mixing Unions and Intersections</i></b>',
                 color="#505050",
                 font_size=48,
@@ -1522,13 +1459,13 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             circle_C = Circle(radius=1.2, color="#CC0000", stroke_width=4.0, fill_opacity=0)
             circle_C.move_to(RIGHT * 0.7 + DOWN * 1.8)  # Moved down more
             
-            label_A = Text("A", font_size=24, color="#00396B", font="sans-serif", weight=BOLD)
+            label_A = CachedText("A", font_size=24, color="#00396B", font="sans-serif", weight=BOLD)
             label_A.move_to(circle_A.get_center() + LEFT * 0.8)
             
-            label_B = Text("B", font_size=24, color="#008000", font="sans-serif", weight=BOLD)
+            label_B = CachedText("B", font_size=24, color="#008000", font="sans-serif", weight=BOLD)
             label_B.move_to(circle_B.get_center() + UP * 0.8)
             
-            label_C = Text("C", font_size=24, color="#CC0000", font="sans-serif", weight=BOLD)
+            label_C = CachedText("C", font_size=24, color="#CC0000", font="sans-serif", weight=BOLD)
             label_C.move_to(circle_C.get_center() + RIGHT * 0.8)
             
             venn_template = VGroup(circle_A, circle_B, circle_C, label_A, label_B, label_C)
@@ -1536,14 +1473,13 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             # === LEFT DIAGRAM: A ∪ (B ∩ C) ===
             left_diagram = venn_template.copy()
             left_diagram.move_to(LEFT * 2.5 + DOWN * 1.1)  # Moved down more
+            left_sets = dict(zip("ABC", left_diagram[:3]))
             
             # Show left diagram
             self.play(FadeIn(left_diagram), run_time=2)
             
             # Step 1: Show B ∩ C intersection only
-            bc_intersection = Intersection(left_diagram[1], left_diagram[2])  # B and C
-            bc_intersection.set_fill(color="#A0A0A0", opacity=0.6)
-            bc_intersection.set_stroke(width=0)
+            bc_intersection = venn_region("B ∩ C", left_sets, fill_color="#A0A0A0", fill_opacity=0.6, stroke_width=0)
             
             self.play(FadeIn(bc_intersection), run_time=2)
             
@@ -1551,14 +1487,12 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             filled_A_left = left_diagram[0].copy().set_fill(color="#A0A0A0", opacity=0.6)
             
             self.play(FadeIn(filled_A_left), run_time=2)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 10.5)
         
         with self.voiceover(text="On the right side, we start with A union B and then take the intersection of that with A union C.") as tracker:
             # === RIGHT DIAGRAM: (A ∪ B) ∩ (A ∪ C) ===
             right_diagram = venn_template.copy()
             right_diagram.move_to(RIGHT * 2.5 + DOWN * 1.1)
+            right_sets = dict(zip("ABC", right_diagram[:3]))
             
             # Show right diagram
             self.play(FadeIn(right_diagram), run_time=2)
@@ -1589,9 +1523,7 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             # Step 5: Show final intersection (A ∪ B) ∩ (A ∪ C) - should match left side
             # This will be A plus the intersection of B and C
             final_A_right = right_diagram[0].copy().set_fill(color="#A0A0A0", opacity=0.6)
-            final_bc_intersection = Intersection(right_diagram[1], right_diagram[2])  # B ∩ C
-            final_bc_intersection.set_fill(color="#A0A0A0", opacity=0.6)
-            final_bc_intersection.set_stroke(width=0)
+            final_bc_intersection = venn_region("B ∩ C", right_sets, fill_color="#A0A0A0", fill_opacity=0.6, stroke_width=0)
             
             self.play(
                 FadeOut(filled_A_final),
@@ -1601,9 +1533,6 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
                 FadeIn(final_bc_intersection),
                 run_time=2.5
             )
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 10.5)
 
         # Remove all gray colors from both diagrams
         self.play(
@@ -1632,16 +1561,12 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             # === LEFT SIDE: A ∩ (B ∪ C) ===
             
             # Step 1: Show B ∪ C on left (Image 1)
-            bc_union_left = Union(left_diagram[1], left_diagram[2])  # B ∪ C
-            bc_union_left.set_fill(color="#A0A0A0", opacity=0.6)
-            bc_union_left.set_stroke(width=0)
+            bc_union_left = venn_region("B ∪ C", left_sets, fill_color="#A0A0A0", fill_opacity=0.6, stroke_width=0)
             
             self.play(FadeIn(bc_union_left), run_time=1.5)
             
             # Step 2: Show A ∩ (B ∪ C) on left (Image 2)
-            a_intersect_bc_left = Intersection(left_diagram[0], Union(left_diagram[1], left_diagram[2]))
-            a_intersect_bc_left.set_fill(color="#A0A0A0", opacity=0.6)
-            a_intersect_bc_left.set_stroke(width=0)
+            a_intersect_bc_left = venn_region("A ∩ (B ∪ C)", left_sets, fill_color="#A0A0A0", fill_opacity=0.6, stroke_width=0)
             
             self.play(
                 FadeOut(bc_union_left),
@@ -1652,21 +1577,14 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             # === RIGHT SIDE: (A ∩ B) ∪ (A ∩ C) ===
             
             # Step 3: Show A ∩ B on right (Image 3)
-            ab_intersection_right = Intersection(right_diagram[0], right_diagram[1])  # A ∩ B
-            ab_intersection_right.set_fill(color="#A0A0A0", opacity=0.6)
-            ab_intersection_right.set_stroke(width=0)
+            ab_intersection_right = venn_region("A ∩ B", right_sets, fill_color="#A0A0A0", fill_opacity=0.6, stroke_width=0)
             
             self.play(FadeIn(ab_intersection_right), run_time=1.5)
             
             # Step 4: Add A ∩ C on right (Image 4) - union of both intersections
-            ac_intersection_right = Intersection(right_diagram[0], right_diagram[2])  # A ∩ C
-            ac_intersection_right.set_fill(color="#A0A0A0", opacity=0.6)
-            ac_intersection_right.set_stroke(width=0)
+            ac_intersection_right = venn_region("A ∩ C", right_sets, fill_color="#A0A0A0", fill_opacity=0.6, stroke_width=0)
             
             self.play(FadeIn(ac_intersection_right), run_time=1.5)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 9.0)
         
         # Clear everything before next section
         self.play(
@@ -1774,7 +1692,7 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             )
             
             # Conclusion text at bottom right
-            conclusion_text = MarkupText(
+            conclusion_text = CachedMarkupText(
                 '<b><i>distributive property</i></b>',
                 color="#505050",
                 font_size=32,
@@ -1798,9 +1716,6 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
                 Create(conclusion_underline),
                 run_time=2
             )
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 12.0)
         
         # Clear everything before next section
         self.play(
@@ -1817,14 +1732,14 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
         """Show real world example with cycling and distributive law"""
         with self.voiceover(text="You might be thinking at this point, how are these identities useful? So I'm what they call a fair weather cyclist. I only cycle in the summer or in the winter when it's warmer than twenty degrees celsius. Let's make sets of these potential days I could ride a bike. We have summer, winter, and those that are more than twenty degrees celsius.") as tracker:
             # Main statement text - split into two lines and positioned properly
-            statement_line1 = MarkupText(
+            statement_line1 = CachedMarkupText(
                 '<b><i>I only cycle in the summer or in the winter when it\'s</i></b>',
                 color="#505050",
                 font_size=32,
                 font="sans-serif"
             )
             
-            statement_line2 = MarkupText(
+            statement_line2 = CachedMarkupText(
                 '<b><i>warmer than 20°C</i></b>',
                 color="#505050",
                 font_size=32,
@@ -1849,7 +1764,7 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             )
             summer_circle.move_to(DOWN * 1.7 + LEFT * 1.5)  # Move down from center
             
-            summer_label = Text(
+            summer_label = CachedText(
                 "Summer",
                 font_size=20,
                 color="#00396B",
@@ -1876,7 +1791,7 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             # Position winter to the right and slightly up from summer
             winter_circle.move_to(summer_circle.get_center() + RIGHT * 2.2 + UP * 1.0)
             
-            winter_label = Text(
+            winter_label = CachedText(
                 "Winter",
                 font_size=20,
                 color="#008000",
@@ -1903,7 +1818,7 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             )
             summer_temp_circle.move_to(summer_circle.get_center() + RIGHT * 0.72 + UP * 0.3)
             
-            summer_temp_text = Text(
+            summer_temp_text = CachedText(
                 "> 20°C",
                 font_size=14,
                 color="#CC0000",
@@ -1921,7 +1836,7 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             )
             winter_temp_circle.move_to(winter_circle.get_center() + DOWN * 0.4 + LEFT * 0.9)
             
-            winter_temp_text = Text(
+            winter_temp_text = CachedText(
                 "> 20°C",
                 font_size=6,
                 color="#CC0000",
@@ -1938,9 +1853,6 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
                 Write(winter_temp_text),
                 run_time=2
             )
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 11.5)
 
         with self.voiceover(text="The shaded area is therefore the days that I can cycle, and we could write this as the union of summer and the intersection of winter with days warmer than twenty degrees.") as tracker:
             # === FILL SUMMER CIRCLE WITH GRAY ===
@@ -1979,9 +1891,6 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             # Show conclusion
             self.play(Write(conclusion_text), run_time=2.5)
             self.play(Create(conclusion_underline), run_time=1.5)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 5.0)
 
         with self.voiceover(text="We can use the distributive property we've just seen to work with the logic of a given statement.") as tracker:
             # === CLEAR EVERYTHING FROM SCREEN FIRST ===
@@ -1994,9 +1903,6 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
                 )),
                 run_time=1.5
             )
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 1.5)
         
         with self.voiceover(text="So if we have the set of days in the summer or winter and more than twenty degrees, the identity says that this must be the same as summer or winter and summer or more than twenty degrees.") as tracker:
             # === START FRESH WITH DISTRIBUTIVE LAW DEMONSTRATION ===
@@ -2013,7 +1919,7 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             self.play(Write(formula), run_time=2.5)
             
             # Real-world example line - centered
-            example_text = MarkupText(
+            example_text = CachedMarkupText(
                 '<b><i>Summer or ( Winter and > 20°C )</i></b>',
                 color="#505050",
                 font_size=36,
@@ -2033,7 +1939,7 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             equals_sign.move_to(UP * 0.5)
             
             # Distributive application - centered
-            distributive_result = MarkupText(
+            distributive_result = CachedMarkupText(
                 '<b><i>( Summer or Winter ) and ( Summer or > 20°C )</i></b>',
                 color="#505050",
                 font_size=36,
@@ -2044,13 +1950,10 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             # Show the transformation
             self.play(Write(equals_sign), run_time=1)
             self.play(Write(distributive_result), run_time=3)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 9.0)
         
         with self.voiceover(text="Which at first sight doesn't seem to make much sense, but notice that summer or winter is anytime, and summer or more than twenty degrees is the days when I cycle. We're ignoring other seasons in this example, and we're taking the intersection of these, so we get something like I cycle any day of the year but only when it's summer or more than twenty degrees, which actually makes sense and is another way of saying the original statement.") as tracker:
             # Final conclusion at the bottom - split into two lines and darker
-            final_conclusion_line1 = MarkupText(
+            final_conclusion_line1 = CachedMarkupText(
                 '<b><i>I cycle any day of the year but only when it\'s</i></b>',
                 color="#303030",  # Darker color
                 font_size=36,
@@ -2058,7 +1961,7 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             )
             final_conclusion_line1.move_to(DOWN * 2.0)
             
-            final_conclusion_line2 = MarkupText(
+            final_conclusion_line2 = CachedMarkupText(
                 '<b><i>summer or > 20°C.</i></b>',
                 color="#303030",  # Darker color  
                 font_size=36,
@@ -2072,9 +1975,6 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
                 Write(final_conclusion_line2),
                 run_time=3
             )
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 3.0)
         
         # Clear everything before next section
         self.play(
@@ -2101,7 +2001,7 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             self.play(Write(main_formula), run_time=2.5)
             
             # Proof header - LEFT ALIGNED
-            proof_header = MarkupText(
+            proof_header = CachedMarkupText(
                 '<b><i>Proof:</i></b>',
                 color="#505050",
                 font_size=36,
@@ -2112,13 +2012,10 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             
             # Show proof header
             self.play(Write(proof_header), run_time=1.5)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 4.0)
         
         with self.voiceover(text="We'll show first that A union B intersect C is a subset of A union B intersected with A union C, and that A union B intersected with A union C is a subset of A union B intersect C, which implies they're equal to one another.") as tracker:
             # "We will show" text - LEFT ALIGNED
-            we_will_show = MarkupText(
+            we_will_show = CachedMarkupText(
                 '<b><i>We will show</i></b>',
                 color="#505050",
                 font_size=36,
@@ -2144,7 +2041,7 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             self.play(Write(first_subset), run_time=2.5)
             
             # "and" text - LEFT ALIGNED
-            and_text = MarkupText(
+            and_text = CachedMarkupText(
                 '<b><i>and</i></b>',
                 color="#505050",
                 font_size=36,
@@ -2170,7 +2067,7 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             self.play(Write(second_subset), run_time=2.5)
             
             # "and so" text - LEFT ALIGNED
-            and_so_text = MarkupText(
+            and_so_text = CachedMarkupText(
                 '<b><i>and so</i></b>',
                 color="#505050",
                 font_size=36,
@@ -2194,9 +2091,6 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             
             # Show conclusion
             self.play(Write(conclusion_formula), run_time=2.5)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 12.0)
 
         with self.voiceover(text="First, suppose we have an element x which is in A union B intersect C. Well, it's either in A or it's in B intersect C, which would mean it's in both B and C. In either case, x is in both A union B and A union C, because if it's in A this is true, and if it's in B it's also in C so it's still true.") as tracker:
             # === CLEAR PREVIOUS PROOF STRUCTURE ===
@@ -2245,13 +2139,13 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             circle_C.move_to(RIGHT * 4.0 + DOWN * 2.1)
             
             # Labels for circles
-            label_A = Text("A", font_size=24, color="#00396B", font="sans-serif", weight=BOLD)
+            label_A = CachedText("A", font_size=24, color="#00396B", font="sans-serif", weight=BOLD)
             label_A.move_to(circle_A.get_center())
             
-            label_B = Text("B", font_size=24, color="#008000", font="sans-serif", weight=BOLD)
+            label_B = CachedText("B", font_size=24, color="#008000", font="sans-serif", weight=BOLD)
             label_B.move_to(circle_B.get_center() + UP * 0.8)
             
-            label_C = Text("C", font_size=24, color="#CC0000", font="sans-serif", weight=BOLD)
+            label_C = CachedText("C", font_size=24, color="#CC0000", font="sans-serif", weight=BOLD)
             label_C.move_to(circle_C.get_center() + DOWN * 0.8)
             
             # Create circles and labels
@@ -2271,7 +2165,7 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             filled_A = circle_A.copy().set_fill(color="#A0A0A0", opacity=0.6)
             
             # Fill B ∩ C intersection with gray
-            bc_intersection = Intersection(circle_B, circle_C)
+            bc_intersection = VennIntersection(circle_B, circle_C)
             bc_intersection.set_fill(color="#A0A0A0", opacity=0.6)
             bc_intersection.set_stroke(width=0)
             
@@ -2320,9 +2214,6 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
                 Create(arrow_to_BC),
                 run_time=2.5
             )
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 13.0)
 
         with self.voiceover(text="So this means that A union B intersect C, the thing we started with, is a subset of A union B intersected with A union C, since we've shown any element of the left hand side is an element of the right hand side.") as tracker:
             # === FADE OUT VENN DIAGRAM ===
@@ -2369,9 +2260,6 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             # Show conclusion and underline
             self.play(Write(conclusion_subset), run_time=2.5)
             self.play(Create(blue_underline), run_time=1.5)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 6.5)
 
         with self.voiceover(text="Now suppose x is in A union B intersect with A union C. Then x is in both A union B and A union C. If x is not in A, then x must be in both B and C, so it must be in the intersection of B and C. Otherwise x is in A, so x is in the union of A and B intersect C. Which means A union B intersect A union C is a subset of A union B intersect C.") as tracker:
             # === CLEAR EVERYTHING FROM SCREEN ===
@@ -2422,13 +2310,13 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             circle_C_new.move_to(RIGHT * 4.0 + DOWN * 2.1)
             
             # Labels for circles
-            label_A_new = Text("A", font_size=24, color="#00396B", font="sans-serif", weight=BOLD)
+            label_A_new = CachedText("A", font_size=24, color="#00396B", font="sans-serif", weight=BOLD)
             label_A_new.move_to(circle_A_new.get_center())
             
-            label_B_new = Text("B", font_size=24, color="#008000", font="sans-serif", weight=BOLD)
+            label_B_new = CachedText("B", font_size=24, color="#008000", font="sans-serif", weight=BOLD)
             label_B_new.move_to(circle_B_new.get_center() + UP * 0.8)
             
-            label_C_new = Text("C", font_size=24, color="#CC0000", font="sans-serif", weight=BOLD)
+            label_C_new = CachedText("C", font_size=24, color="#CC0000", font="sans-serif", weight=BOLD)
             label_C_new.move_to(circle_C_new.get_center() + DOWN * 0.8)
             
             # Create circles and labels
@@ -2471,7 +2359,7 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             circle_C_empty = Circle(radius=1.2, color="#CC0000", stroke_width=4.0, fill_opacity=0)
             circle_C_empty.move_to(RIGHT * 4.0 + DOWN * 2.1)
             
-            bc_intersection_new = Intersection(circle_B_new, circle_C_new)
+            bc_intersection_new = VennIntersection(circle_B_new, circle_C_new)
             bc_intersection_new.set_fill(color="#A0A0A0", opacity=0.9)
             bc_intersection_new.set_stroke(width=0)
             
@@ -2552,9 +2440,6 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             # Show final conclusion and underline
             self.play(Write(final_subset_conclusion), run_time=2.5)
             self.play(Create(final_blue_underline), run_time=1.5)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 18.5)
 
         with self.voiceover(text="If A union B intersect C is a subset of A union B intersected with A union C, and A union B intersected with A union C is a subset of A union B intersect C, then A union B intersect C equals A union B intersected with A union C.") as tracker:
             # === CLEAR EVERYTHING FROM SCREEN ===
@@ -2603,9 +2488,6 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             
             # Show then statement
             self.play(Write(then_statement), run_time=2.5)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 7.5)
         
         # Clear everything before next section
         self.play(
@@ -2618,7 +2500,7 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
         """Show shirts Venn diagram example with distributive law"""
         with self.voiceover(text="Now consider the statement 'I only wear white or blue shirts.' Here we have three sets: shirts, blue clothes, and white clothes. And for specifically blue and white shirts, we take the intersection of the union of blue and white clothes with shirts.") as tracker:
             # Statement at the top
-            statement = MarkupText(
+            statement = CachedMarkupText(
                 '<b><i>I only wear white or blue shirts.</i></b>',
                 color="#505050",
                 font_size=36,
@@ -2638,7 +2520,7 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             )
             shirts_circle.move_to(UP * 0.8)
             
-            shirts_label = Text(
+            shirts_label = CachedText(
                 "Shirts",
                 font_size=32,
                 color="#008000",
@@ -2664,8 +2546,8 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             white_circle.move_to(DOWN * 0.8 + RIGHT * 1.2)
             
             white_label = VGroup(
-                Text("White", font_size=24, color="#CC0000", font="sans-serif", weight=BOLD),
-                Text("clothes", font_size=24, color="#CC0000", font="sans-serif", weight=BOLD)
+                CachedText("White", font_size=24, color="#CC0000", font="sans-serif", weight=BOLD),
+                CachedText("clothes", font_size=24, color="#CC0000", font="sans-serif", weight=BOLD)
             )
             white_label.arrange(DOWN, buff=0.1)
             white_label.move_to(white_circle.get_center() + DOWN * 0.5)
@@ -2687,8 +2569,8 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             blue_circle.move_to(DOWN * 0.8 + LEFT * 1.2)
             
             blue_label = VGroup(
-                Text("Blue", font_size=24, color="#00396B", font="sans-serif", weight=BOLD),
-                Text("clothes", font_size=24, color="#00396B", font="sans-serif", weight=BOLD)
+                CachedText("Blue", font_size=24, color="#00396B", font="sans-serif", weight=BOLD),
+                CachedText("clothes", font_size=24, color="#00396B", font="sans-serif", weight=BOLD)
             )
             blue_label.arrange(DOWN, buff=0.1)
             blue_label.move_to(blue_circle.get_center() + DOWN * 0.5)
@@ -2702,12 +2584,12 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             
             # === FILL INTERSECTION AREAS WITH GRAY ===
             # Shirts ∩ White clothes
-            shirts_white_intersection = Intersection(shirts_circle, white_circle)
+            shirts_white_intersection = VennIntersection(shirts_circle, white_circle)
             shirts_white_intersection.set_fill(color="#A0A0A0", opacity=0.6)
             shirts_white_intersection.set_stroke(width=0)
             
             # Shirts ∩ Blue clothes
-            shirts_blue_intersection = Intersection(shirts_circle, blue_circle)
+            shirts_blue_intersection = VennIntersection(shirts_circle, blue_circle)
             shirts_blue_intersection.set_fill(color="#A0A0A0", opacity=0.6)
             shirts_blue_intersection.set_stroke(width=0)
             
@@ -2728,9 +2610,6 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             
             # Show formula
             self.play(Write(formula), run_time=2.5)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 14.5)
 
         with self.voiceover(text="Like before, we can use the distributive rule to play around with the logic. So shirts and blue or white becomes blue shirts or white shirts.") as tracker:
             # === CLEAR VENN DIAGRAM AND TRANSITION TO DISTRIBUTIVE LAW ===
@@ -2762,7 +2641,7 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             self.play(Write(distributive_formula), run_time=2.5)
             
             # Real-world example line
-            shirts_example = MarkupText(
+            shirts_example = CachedMarkupText(
                 '<b><i>Shirts and ( Blue or white )</i></b>',
                 color="#505050",
                 font_size=36,
@@ -2782,7 +2661,7 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             equals_sign.move_to(DOWN * 0.2)
             
             # Distributive application
-            distributive_result = MarkupText(
+            distributive_result = CachedMarkupText(
                 '<b><i>( Blue shirts ) or ( White shirts )</i></b>',
                 color="#505050",
                 font_size=36,
@@ -2793,13 +2672,10 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             # Show the transformation
             self.play(Write(equals_sign), run_time=1)
             self.play(Write(distributive_result), run_time=3)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 9.0)
         
         with self.voiceover(text="This can now be interpreted as 'I only wear blue shirts or white shirts.' It doesn't feel too different to the original statement, but again it's quite satisfying that it comes straight out of the set theoretic rules.") as tracker:
             # Final conclusion at the bottom - in quotes and darker
-            final_conclusion = MarkupText(
+            final_conclusion = CachedMarkupText(
                 '<b><i>"I only wear blue shirts or white shirts"</i></b>',
                 color="#303030",  # Darker color
                 font_size=36,
@@ -2809,9 +2685,6 @@ class UnionAndIntersectionWithVoiceover(VoiceoverScene):
             
             # Show the conclusion
             self.play(Write(final_conclusion), run_time=3)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 3.0)
         
         # Clear everything before ending
         self.play(
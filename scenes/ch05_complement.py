@@ -1,33 +1,47 @@
 from manim import *
-from manim_voiceover import VoiceoverScene
-from manim_voiceover.services.gtts import GTTSService
 
-class TheComplementWithVoiceover(VoiceoverScene):
+from scenes.base import ChapterScene
+from scenes.speech import build_speech_service
+from scenes.text_cache import CachedMarkupText, CachedText
+from scenes.venn import VennDifference, VennUnion
+
+class TheComplementWithVoiceover(ChapterScene):
     def construct(self):
         """Main method that orchestrates the entire video with voiceover"""
         # Set up TTS service
-        self.set_speech_service(GTTSService(lang="en", tld="com"), create_subcaption=False)
+        self.set_speech_service(build_speech_service(), create_subcaption=False)
         
         # Set consistent background color for entire video
         self.camera.background_color = "#F0F0F0"
         
         # Execute all sections in sequence
+        self.next_section("show_title")
         self.show_title()
+        self.next_section("show_set_difference_introduction")
         self.show_set_difference_introduction()
+        self.next_section("show_set_difference_examples")
         self.show_set_difference_examples()
+        self.next_section("show_complement_definition")
         self.show_complement_definition()
+        self.next_section("show_universal_set_complement")
         self.show_universal_set_complement()
+        self.next_section("show_dice_complement_example")
         self.show_dice_complement_example()
+        self.next_section("show_complement_examples")
         self.show_complement_examples()
+        self.next_section("show_complement_predicate_negation")
         self.show_complement_predicate_negation()
+        self.next_section("show_properties_title")
         self.show_properties_title()
+        self.next_section("show_complement_properties_list")
         self.show_complement_properties_list()
+        self.next_section("show_complement_property_4")
         self.show_complement_property_4()
     
     def show_title(self):
         """Display the main title: The Complement"""
         # Create the "The Complement" title
-        complement_title = Text(
+        complement_title = CachedText(
             "The Complement",
             font_size=50,
             color=BLACK,
@@ -60,14 +74,14 @@ class TheComplementWithVoiceover(VoiceoverScene):
         """Show set difference introduction with Venn diagram"""
         with self.voiceover(text="The set-theoretic difference of two sets A and B is a set of all elements in A that aren't in B. It's usually denoted by A backslash B and can be thought of as like subtracting B from A.") as tracker:
             # Definition text at the top - split into two lines
-            definition_line1 = MarkupText(
+            definition_line1 = CachedMarkupText(
                 '<b><i>The set-theoretic difference of two sets A and B</i></b>',
                 color="#505050",
                 font_size=36,
                 font="sans-serif"
             )
             
-            definition_line2 = MarkupText(
+            definition_line2 = CachedMarkupText(
                 '<b><i>is the set of all elements in A that aren\'t in B.</i></b>',
                 color="#505050",
                 font_size=36,
@@ -104,10 +118,10 @@ class TheComplementWithVoiceover(VoiceoverScene):
             circle_B.move_to(RIGHT * 1.0 + DOWN * 1.7)
             
             # Labels
-            label_A = Text("A", font_size=32, color="#00396B", font="sans-serif", weight=BOLD)
+            label_A = CachedText("A", font_size=32, color="#00396B", font="sans-serif", weight=BOLD)
             label_A.move_to(circle_A.get_center() + LEFT * 0.5 + UP * 1.2)
             
-            label_B = Text("B", font_size=32, color="#008000", font="sans-serif", weight=BOLD)
+            label_B = CachedText("B", font_size=32, color="#008000", font="sans-serif", weight=BOLD)
             label_B.move_to(circle_B.get_center() + RIGHT * 0.5 + UP * 1.2)
             
             # Create circles and labels
@@ -122,15 +136,12 @@ class TheComplementWithVoiceover(VoiceoverScene):
             # === FILL A \ B (A minus intersection with B) ===
             
             # Create the difference A \ B
-            a_minus_b = Difference(circle_A, circle_B)
+            a_minus_b = VennDifference(circle_A, circle_B)
             a_minus_b.set_fill(color="#A0A0A0", opacity=0.6)
             a_minus_b.set_stroke(width=0)
             
             # Show the filled difference
             self.play(FadeIn(a_minus_b), run_time=2)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 9.0)
         
         with self.voiceover(text="We can write this formally as A backslash B equals the set of x in A such that x is not in B.") as tracker:
             # === ADD MATHEMATICAL FORMULA ===
@@ -144,9 +155,6 @@ class TheComplementWithVoiceover(VoiceoverScene):
             
             # Show the formula
             self.play(Write(formula), run_time=2.5)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 2.5)
         
         # Clear everything before next section
         self.play(
@@ -162,7 +170,7 @@ class TheComplementWithVoiceover(VoiceoverScene):
         """Show examples of set difference"""
         with self.voiceover(text="For example, if A equals a set containing one, two, three, four, and five, and B is the set containing two, four, six, and eight, then A minus B is the set containing one, three, and five, since we've removed the two and the four that were in B.") as tracker:
             # "For example:" header
-            example_header = MarkupText(
+            example_header = CachedMarkupText(
                 '<b><i>For example:</i></b>',
                 color="#505050",
                 font_size=36,
@@ -197,9 +205,6 @@ class TheComplementWithVoiceover(VoiceoverScene):
             
             # Show A \ B
             self.play(Write(a_minus_b), run_time=2)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 6.0)
         
         with self.voiceover(text="B minus A is six and eight, since we've again removed two and four.") as tracker:
             # B \ A result
@@ -213,9 +218,6 @@ class TheComplementWithVoiceover(VoiceoverScene):
             
             # Show B \ A
             self.play(Write(b_minus_a), run_time=2)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 2.0)
         
         # Clear everything before next section
         self.play(
@@ -228,14 +230,14 @@ class TheComplementWithVoiceover(VoiceoverScene):
         """Show complement definition with Venn diagram"""
         with self.voiceover(text="If B is a subset of A, the set-theoretic difference of A and B is called the complement of B with respect to A.") as tracker:
             # Definition text at the top - split into two lines
-            definition_line1 = MarkupText(
+            definition_line1 = CachedMarkupText(
                 '<b><i>If B ⊆ A, the set-theoretic difference of A and B is</i></b>',
                 color="#505050",
                 font_size=32,
                 font="sans-serif"
             )
             
-            definition_line2 = MarkupText(
+            definition_line2 = CachedMarkupText(
                 '<b><i>called the </i></b><u><b><i>complement</i></b></u><b><i> of B with respect to A.</i></b>',
                 color="#505050",
                 font_size=32,
@@ -250,9 +252,6 @@ class TheComplementWithVoiceover(VoiceoverScene):
             # Show definition text
             self.play(Write(definition_line1), run_time=2.5)
             self.play(Write(definition_line2), run_time=2.5)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 5.0)
         
         with self.voiceover(text="It's usually denoted with a superscript c above the subset B, or as C with B in brackets like a function. Why is this important enough to give it its own name? Well, it's kind of like a background to be the things outside of B in general.") as tracker:
             # === VENN DIAGRAM (IMAGE 1) ===
@@ -276,10 +275,10 @@ class TheComplementWithVoiceover(VoiceoverScene):
             circle_B.move_to(circle_A.get_center() + RIGHT * 0.5 + DOWN * 0.3)
             
             # Labels
-            label_A = Text("A", font_size=32, color="#00396B", font="sans-serif", weight=BOLD)
+            label_A = CachedText("A", font_size=32, color="#00396B", font="sans-serif", weight=BOLD)
             label_A.move_to(circle_A.get_center() + LEFT * 1.5 + UP * 0.8)
             
-            label_B = Text("B", font_size=32, color="#008000", font="sans-serif", weight=BOLD)
+            label_B = CachedText("B", font_size=32, color="#008000", font="sans-serif", weight=BOLD)
             label_B.move_to(circle_B.get_center())
             
             # Create circles and labels
@@ -292,7 +291,7 @@ class TheComplementWithVoiceover(VoiceoverScene):
             )
             
             # Fill the complement (A \ B) with gray
-            complement_region = Difference(circle_A, circle_B)
+            complement_region = VennDifference(circle_A, circle_B)
             complement_region.set_fill(color="#A0A0A0", opacity=0.9)
             complement_region.set_stroke(width=0)
             
@@ -323,7 +322,7 @@ class TheComplementWithVoiceover(VoiceoverScene):
             )
             
             # Alternative notation at bottom right
-            alternative_notation = MarkupText(
+            alternative_notation = CachedMarkupText(
                 '<i>Can be written C(B)</i>',
                 color="#8B4B8B",  # Purple/magenta color
                 font_size=28,
@@ -334,9 +333,6 @@ class TheComplementWithVoiceover(VoiceoverScene):
             
             # Show alternative notation
             self.play(Write(alternative_notation), run_time=2)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 8.5)
         
         # Clear everything before next section
         self.play(
@@ -353,7 +349,7 @@ class TheComplementWithVoiceover(VoiceoverScene):
         """Show universal set and complement"""
         with self.voiceover(text="Here is where we introduce the universal set. The universal set U is a set of all elements that are relevant for some given topic of interest.") as tracker:
             # Definition at the top
-            definition = MarkupText(
+            definition = CachedMarkupText(
                 '<b><i>The universal set (U) is the set of all elements.</i></b>',
                 color="#505050",
                 font_size=32,
@@ -378,7 +374,7 @@ class TheComplementWithVoiceover(VoiceoverScene):
             universal_rect.move_to(DOWN * 0.3)
             
             # Label U
-            label_U = Text("U", font_size=32, color="#00396B", font="sans-serif", weight=BOLD)
+            label_U = CachedText("U", font_size=32, color="#00396B", font="sans-serif", weight=BOLD)
             label_U.move_to(universal_rect.get_corner(UP + LEFT) + DOWN * 0.3 + RIGHT * 0.3)
             
             # Show rectangle and U label first
@@ -387,9 +383,6 @@ class TheComplementWithVoiceover(VoiceoverScene):
                 Write(label_U),
                 run_time=2
             )
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 6.5)
         
         with self.voiceover(text="If our set A isn't the subset of something specific, we usually assume the complement of A is the universal set, and what that universal set is depends on context.") as tracker:
             # === STEP 2: ADD CIRCLE A ===
@@ -404,7 +397,7 @@ class TheComplementWithVoiceover(VoiceoverScene):
             circle_A.move_to(universal_rect.get_center() + RIGHT * 1.3 + DOWN * 0.4)
             
             # Label A
-            label_A = Text("A", font_size=28, color="#008000", font="sans-serif", weight=BOLD)
+            label_A = CachedText("A", font_size=28, color="#008000", font="sans-serif", weight=BOLD)
             label_A.move_to(circle_A.get_center())
             
             # Show circle A
@@ -417,7 +410,7 @@ class TheComplementWithVoiceover(VoiceoverScene):
             # === STEP 3: FILL COMPLEMENT REGION WITH GRAY ===
             
             # Create complement region (rectangle minus circle)
-            complement_region = Difference(universal_rect, circle_A)
+            complement_region = VennDifference(universal_rect, circle_A)
             complement_region.set_fill(color="#A0A0A0", opacity=0.6)
             complement_region.set_stroke(width=0)
             
@@ -446,21 +439,18 @@ class TheComplementWithVoiceover(VoiceoverScene):
                 Create(arrow_to_complement),
                 run_time=2
             )
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 8.0)
         
         with self.voiceover(text="This quote from The Foundations of Mathematics by Stewart and Tall sums it up nicely: In a discussion about dogs, when thinking about all non-sheepdogs, it's pointless to worry about camels.") as tracker:
             # === STEP 5: HUMOROUS QUOTE AT BOTTOM ===
             
-            quote_line1 = MarkupText(
+            quote_line1 = CachedMarkupText(
                 '<i>"In a discussion about dogs, when thinking about all</i>',
                 color="#505050",
                 font_size=32,
                 font="sans-serif"
             )
             
-            quote_line2 = MarkupText(
+            quote_line2 = CachedMarkupText(
                 '<i>non-sheepdogs, it\'s pointless to worry about camels"</i>',
                 color="#505050",
                 font_size=32,
@@ -475,9 +465,6 @@ class TheComplementWithVoiceover(VoiceoverScene):
             # Show quote
             self.play(Write(quote_line1), run_time=2.5)
             self.play(Write(quote_line2), run_time=2.5)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 5.0)
         
         # Clear everything before next section
         self.play(
@@ -522,14 +509,14 @@ class TheComplementWithVoiceover(VoiceoverScene):
         """Show dice complement example with Venn diagram"""
         with self.voiceover(text="Imagine we're throwing two dice. Let A be the set of outcomes of rolling a pair of dice in which both dice show the same number. A sensible universal set in this case would be the set of all possible outcomes of rolling two dice.") as tracker:
             # Definition text at the top - split into two lines
-            definition_line1 = MarkupText(
+            definition_line1 = CachedMarkupText(
                 '<b><i>Let A be the set of outcomes of rolling a pair of</i></b>',
                 color="#505050",
                 font_size=32,
                 font="sans-serif"
             )
             
-            definition_line2 = MarkupText(
+            definition_line2 = CachedMarkupText(
                 '<b><i>dice in which both dice show the same number.</i></b>',
                 color="#505050",
                 font_size=32,
@@ -562,7 +549,7 @@ class TheComplementWithVoiceover(VoiceoverScene):
             self.play(Create(set_A_boundary), run_time=2)
             
             # Label A positioned relative to rectangle
-            label_A = Text("A", font_size=28, color="#008000", font="sans-serif", weight=BOLD)
+            label_A = CachedText("A", font_size=28, color="#008000", font="sans-serif", weight=BOLD)
             label_A.move_to(set_A_boundary.get_corner(UP + RIGHT) + LEFT * 0.4 + DOWN * 0.3)
             
             # Show label
@@ -595,9 +582,6 @@ class TheComplementWithVoiceover(VoiceoverScene):
             # Show each dice pair one by one
             for pair in dice_pairs:
                 self.play(FadeIn(pair), run_time=0.8)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 12.8)
 
         with self.voiceover(text="And the complement of A would be the outcomes where each die shows a different number.") as tracker:
             # === STEP 3: MOVE SET A TO RIGHT CENTER FIRST ===
@@ -656,7 +640,7 @@ class TheComplementWithVoiceover(VoiceoverScene):
             # === STEP 5: ADD LABEL U AND CREATE VGROUP ===
             
             # Label U
-            label_U = Text("U", font_size=32, color="#00396B", font="sans-serif", weight=BOLD)
+            label_U = CachedText("U", font_size=32, color="#00396B", font="sans-serif", weight=BOLD)
             label_U.move_to(universal_set_U.get_corner(UP + LEFT) + RIGHT * 0.4 + DOWN * 0.3)
             
             # Show label U
@@ -721,9 +705,6 @@ class TheComplementWithVoiceover(VoiceoverScene):
             # Update the universal group to include complement
             complement_group = VGroup(*complement_dice_objects)
             universal_group.add(complement_group)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 10.8)
         
         # Clear everything before next section
         self.play(
@@ -736,7 +717,7 @@ class TheComplementWithVoiceover(VoiceoverScene):
         """Show other examples of complements"""
         with self.voiceover(text="Here are some other examples of complements. The complement of the set of odd numbers is the even numbers, and the complement of the rational numbers is the set of irrational numbers.") as tracker:
             # Title at the top
-            title = MarkupText(
+            title = CachedMarkupText(
                 '<b><i>Some other examples of complements...</i></b>',
                 color="#505050",
                 font_size=36,
@@ -779,9 +760,6 @@ class TheComplementWithVoiceover(VoiceoverScene):
             
             # Show second example
             self.play(Write(example2), run_time=2.5)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 7.0)
         
         # Clear everything before next section
         self.play(
@@ -794,7 +772,7 @@ class TheComplementWithVoiceover(VoiceoverScene):
         """Show how complement negates the predicate"""
         with self.voiceover(text="Notice with the complement we often get something that feels like the opposite of the original set, and that's because the complement negates the predicate.") as tracker:
             # Title at the top
-            title = MarkupText(
+            title = CachedMarkupText(
                 '<b><i>The complement negates the predicate.</i></b>',
                 color="#505050",
                 font_size=32,
@@ -827,9 +805,6 @@ class TheComplementWithVoiceover(VoiceoverScene):
             # Show formulas
             self.play(Write(general_formula), run_time=2)
             self.play(Write(complement_formula), run_time=2)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 6.0)
         
         with self.voiceover(text="With our set builder notation, we have a set A which contains all x from some set B such that it fulfills some predicate P. Well, the complement of A, the things not in A, must by definition not satisfy P. So the complement of A is the elements x in B such that P isn't true.") as tracker:
             # === VENN DIAGRAM CIRCLES ===
@@ -899,15 +874,12 @@ class TheComplementWithVoiceover(VoiceoverScene):
             # === FILL COMPLEMENT REGION WITH GRAY ===
             
             # Create complement region (Animals - Dogs)
-            complement_region = Difference(animals_circle, dogs_circle)
+            complement_region = VennDifference(animals_circle, dogs_circle)
             complement_region.set_fill(color="#A0A0A0", opacity=0.6)
             complement_region.set_stroke(width=0)
             
             # Fill the complement area
             self.play(FadeIn(complement_region), run_time=2)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 10.0)
         
         with self.voiceover(text="For example, if A is the set of animals that are dogs, then the complement of A is animals that are not dogs.") as tracker:
             # === ADD COMPLEMENT EXAMPLE TEXT ===
@@ -937,9 +909,6 @@ class TheComplementWithVoiceover(VoiceoverScene):
             
             # Show complement arrow
             self.play(Create(complement_arrow), run_time=1.5)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 4.0)
         
         # Clear everything before next section
         self.play(
@@ -955,7 +924,7 @@ class TheComplementWithVoiceover(VoiceoverScene):
     def show_properties_title(self):
         """Display the properties title"""
         # Create the "Properties of Complements" title
-        properties_title = Text(
+        properties_title = CachedText(
             "Properties of Complements",
             font_size=50,
             color=BLACK,
@@ -990,7 +959,7 @@ class TheComplementWithVoiceover(VoiceoverScene):
             # === IMAGE 1: PROPERTIES LIST ===
             
             # Statement at the top
-            statement = MarkupText(
+            statement = CachedMarkupText(
                 '<b><i>Let A and B be subsets of the universal set U.</i></b>',
                 color="#505050",
                 font_size=32,
@@ -1013,9 +982,6 @@ class TheComplementWithVoiceover(VoiceoverScene):
             self.play(Write(statement), run_time=2)
             for prop in properties:
                 self.play(Write(prop), run_time=1.5)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 6.5)
         
         with self.voiceover(text="That's because taking the complement of A leaves all the things in U but not in A. Taking the complement again, we can see that all that's left in U but not in our current set is A.") as tracker:
             # === IMAGE 2: ADD UNIVERSAL SET U WITH CIRCLE A ===
@@ -1059,7 +1025,7 @@ class TheComplementWithVoiceover(VoiceoverScene):
             # === IMAGE 3: FILL U WITH GRAY, ADD A^c LABEL ===
             
             # Fill complement region
-            complement_region = Difference(universal_rect, circle_A)
+            complement_region = VennDifference(universal_rect, circle_A)
             complement_region.set_fill(color="#A0A0A0", opacity=0.6)
             complement_region.set_stroke(width=0)
             
@@ -1100,9 +1066,6 @@ class TheComplementWithVoiceover(VoiceoverScene):
                 ReplacementTransform(circle_A, filled_A),
                 run_time=2
             )
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 8.0)
         
         # Clear everything before next section
         self.play(
@@ -1160,20 +1123,17 @@ class TheComplementWithVoiceover(VoiceoverScene):
                 Write(label_U), Write(label_B), Write(label_A),
                 run_time=2.5
             )
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 2.5)
         
         with self.voiceover(text="Since everything in A is also in B, there are things in B that aren't in A. I'm assuming that they're not equal here. That means that these elements that are in B but not in A will turn up in the complement of A but not the complement of B. And so we end up with the complement of A containing everything in the complement of B and more.") as tracker:
             # === FILL B CIRCLE AND U RECTANGLE WITH SAME OPACITY ===
             
             # Fill B circle (temporary)
-            filled_B = Difference(circle_B, circle_A)  # B minus A to ensure A never gets filled
+            filled_B = VennDifference(circle_B, circle_A)  # B minus A to ensure A never gets filled
             filled_B.set_fill(color="#A0A0A0", opacity=0.4)
             filled_B.set_stroke(width=0)
             
             # Fill U rectangle (temporary)
-            filled_U_initial = Difference(universal_rect, Union(circle_A, circle_B))
+            filled_U_initial = VennDifference(universal_rect, VennUnion(circle_A, circle_B))
             filled_U_initial.set_fill(color="#A0A0A0", opacity=0.4)
             filled_U_initial.set_stroke(width=0)
             
@@ -1186,7 +1146,7 @@ class TheComplementWithVoiceover(VoiceoverScene):
             # === INCREASE ONLY RECTANGLE OPACITY (EXCLUDING CIRCLES) ===
             
             # Higher opacity for U area only (B^c area)
-            u_higher_opacity = Difference(universal_rect, Union(circle_A, circle_B))
+            u_higher_opacity = VennDifference(universal_rect, VennUnion(circle_A, circle_B))
             u_higher_opacity.set_fill(color="#A0A0A0", opacity=0.7)
             u_higher_opacity.set_stroke(width=0)
             
@@ -1241,9 +1201,6 @@ class TheComplementWithVoiceover(VoiceoverScene):
                 Create(ac_arrow), Create(bc_arrow),
                 run_time=2.5
             )
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 5.5)
         
         # Clear everything before ending
         self.play(
@@ -1,25 +1,30 @@
 from manim import *
-from manim_voiceover import VoiceoverScene
-from manim_voiceover.services.gtts import GTTSService
 
-class DeMorganLawsWithVoiceover(VoiceoverScene):
+from scenes.base import ChapterScene
+from scenes.speech import build_speech_service
+from scenes.text_cache import CachedMarkupText, CachedText
+
+class DeMorganLawsWithVoiceover(ChapterScene):
     def construct(self):
         """Main method that orchestrates the entire De Morgan's Laws video with voiceover"""
         # Set up TTS service
-        self.set_speech_service(GTTSService(lang="en", tld="com"), create_subcaption=False)
+        self.set_speech_service(build_speech_service(), create_subcaption=False)
         
         # Set consistent background color for entire video
         self.camera.background_color = "#F0F0F0"
         
         # Execute all sections in sequence
+        self.next_section("show_title")
         self.show_title()
+        self.next_section("show_laws_statement")
         self.show_laws_statement()
+        self.next_section("show_duality_principle")
         self.show_duality_principle()
     
     def show_title(self):
         """Display the main title: De Morgan's Laws"""
         # Create the "De Morgan's Laws" title
-        title = Text(
+        title = CachedText(
             "De Morgan's Laws",
             font_size=50,
             color=BLACK,
@@ -52,7 +57,7 @@ class DeMorganLawsWithVoiceover(VoiceoverScene):
         """Show De Morgan's Laws statement with examples"""
         with self.voiceover(text="We now have the famous De Morgan's laws. First, the complement of A union B is A complement intersect B complement. And second, the complement of A intersect B is A complement union B complement.") as tracker:
             # Title
-            title = Text(
+            title = CachedText(
                 "De Morgan's Laws",
                 font_size=50,
                 color=BLACK,
@@ -63,7 +68,7 @@ class DeMorganLawsWithVoiceover(VoiceoverScene):
             title.to_edge(UP, buff=1.0)
             
             # Condition statement
-            condition = MarkupText(
+            condition = CachedMarkupText(
                 '<b><i>If A and B are subsets of the universal set U</i></b>',
                 color="#505050",
                 font_size=32,
@@ -93,9 +98,6 @@ class DeMorganLawsWithVoiceover(VoiceoverScene):
             self.play(Write(condition), run_time=2)
             self.play(Write(law1), run_time=2)
             self.play(Write(law2), run_time=2)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 8.0)
 
         # Clear the condition and second law
         self.play(FadeOut(VGroup(condition, law2)), run_time=1)
@@ -116,13 +118,13 @@ class DeMorganLawsWithVoiceover(VoiceoverScene):
         """Helper method to show the animal example"""
         with self.voiceover(text="Let me show you some examples so you can see what's going on here. Let U be the set of all animals, and let A be the set of dogs and B be the set of cats.") as tracker:
             # Animal example setup - split into two lines
-            example_line1 = MarkupText(
+            example_line1 = CachedMarkupText(
                 '<b><i>Let U be the set of all animals. Let A be the set</i></b>',
                 color="#505050",
                 font_size=32,
                 font="sans-serif"
             )
-            example_line2 = MarkupText(
+            example_line2 = CachedMarkupText(
                 '<b><i>of Dogs and B be the set of Cats.</i></b>',
                 color="#505050",
                 font_size=32,
@@ -136,9 +138,6 @@ class DeMorganLawsWithVoiceover(VoiceoverScene):
             # Show animal example
             self.play(Write(example_line1), run_time=2)
             self.play(Write(example_line2), run_time=1.5)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 3.5)
         
         with self.voiceover(text="The De Morgan's laws say that the complement of dogs union cats is equal to dogs complement intersect cats complement.") as tracker:
             # Real-world formula - CENTERED
@@ -151,19 +150,16 @@ class DeMorganLawsWithVoiceover(VoiceoverScene):
 
             # Show real formula in center
             self.play(Write(real_formula), run_time=2)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 2.0)
         
         with self.voiceover(text="Animals that are neither dogs nor cats are not dogs and are not cats. You can see that this makes sense logically.") as tracker:
             # Quote explanation - split into two lines
-            quote_line1 = MarkupText(
+            quote_line1 = CachedMarkupText(
                 '<b><i>"Animals that are neither dogs nor cats are not</i></b>',
                 color="#505050",
                 font_size=32,
                 font="sans-serif"
             )
-            quote_line2 = MarkupText(
+            quote_line2 = CachedMarkupText(
                 '<b><i>dogs and are not cats"</i></b>',
                 color="#505050",
                 font_size=32,
@@ -177,9 +173,6 @@ class DeMorganLawsWithVoiceover(VoiceoverScene):
             # Add quote
             self.play(Write(quote_line1), run_time=2)
             self.play(Write(quote_line2), run_time=1.5)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 3.5)
 
         # Clear everything except title for next example
         self.play(
@@ -192,13 +185,13 @@ class DeMorganLawsWithVoiceover(VoiceoverScene):
         """Helper method to show the mathematical example"""
         with self.voiceover(text="To illustrate the second law, if U is the set of natural numbers, let A be the set of prime numbers and B be the set of x in the natural numbers such that x is less than one hundred.") as tracker:
             # New mathematical example setup - split into two lines
-            math_example_line1 = MarkupText(
+            math_example_line1 = CachedMarkupText(
                 '<b><i>Let U be the set ℕ, Let A be the set of prime</i></b>',
                 color="#505050",
                 font_size=32,
                 font="sans-serif"
             )
-            math_example_line2 = MarkupText(
+            math_example_line2 = CachedMarkupText(
                 '<b><i>numbers and B be the set { x ∈ ℕ | x &lt; 100 }.</i></b>',
                 color="#505050",
                 font_size=32,
@@ -212,9 +205,6 @@ class DeMorganLawsWithVoiceover(VoiceoverScene):
             # Show mathematical example
             self.play(Write(math_example_line1), run_time=2)
             self.play(Write(math_example_line2), run_time=1.5)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 3.5)
         
         with self.voiceover(text="Using the De Morgan's law, we get that the complement of prime and less than one hundred is equal to the complement of prime numbers or the complement of less than one hundred.") as tracker:
             # Second De Morgan's Law - CENTERED
@@ -247,25 +237,22 @@ class DeMorganLawsWithVoiceover(VoiceoverScene):
             # Show arrow and real formula
             self.play(Write(double_arrow), run_time=1)
             self.play(Write(math_real_formula), run_time=2)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 5.0)
         
         with self.voiceover(text="Remember, the complement is like changing true to not true. And so we get the set of numbers that are not prime and less than one hundred is the set of numbers that are either not prime or greater than one hundred. Notice that we're allowing numbers greater than one hundred, but only those that are not prime.") as tracker:
             # Quote explanation - split into three lines
-            quote_math_line1 = MarkupText(
+            quote_math_line1 = CachedMarkupText(
                 '<b><i>"The set of numbers that are not prime and less than</i></b>',
                 color="#505050",
                 font_size=32,
                 font="sans-serif"
             )
-            quote_math_line2 = MarkupText(
+            quote_math_line2 = CachedMarkupText(
                 '<b><i>100 is the set of numbers that are either not prime or</i></b>',
                 color="#505050",
                 font_size=32,
                 font="sans-serif"
             )
-            quote_math_line3 = MarkupText(
+            quote_math_line3 = CachedMarkupText(
                 '<b><i>greater than 100"</i></b>',
                 color="#505050",
                 font_size=32,
@@ -281,9 +268,6 @@ class DeMorganLawsWithVoiceover(VoiceoverScene):
             self.play(Write(quote_math_line1), run_time=2)
             self.play(Write(quote_math_line2), run_time=2)
             self.play(Write(quote_math_line3), run_time=1.5)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 5.5)
 
         # Clear everything except title before next section
         self.play(
@@ -302,7 +286,7 @@ class DeMorganLawsWithVoiceover(VoiceoverScene):
         """Show De Morgan's Duality Principle"""
         with self.voiceover(text="We've had a few examples so far of identities which still work when we switch the intersections and unions. This is a general rule that always works and is called the De Morgan duality principle.") as tracker:
             # Title
-            title = Text(
+            title = CachedText(
                 "De Morgan's Duality Principle",
                 font_size=50,
                 color=BLACK,
@@ -362,25 +346,22 @@ class DeMorganLawsWithVoiceover(VoiceoverScene):
             self.play(Write(distributive_right), run_time=2)
             self.play(Write(demorgan_left), run_time=2)
             self.play(Write(demorgan_right), run_time=2)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 9.0)
         
         with self.voiceover(text="Given any set-theoretic identity involving the union and the intersection, if the union and intersection are interchanged throughout, then the result will be another valid identity. So for all of these identities you've seen so far, they come in pairs. You'll be happy to know that you can just remember one of them and exchange the union and the intersections to get a second one.") as tracker:
             # Explanatory text at bottom - split into three lines
-            explanation_line1 = MarkupText(
+            explanation_line1 = CachedMarkupText(
                 '<b><i>Given any set-theoretic identity involving ∪ and ∩,</i></b>',
                 color="#505050",
                 font_size=32,
                 font="sans-serif"
             )
-            explanation_line2 = MarkupText(
+            explanation_line2 = CachedMarkupText(
                 '<b><i>if ∪ and ∩ are interchanged throughout, then the</i></b>',
                 color="#505050",
                 font_size=32,
                 font="sans-serif"
             )
-            explanation_line3 = MarkupText(
+            explanation_line3 = CachedMarkupText(
                 '<b><i>result will be another valid identity.</i></b>',
                 color="#505050",
                 font_size=32,
@@ -396,9 +377,6 @@ class DeMorganLawsWithVoiceover(VoiceoverScene):
             self.play(Write(explanation_line1), run_time=2)
             self.play(Write(explanation_line2), run_time=2)
             self.play(Write(explanation_line3), run_time=2)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 6.0)
         
         # Clear everything before ending
         self.play(
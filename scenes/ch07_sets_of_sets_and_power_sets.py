@@ -1,26 +1,36 @@
 from manim import *
-from manim_voiceover import VoiceoverScene
-from manim_voiceover.services.gtts import GTTSService
 
-class SetsOfSetsPowerSetsIndexedFamiliesWithVoiceover(VoiceoverScene):
+from scenes.base import ChapterScene
+from scenes.power_set import power_set_tex
+from scenes.speech import build_speech_service
+from scenes.text_cache import CachedMarkupText, CachedText
+
+# A module-level constant, so the batch LaTeX run and the identity check see the formula
+POWER_SET_EXAMPLE = power_set_tex([0, 1])
+
+class SetsOfSetsPowerSetsIndexedFamiliesWithVoiceover(ChapterScene):
     def construct(self):
         """Main method that orchestrates the entire Sets of Sets video with voiceover"""
         # Set up TTS service
-        self.set_speech_service(GTTSService(lang="en", tld="com"), create_subcaption=False)
+        self.set_speech_service(build_speech_service(), create_subcaption=False)
         
         # Set consistent background color for entire video
         self.camera.background_color = "#F0F0F0"
         
         # Execute all sections in sequence
+        self.next_section("show_title")
         self.show_title()
+        self.next_section("show_sets_example")
         self.show_sets_example()
+        self.next_section("show_power_set_definition")
         self.show_power_set_definition()
+        self.next_section("show_indexed_families")
         self.show_indexed_families()
     
     def show_title(self):
         """Display the main title: Sets of Sets"""
         # Create the "Sets of Sets" title
-        title = Text(
+        title = CachedText(
             "Sets of Sets",
             font_size=50,
             color=BLACK,
@@ -53,7 +63,7 @@ class SetsOfSetsPowerSetsIndexedFamiliesWithVoiceover(VoiceoverScene):
         """Show example of sets containing sets as elements"""
         with self.voiceover(text="The elements of a set may be sets themselves. If we have this set A, then the set containing zero is an element of A, but not zero on its own, since the elements of A are all sets.") as tracker:
             # Statement at the top
-            statement = MarkupText(
+            statement = CachedMarkupText(
                 '<b><i>The elements of a set may be sets themselves:</i></b>',
                 color="#505050",
                 font_size=32,
@@ -94,9 +104,6 @@ class SetsOfSetsPowerSetsIndexedFamiliesWithVoiceover(VoiceoverScene):
             # Show first two statements
             self.play(Write(statement1), run_time=1.5)
             self.play(Write(statement2), run_time=1.5)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 7.0)
 
         with self.voiceover(text="Here it becomes tricky to keep track of what's an element and what's a subset. The set containing zero isn't a subset of A, it's an element as we've seen already. In fact, the set containing the set containing zero is a subset of A, and it's important to really think about the difference in cases like this.") as tracker:
             statement3 = MathTex(
@@ -114,25 +121,22 @@ class SetsOfSetsPowerSetsIndexedFamiliesWithVoiceover(VoiceoverScene):
             statement4.move_to(RIGHT * 2.5 + DOWN * 0.8)
             
             # Create check marks using built-in Manim symbols
-            check1 = Text("✓", font_size=30, color=GREEN, weight=BOLD)
+            check1 = CachedText("✓", font_size=30, color=GREEN, weight=BOLD)
             check1.next_to(statement1, RIGHT, buff=0.5)
             
-            check2 = Text("✓", font_size=30, color=GREEN, weight=BOLD)
+            check2 = CachedText("✓", font_size=30, color=GREEN, weight=BOLD)
             check2.next_to(statement2, RIGHT, buff=0.5)
             
-            check3 = Text("✓", font_size=30, color=GREEN, weight=BOLD)
+            check3 = CachedText("✓", font_size=30, color=GREEN, weight=BOLD)
             check3.next_to(statement3, RIGHT, buff=0.5)
             
-            check4 = Text("✓", font_size=30, color=GREEN, weight=BOLD)
+            check4 = CachedText("✓", font_size=30, color=GREEN, weight=BOLD)
             check4.next_to(statement4, RIGHT, buff=0.5)
             
             # Show remaining statements and all checks
             self.play(Write(statement3), run_time=1.5)
             self.play(Write(statement4), run_time=1.5)
             self.play(FadeIn(VGroup(check1, check2, check3, check4)), run_time=2)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 5.0)
         
         # Clear everything before next section
         self.play(
@@ -148,7 +152,7 @@ class SetsOfSetsPowerSetsIndexedFamiliesWithVoiceover(VoiceoverScene):
         """Show power set definition and example"""
         with self.voiceover(text="The power set is a common thing to encounter and it contains all subsets of a given set. So let A be a set. The power set of A, P brackets A, contains all sets X such that X is a subset of A.") as tracker:
             # Title at the top
-            title = MarkupText(
+            title = CachedMarkupText(
                 '<b><i>The power set contains all subsets of a given set.</i></b>',
                 color="#505050",
                 font_size=32,
@@ -161,7 +165,7 @@ class SetsOfSetsPowerSetsIndexedFamiliesWithVoiceover(VoiceoverScene):
             self.play(Write(title), run_time=2)
             
             # "Let A be a set."
-            let_statement = MarkupText(
+            let_statement = CachedMarkupText(
                 '<b><i>Let A be a set.</i></b>',
                 color="#505050",
                 font_size=32,
@@ -185,7 +189,7 @@ class SetsOfSetsPowerSetsIndexedFamiliesWithVoiceover(VoiceoverScene):
             self.play(Write(power_set_definition), run_time=2)
             
             # "Power set of A" label
-            power_set_label = MarkupText(
+            power_set_label = CachedMarkupText(
                 '<b><i>"Power set of A"</i></b>',
                 color="#505050",
                 font_size=32,
@@ -206,13 +210,10 @@ class SetsOfSetsPowerSetsIndexedFamiliesWithVoiceover(VoiceoverScene):
             # Show arrow and label
             self.play(Create(arrow), run_time=1)
             self.play(Write(power_set_label), run_time=1.5)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 8.0)
         
-        with self.voiceover(text="So for A equals the set containing zero and one, the power set of A would contain the empty set, A itself, the set containing zero, and the set containing one.") as tracker:
+        with self.voiceover(text="So for A equals the set containing zero and one, the power set of A would contain the empty set, the set containing zero, the set containing one, and A itself.") as tracker:
             # Example setup
-            example_statement = MarkupText(
+            example_statement = CachedMarkupText(
                 '<b><i>For A = { 0, 1 },</i></b>',
                 color="#505050",
                 font_size=32,
@@ -226,7 +227,7 @@ class SetsOfSetsPowerSetsIndexedFamiliesWithVoiceover(VoiceoverScene):
             
             # Power set result - CENTERED
             power_set_result = MathTex(
-                r'P(A) = \{ \varnothing, \{ 0, 1 \}, \{0\}, \{1\} \}',
+                POWER_SET_EXAMPLE,
                 font_size=48,
                 color="#505050"
             )
@@ -234,9 +235,6 @@ class SetsOfSetsPowerSetsIndexedFamiliesWithVoiceover(VoiceoverScene):
             
             # Show result
             self.play(Write(power_set_result), run_time=2.5)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 4.0)
         
         # Clear everything before next section
         self.play(
@@ -252,7 +250,7 @@ class SetsOfSetsPowerSetsIndexedFamiliesWithVoiceover(VoiceoverScene):
         """Show indexed families of sets"""
         with self.voiceover(text="We also have what are called indexed families of sets. Essentially each element, which is a set itself, is indexed by a number and usually written as a subscript. So A being A sub i for i in the set one, two, three is saying that A contains three sets: A one, A two, and A three.") as tracker:
             # Title
-            title = Text(
+            title = CachedText(
                 "Indexed families of sets",
                 font_size=40,
                 color=BLACK,
@@ -266,7 +264,7 @@ class SetsOfSetsPowerSetsIndexedFamiliesWithVoiceover(VoiceoverScene):
             self.play(Write(title), run_time=2)
             
             # Subtitle
-            subtitle = MarkupText(
+            subtitle = CachedMarkupText(
                 '<b><i>Each element is indexed by a number</i></b>',
                 color="#505050",
                 font_size=32,
@@ -317,13 +315,10 @@ class SetsOfSetsPowerSetsIndexedFamiliesWithVoiceover(VoiceoverScene):
             self.play(Write(specific_example), run_time=2)
             self.play(Write(double_arrow), run_time=1)
             self.play(Write(equivalent_notation), run_time=2)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 9.0)
         
         with self.voiceover(text="And in some cases it might be easier to read if we package things up like this. If A is the set containing set zero, set zero and one, and set zero, one, and two, we can write this as A one, A two, and A three, where A one is the set containing zero, A two is a set containing zero and one, and A three is the set containing zero, one, and two.") as tracker:
             # Example text
-            example_text = MarkupText(
+            example_text = CachedMarkupText(
                 '<b><i>Let A = { {0}, {0, 1}, {0, 1, 2} }, we can write this as</i></b>',
                 color="#505050",
                 font_size=32,
@@ -345,8 +340,5 @@ class SetsOfSetsPowerSetsIndexedFamiliesWithVoiceover(VoiceoverScene):
             
             # Show indexed sets
             self.play(Write(indexed_sets), run_time=2.5)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 5.0)
         
         self.wait(2)
\ No newline at end of file
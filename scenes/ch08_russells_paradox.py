@@ -1,26 +1,33 @@
 from manim import *
-from manim_voiceover import VoiceoverScene
-from manim_voiceover.services.gtts import GTTSService
 
-class RussellsParadoxWithVoiceover(VoiceoverScene):
+from scenes.base import ChapterScene
+from scenes.speech import build_speech_service
+from scenes.svg_cache import CachedSVGMobject
+from scenes.text_cache import CachedText
+
+class RussellsParadoxWithVoiceover(ChapterScene):
     def construct(self):
         """Main method that orchestrates the entire Russell's Paradox video with voiceover"""
         # Set up TTS service
-        self.set_speech_service(GTTSService(lang="en", tld="com"), create_subcaption=False)
+        self.set_speech_service(build_speech_service(), create_subcaption=False)
         
         # Set consistent background color for entire video
         self.camera.background_color = "#F0F0F0"
         
         # Execute all sections in sequence
+        self.next_section("show_title")
         self.show_title()
+        self.next_section("show_visualization")
         self.show_visualization()
+        self.next_section("show_definition")
         self.show_definition()
+        self.next_section("show_naive_vs_axiomatic")
         self.show_naive_vs_axiomatic()
     
     def show_title(self):
         """Display the main title: Russell's Paradox"""
         # Create the "Russell's Paradox" title
-        title = Text(
+        title = CachedText(
             "Russell's Paradox",
             font_size=50,
             color=BLACK,
@@ -65,29 +72,29 @@ class RussellsParadoxWithVoiceover(VoiceoverScene):
             self.play(Create(large_circle), run_time=2)
             
             # Create simple geometric objects instead of SVGs for better compatibility
-            statue = SVGMobject("images/statue-of-liberty-svgrepo-com.svg").scale(0.3)
+            statue = CachedSVGMobject("images/statue-of-liberty-svgrepo-com.svg").scale(0.3)
             statue.move_to(UP * 1.7 + LEFT * 0.2)
-            statue_label = Text("🗽", font_size=20).move_to(statue.get_center())
+            statue_label = CachedText("🗽", font_size=20).move_to(statue.get_center())
             
-            carrot = SVGMobject("images/carrot-svgrepo-com.svg").scale(0.3)
+            carrot = CachedSVGMobject("images/carrot-svgrepo-com.svg").scale(0.3)
             carrot.move_to(UP * 0.8 + LEFT * 1.8)
-            carrot_label = Text("🥕", font_size=20).move_to(carrot.get_center())
+            carrot_label = CachedText("🥕", font_size=20).move_to(carrot.get_center())
             
-            bicycle = SVGMobject("images/bycicle-svgrepo-com.svg").scale(0.3)
+            bicycle = CachedSVGMobject("images/bycicle-svgrepo-com.svg").scale(0.3)
             bicycle.move_to(DOWN * 0.2 + LEFT * 1.5)
-            bicycle_label = Text("🚲", font_size=20).move_to(bicycle.get_center())
+            bicycle_label = CachedText("🚲", font_size=20).move_to(bicycle.get_center())
             
-            piano = SVGMobject("images/piano-svgrepo-com.svg").scale(0.3)
+            piano = CachedSVGMobject("images/piano-svgrepo-com.svg").scale(0.3)
             piano.move_to(UP * 0.7 + RIGHT * 0.6)
-            piano_label = Text("🎹", font_size=20).move_to(piano.get_center())
+            piano_label = CachedText("🎹", font_size=20).move_to(piano.get_center())
             
-            books = SVGMobject("images/books-svgrepo-com.svg").scale(0.3)
+            books = CachedSVGMobject("images/books-svgrepo-com.svg").scale(0.3)
             books.move_to(UP * 1.3 + RIGHT * 1.8)
-            books_label = Text("📚", font_size=20).move_to(books.get_center())
+            books_label = CachedText("📚", font_size=20).move_to(books.get_center())
             
-            palm_tree = SVGMobject("images/coconut-tree-svgrepo-com.svg").scale(0.3)
+            palm_tree = CachedSVGMobject("images/coconut-tree-svgrepo-com.svg").scale(0.3)
             palm_tree.move_to(DOWN * 1.5 + RIGHT * 0.8)
-            palm_tree_label = Text("🌴", font_size=20).move_to(palm_tree.get_center())
+            palm_tree_label = CachedText("🌴", font_size=20).move_to(palm_tree.get_center())
             
             # Group objects with their labels
             objects = [
@@ -109,9 +116,6 @@ class RussellsParadoxWithVoiceover(VoiceoverScene):
             
             # Show omega label
             self.play(Write(omega_label), run_time=1.5)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 7.0)
 
         with self.voiceover(text="Because omega contains everything and it itself is something, then we have this interesting property that omega contains itself. This leads to a kind of infinite regress of omegas within omegas.") as tracker:
             # Add "Ω ∈ Ω" text at the bottom first
@@ -159,9 +163,6 @@ class RussellsParadoxWithVoiceover(VoiceoverScene):
             
             # Show arrow
             self.play(Create(arrow), run_time=1)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 5.5)
         
         # Clear everything before next section
         all_objects = [large_circle, omega_label, omega_in_omega, small_circle, arrow] + objects + mini_objects
@@ -172,7 +173,7 @@ class RussellsParadoxWithVoiceover(VoiceoverScene):
         """Show mathematical definition and paradox explanation"""
         with self.voiceover(text="To avoid this, we might change the definition of omega and let omega be the set containing all sets that do not contain themselves.") as tracker:
             # Definition text at top
-            definition = Text(
+            definition = CachedText(
                 "Let Ω be the set containing all sets that do not contain \nthemselves",
                 font_size=32, 
                 color=BLACK
@@ -186,9 +187,6 @@ class RussellsParadoxWithVoiceover(VoiceoverScene):
             # Animation sequence
             self.play(Write(definition), run_time=2)
             self.play(Write(math_def), run_time=1.5)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 3.5)
 
         with self.voiceover(text="Now assume omega isn't a member of itself. By definition then it must contain itself. If it does contain itself, well it can't contain itself. This is known as Russell's paradox.") as tracker:
             # Small circle (left side)
@@ -218,7 +216,7 @@ class RussellsParadoxWithVoiceover(VoiceoverScene):
             in_label.move_to(large_circle.get_center() + UP * 0.6)
             
             # Paradox text in black with blue underline
-            paradox_text = Text(
+            paradox_text = CachedText(
                 "Russell's Paradox", 
                 font_size=36, 
                 color=BLACK,
@@ -248,9 +246,6 @@ class RussellsParadoxWithVoiceover(VoiceoverScene):
             # Reveal the paradox with blue underline
             self.play(Write(paradox_text), run_time=2)
             self.play(Create(paradox_underline), run_time=1)
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 9.0)
         
         # Clear everything before next section
         all_elements = [
@@ -264,7 +259,7 @@ class RussellsParadoxWithVoiceover(VoiceoverScene):
         """Show comparison between naive and axiomatic set theory"""
         with self.voiceover(text="In fact, this is less a problem with how we've built the set and more a problem of how we define what a set is in the first place. Naive set theory in general does not give any guidance on what constitutes a set. Mostly we don't need to worry about this, but as you've seen, it can lead to problems. Axiomatic set theory aims to navigate the paradoxes of naive set theory by providing a rigorous definition of what a set is in the form of a list of axioms - statements something must satisfy in order to be a set.") as tracker:
             # First text block about naive set theory
-            naive_text = Text(
+            naive_text = CachedText(
                 "Naive set theory in general does not give any\nguidance on what constitutes a set",
                 font_size=32,
                 color=BLACK,
@@ -273,7 +268,7 @@ class RussellsParadoxWithVoiceover(VoiceoverScene):
             naive_text.to_edge(UP, buff=1.5).to_edge(LEFT, buff=1)
             
             # Second text block about axiomatic set theory  
-            axiomatic_text = Text(
+            axiomatic_text = CachedText(
                 "Axiomatic set theory aims to navigate the paradoxes\nof naive set theory by providing a rigorous definition\nof what a set is.",
                 font_size=32,
                 color=BLACK,
@@ -287,8 +282,5 @@ class RussellsParadoxWithVoiceover(VoiceoverScene):
                 AddTextLetterByLetter(axiomatic_text, run_time=4, rate_func=rate_functions.linear),
                 lag_ratio=0.3
             )
-            
-            # Wait for remaining audio
-            self.safe_wait(tracker.duration - 7.0)
         
         self.wait(2)
\ No newline at end of file
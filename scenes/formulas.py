@@ -0,0 +1,43 @@
+"""
+Formulas built by helper functions, resolved without running the scenes.
+
+The batch LaTeX pre-compile and the identity check read formulas from the chapter
+source. Besides string literals they accept module-level constants assigned a
+literal or a call to one of FORMULA_BUILDERS with literal arguments, such as
+``POWER_SET = power_set_tex([0, 1])``.
+"""
+
+import ast
+
+from scenes.power_set import power_set_tex
+
+FORMULA_BUILDERS = {"power_set_tex": power_set_tex}
+
+def formula_constants(tree):
+    """Map the module-level names of a parsed module to the formulas they are assigned."""
+    constants = {}
+    for node in tree.body:
+        if not (isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name)):
+            continue
+        try:
+            value = formula_value(node.value, constants)
+        except (ValueError, TypeError, SyntaxError):
+            continue
+        if isinstance(value, str):
+            constants[node.targets[0].id] = value
+    return constants
+
+def formula_value(node, constants):
+    """
+    Evaluate a literal, a formula constant or a call to a formula builder.
+    Raises ValueError for anything that depends on runtime values.
+    """
+    if isinstance(node, ast.Name) and node.id in constants:
+        return constants[node.id]
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in FORMULA_BUILDERS:
+        args = [formula_value(arg, constants) for arg in node.args]
+        kwargs = {keyword.arg: formula_value(keyword.value, constants) for keyword in node.keywords if keyword.arg}
+        if len(kwargs) < len(node.keywords):
+            raise ValueError("formula depends on runtime values")
+        return FORMULA_BUILDERS[node.func.id](*args, **kwargs)
+    return ast.literal_eval(node)
@@ -0,0 +1,37 @@
+"""
+Power sets enumerated lazily, one subset at a time.
+
+A set of n elements has 2^n subsets, so nothing here builds them all up front:
+subsets() yields them one bitmask at a time, in plain binary order or in Gray-code
+order (each subset differs from the previous one by a single element), and
+power_set_tex() writes the power set out as LaTeX from that stream.
+"""
+
+ORDERS = ("binary", "gray")
+
+def subset_masks(n, order="binary"):
+    """Yield the 2^n subset bitmasks of an n-element set, bit i standing for element i."""
+    if order not in ORDERS:
+        raise ValueError(f"Unknown subset order {order!r}, expected one of {ORDERS}")
+    for i in range(1 << n):
+        yield i ^ (i >> 1) if order == "gray" else i
+
+def subset_of(elements, mask):
+    """The elements selected by a bitmask, in their original order."""
+    return tuple(element for i, element in enumerate(elements) if mask >> i & 1)
+
+def subsets(elements, order="binary"):
+    """Yield every subset of elements as a tuple, without building the power set."""
+    elements = list(elements)
+    for mask in subset_masks(len(elements), order):
+        yield subset_of(elements, mask)
+
+def subset_tex(subset):
+    r"""LaTeX of one subset, e.g. \{0, 1\} or \varnothing."""
+    if not subset:
+        return r"\varnothing"
+    return r"\{" + ", ".join(str(element) for element in subset) + r"\}"
+
+def power_set_tex(elements, name="A", order="binary"):
+    r"""LaTeX of a whole power set, e.g. P(A) = \{ \varnothing, \{0\}, \{1\}, \{0, 1\} \}."""
+    return rf"P({name}) = \{{ " + ", ".join(subset_tex(subset) for subset in subsets(elements, order)) + r" \}"
@@ -0,0 +1,369 @@
+"""Renderer pieces used by the chapter scenes."""
+
+import mmap
+import multiprocessing
+import os
+import queue
+from collections import deque
+from fractions import Fraction
+from pathlib import Path
+
+import av
+import numpy as np
+from manim import config
+from manim.camera.camera import Camera
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils.file_ops import is_gif_format, is_png_format, write_to_movie
+
+# Processes rasterizing the frames of one animation; unset or 1 renders serially
+RASTER_JOBS_ENV = "SET_THEORY_RASTER_JOBS"
+
+# Shorter animations are not worth a fork
+MIN_PARALLEL_FRAMES = 30
+
+# Frames the rasterizer may run ahead of the encoder when rendering serially
+RING_SLOTS = 4
+
+# Comma separated heights of extra renditions encoded from the same frames, e.g. "720,480"
+RENDITIONS_ENV = "SET_THEORY_RENDITIONS"
+
+def rendition_heights():
+    """
+    Heights of the extra renditions requested through SET_THEORY_RENDITIONS, largest first.
+    Renditions are H.264 copies of an opaque mp4/mov render; other output formats get none.
+    """
+    if (is_gif_format() or is_png_format() or config.transparent
+            or config.movie_file_extension not in (".mp4", ".mov")):
+        return []
+    heights = set()
+    for value in os.environ.get(RENDITIONS_ENV, "").split(","):
+        value = value.strip().removesuffix("p")
+        if value.isdigit() and 0 < int(value) < config.pixel_height:
+            heights.add(int(value))
+    return sorted(heights, reverse=True)
+
+def rendition_size(height):
+    """Width and height of a rendition, keeping the aspect ratio with even dimensions."""
+    width = round(config.pixel_width * height / config.pixel_height / 2) * 2
+    return width, height - height % 2
+
+def rendition_file(video_file, height):
+    """Where the rendition of a video at the given height is written, e.g. Scene_720p.mp4."""
+    video_file = Path(video_file)
+    return video_file.with_name(f"{video_file.stem}_{height}p{video_file.suffix}")
+
+def open_rendition(path, height, rate):
+    """Open an H.264 output like manim's partial movies, at a rendition's size."""
+    container = av.open(str(path), mode="w")
+    stream = container.add_stream("libx264", rate=rate, options={"crf": "23"})
+    stream.width, stream.height = rendition_size(height)
+    stream.pix_fmt = "yuv420p"
+    return container, stream
+
+def encode_to(container, stream, frames):
+    """Encode frames to a stream, or flush it when frames is None."""
+    for frame in frames if frames is not None else [None]:
+        for packet in stream.encode(frame):
+            container.mux(packet)
+
+def downscale_video(source, target, height):
+    """Re-encode a partial movie at a rendition's size, for animations manim took from its cache."""
+    with av.open(str(source)) as source_container:
+        source_stream = source_container.streams.video[0]
+        container, stream = open_rendition(target, height, source_stream.average_rate)
+        with container:
+            for frame in source_container.decode(source_stream):
+                frame = frame.reformat(width=stream.width, height=stream.height, format="yuv420p")
+                frame.pts = None
+                encode_to(container, stream, [frame])
+            encode_to(container, stream, None)
+
+class FrameRing:
+    """
+    Fixed pool of frame buffers, allocated once per render.
+    
+    The buffers live in one anonymous shared mapping, so processes forked after the
+    ring exists draw straight into the same pages the encoder reads. ``free`` holds
+    the indices of the buffers nobody is using.
+    """
+    
+    def __init__(self, shape, slots):
+        size = int(np.prod(shape))
+        self.memory = mmap.mmap(-1, size * slots)
+        self.frames = [np.ndarray(shape, dtype=np.uint8, buffer=self.memory, offset=i * size) for i in range(slots)]
+        self.free = queue.SimpleQueue()
+        for slot in range(slots):
+            self.free.put(slot)
+    
+    def acquire(self):
+        """Take a free buffer, waiting for the encoder to release one if needed."""
+        return self.free.get()
+    
+    def release(self, slot):
+        self.free.put(slot)
+
+class ChapterFileWriter(SceneFileWriter):
+    """
+    Scene file writer that encodes from a ring of frame buffers.
+    
+    Frames are copied into a FrameRing and queued for manim's own writer thread,
+    which converts and muxes them while the renderer already draws the next frame,
+    and hands each buffer back when it is done. With a bounded ring the rasterizer
+    can only run a few frames ahead, and no pixel array is allocated per frame.
+    Every partial movie is drained before it is closed.
+    
+    A wait over a frozen scene already arrives as one frame with a repeat count
+    (manim rasterizes it once). The stock writer converts that RGBA frame to the
+    stream's pixel format for every repeat; here it is converted once and only the
+    repeats are encoded, which costs little for an unchanged picture. Every frame is
+    still in the output. ``held_frames`` counts the repeats written this way.
+    
+    With SET_THEORY_RENDITIONS set, every frame is also downscaled and encoded to
+    one extra partial movie per rendition, and each rendition is combined with the
+    soundtrack like the main movie, so one pass over construct() yields them all.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.ring = None
+        self.encoder_error = None
+        self.renditions = []
+        self.held_frames = 0
+    
+    def frame_ring(self, shape):
+        """The ring of this render, created on first use for frames of the given shape."""
+        if self.ring is None:
+            self.ring = FrameRing(shape, max(RING_SLOTS, 2 * raster_jobs() + 2))
+        return self.ring
+    
+    def uses_ring(self):
+        """Whether write_frame copies frames into the ring, instead of queueing the array it gets."""
+        return write_to_movie() and not is_png_format()
+    
+    def submit(self, slot, num_frames=1):
+        """Queue a frame of the ring for the writer thread of the open partial movie."""
+        self.queue.put((num_frames, slot))
+    
+    def listen_and_write(self):
+        """
+        Writer thread: write queued frames in order, ring slots as well as the arrays
+        queued by the stock write_frame, and release the ring buffers.
+        """
+        while True:
+            num_frames, frame = self.queue.get()
+            try:
+                if frame is None:
+                    return
+                # After a failure the remaining frames are only released, drain() reports it
+                if self.encoder_error is None:
+                    self.encode_and_write_frame(self.ring.frames[frame] if isinstance(frame, int) else frame, num_frames)
+            except Exception as e:
+                self.encoder_error = e
+            finally:
+                if isinstance(frame, int):
+                    self.ring.release(frame)
+                self.queue.task_done()
+    
+    def drain(self):
+        """Wait until every queued frame is written, raising the writer thread's error if it had one."""
+        if getattr(self, "queue", None) is not None:
+            self.queue.join()
+        if self.encoder_error is not None:
+            error, self.encoder_error = self.encoder_error, None
+            raise error
+    
+    def write_frame(self, frame_or_renderer, num_frames=1):
+        if not self.uses_ring() or not isinstance(frame_or_renderer, np.ndarray):
+            super().write_frame(frame_or_renderer, num_frames)
+            return
+        
+        ring = self.frame_ring(frame_or_renderer.shape)
+        slot = ring.acquire()
+        np.copyto(ring.frames[slot], frame_or_renderer)
+        self.submit(slot, num_frames)
+    
+    def open_partial_movie_stream(self, file_path=None):
+        super().open_partial_movie_stream(file_path)
+        # Renditions follow the main movie's H.264 settings, transparent or WebM output has none
+        if self.video_stream.pix_fmt != "yuv420p":
+            return
+        rate = Fraction(config.frame_rate).limit_denominator(1001)
+        self.renditions = [
+            open_rendition(rendition_file(self.partial_movie_file_path, height), height, rate)
+            for height in rendition_heights()
+        ]
+    
+    def encode_and_write_frame(self, frame, num_frames):
+        if num_frames == 1 or self.video_stream.pix_fmt != "yuv420p":
+            super().encode_and_write_frame(frame, num_frames)
+        else:
+            held = av.VideoFrame.from_ndarray(frame, format="rgba").reformat(
+                width=self.video_stream.width,
+                height=self.video_stream.height,
+                format="yuv420p",
+            )
+            planes = held.to_ndarray()
+            # The encoder keeps a reference to its input, so every repeat needs its own frame
+            encode_to(
+                self.video_container,
+                self.video_stream,
+                (av.VideoFrame.from_ndarray(planes, format="yuv420p") for _ in range(num_frames)),
+            )
+            self.held_frames += num_frames - 1
+        if not self.renditions:
+            return
+        
+        rgba = av.VideoFrame.from_ndarray(frame, format="rgba")
+        for container, stream in self.renditions:
+            scaled = rgba.reformat(width=stream.width, height=stream.height, format="yuv420p")
+            if num_frames == 1:
+                encode_to(container, stream, [scaled])
+                continue
+            planes = scaled.to_ndarray()
+            encode_to(container, stream, (av.VideoFrame.from_ndarray(planes, format="yuv420p") for _ in range(num_frames)))
+    
+    def close_partial_movie_stream(self):
+        self.drain()
+        super().close_partial_movie_stream()
+        for container, stream in self.renditions:
+            encode_to(container, stream, None)
+            container.close()
+        self.renditions = []
+    
+    def rendition_partial(self, partial_file, height):
+        """The rendition of a partial movie, made from the movie itself if manim reused a cached one."""
+        rendition = rendition_file(partial_file, height)
+        if not rendition.exists():
+            downscale_video(partial_file, rendition, height)
+        return rendition
+    
+    def combine_to_movie(self):
+        super().combine_to_movie()
+        
+        # Combine each rendition's partial movies and soundtrack exactly like the main movie
+        movie_file, partial_files = self.movie_file_path, self.partial_movie_files
+        try:
+            for height in rendition_heights():
+                self.movie_file_path = rendition_file(movie_file, height)
+                self.partial_movie_files = [
+                    self.rendition_partial(partial_file, height) if partial_file else None
+                    for partial_file in partial_files
+                ]
+                super().combine_to_movie()
+        finally:
+            self.movie_file_path, self.partial_movie_files = movie_file, partial_files
+    
+class ChapterRenderer(CairoRenderer):
+    """Cairo renderer that hands its camera buffer to the frame ring without copying it first."""
+    
+    def render(self, scene, time, moving_mobjects):
+        self.update_frame(scene, moving_mobjects)
+        # The ring copies the frame before the next one is drawn over it; any other
+        # path queues the array itself for later, so it gets its own copy
+        writer = self.file_writer
+        ring = isinstance(writer, ChapterFileWriter) and writer.uses_ring()
+        self.add_frame(self.camera.pixel_array if ring else self.get_frame())
+    
+    def add_ring_frame(self, slot):
+        """add_frame for a frame already drawn into the writer's ring."""
+        self.time += 1 / self.camera.frame_rate
+        self.file_writer.submit(slot)
+
+def chapter_renderer(camera_class=Camera, skip_animations=False):
+    """Cairo renderer encoding through ChapterFileWriter."""
+    return ChapterRenderer(
+        file_writer_class=ChapterFileWriter,
+        camera_class=camera_class,
+        skip_animations=skip_animations,
+    )
+
+def raster_jobs():
+    """Number of frame rasterizing processes requested through SET_THEORY_RASTER_JOBS."""
+    try:
+        return max(1, int(os.environ.get(RASTER_JOBS_ENV, "1")))
+    except ValueError:
+        return 1
+
+def can_rasterize_in_parallel(scene, jobs):
+    """
+    Check whether the current play() is long enough to split and whether every frame
+    depends only on its time. Animations interpolate from their alpha alone, but
+    updaters accumulate state frame after frame and a stop condition can end the
+    play at any frame.
+    """
+    if not isinstance(scene.renderer, ChapterRenderer) or not isinstance(scene.renderer.file_writer, ChapterFileWriter):
+        return False
+    if not scene.renderer.file_writer.uses_ring():
+        return False
+    frames = scene.get_run_time(scene.animations) * scene.renderer.camera.frame_rate
+    if frames < max(MIN_PARALLEL_FRAMES, 2 * jobs) or scene.stop_condition is not None:
+        return False
+    return not any(mobject.updaters for mobject in scene.get_mobject_family_members())
+
+def rasterize_frames(scene, times, first, step, connection, ring):
+    """
+    Worker side: bring the scene to every step-th time from first on, draw it and
+    copy it into the ring buffer the parent sends, then acknowledge.
+    """
+    for t in times[first::step]:
+        scene.update_to_time(t)
+        scene.renderer.update_frame(scene, scene.moving_mobjects)
+        slot = connection.recv()
+        np.copyto(ring.frames[slot], scene.renderer.camera.pixel_array)
+        connection.send(slot)
+    connection.close()
+
+def play_frames_in_parallel(scene, time_progression, jobs):
+    """
+    Rasterize the frames of the current play() in forked processes and write them in order.
+    Process k draws frames k, k + jobs, k + 2 jobs, ... of the same animation from the
+    scene state at the start of the play, into ring buffers handed out by this process,
+    so the processes advance side by side while the encoder thread drains the ring.
+    """
+    times = np.asarray(time_progression.iterable)
+    writer = scene.renderer.file_writer
+    ring = writer.frame_ring(scene.renderer.camera.pixel_array.shape)
+    
+    # Frames handed out but not yet encoded; two buffers stay out of reach of the
+    # rasterizers so acquire() can only ever wait on the encoder
+    window = min(2 * jobs, len(ring.frames) - 2)
+    
+    # Fork with the encoder thread idle in its queue, not halfway through a frame. The
+    # children never touch the file writer or PyAV: they only draw into the ring and
+    # leave through os._exit, so no encoder or muxer state is flushed or freed twice
+    writer.drain()
+    context = multiprocessing.get_context("fork")
+    workers = []
+    for first in range(jobs):
+        connection, child_connection = context.Pipe()
+        process = context.Process(
+            target=rasterize_frames,
+            args=(scene, times, first, jobs, child_connection, ring),
+            daemon=True
+        )
+        process.start()
+        child_connection.close()
+        workers.append((process, connection))
+    
+    handed = deque()
+    try:
+        for i, _ in enumerate(time_progression):
+            while len(handed) < window and i + len(handed) < len(times):
+                slot = ring.acquire()
+                workers[(i + len(handed)) % jobs][1].send(slot)
+                handed.append(slot)
+            
+            process, connection = workers[i % jobs]
+            try:
+                connection.recv()
+            except EOFError:
+                raise RuntimeError(f"Frame rasterizer {i % jobs} exited with code {process.exitcode}") from None
+            scene.renderer.add_ring_frame(handed.popleft())
+    finally:
+        for process, connection in workers:
+            connection.close()
+            process.join()
+    
+    # Leave this process in the state of the last frame, as a serial play would
+    scene.update_to_time(times[-1])
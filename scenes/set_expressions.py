@@ -0,0 +1,164 @@
+r"""
+Set expressions such as "A ∩ (B ∪ C)" or "(A \cup B)^c", evaluated over Venn regions.
+
+A diagram of n sets has 2^n regions, one per membership combination: region m
+lies inside set i exactly when bit i of m is set. An expression evaluates to a
+truth table over all regions at once with NumPy, or to the equivalent bitmask.
+
+Operators, from loosest to tightest binding:
+    ∪ \cup   \ \setminus -   Δ \triangle \Delta      (left to right)
+    ∩ \cap
+    ᶜ ^c ^{c} '                                           (postfix complement)
+∅, \varnothing and \emptyset are the empty set; the universe (U by default)
+is every region, so complements are taken inside it.
+"""
+
+import re
+from functools import lru_cache
+
+import numpy as np
+
+TOKEN_PATTERN = re.compile(
+    r"\s*(?:(?P<name>[A-Za-z][A-Za-z0-9_]*)"
+    r"|(?P<op>\\cup|\\cap|\\setminus|\\triangle|\\Delta|\\varnothing|\\emptyset|\^\{c\}|\^c|[∪∩\\\-Δᶜ'∅()]))"
+)
+
+OPERATORS = {
+    "∪": "union", "\\cup": "union",
+    "∩": "intersection", "\\cap": "intersection",
+    "\\": "difference", "\\setminus": "difference", "-": "difference",
+    "Δ": "symmetric_difference", "\\triangle": "symmetric_difference", "\\Delta": "symmetric_difference",
+    "ᶜ": "complement", "^c": "complement", "^{c}": "complement", "'": "complement",
+    "∅": "empty", "\\varnothing": "empty", "\\emptyset": "empty",
+    "(": "(", ")": ")",
+}
+
+LOOSE_OPERATORS = {"union", "difference", "symmetric_difference"}
+
+def tokenize(text):
+    """Split an expression into ("name", name) and ("op", operator) tokens."""
+    tokens = []
+    position = 0
+    text = text.rstrip()
+    while position < len(text):
+        match = TOKEN_PATTERN.match(text, position)
+        if match is None or match.end() == position:
+            raise ValueError(f"Unexpected {text[position:].strip()[:10]!r} in set expression {text!r}")
+        if match.group("name"):
+            tokens.append(("name", match.group("name")))
+        else:
+            tokens.append(("op", OPERATORS[match.group("op")]))
+        position = match.end()
+    return tokens
+
+@lru_cache(maxsize=None)
+def parse_expression(text):
+    """
+    Parse a set expression into nested tuples: ("set", name), ("empty",),
+    ("complement", x) and (operator, left, right).
+    """
+    tokens = tokenize(text)
+    position = 0
+    
+    def peek():
+        return tokens[position] if position < len(tokens) else (None, None)
+    
+    def expect(token):
+        nonlocal position
+        if peek() != token:
+            raise ValueError(f"Expected {token[1]!r} in set expression {text!r}")
+        position += 1
+    
+    def expression():
+        nonlocal position
+        tree = term()
+        while peek()[0] == "op" and peek()[1] in LOOSE_OPERATORS:
+            operator = peek()[1]
+            position += 1
+            tree = (operator, tree, term())
+        return tree
+    
+    def term():
+        nonlocal position
+        tree = factor()
+        while peek() == ("op", "intersection"):
+            position += 1
+            tree = ("intersection", tree, factor())
+        return tree
+    
+    def factor():
+        nonlocal position
+        tree = atom()
+        while peek() == ("op", "complement"):
+            position += 1
+            tree = ("complement", tree)
+        return tree
+    
+    def atom():
+        nonlocal position
+        kind, value = peek()
+        if kind == "name":
+            position += 1
+            return ("set", value)
+        if (kind, value) == ("op", "empty"):
+            position += 1
+            return ("empty",)
+        if (kind, value) == ("op", "("):
+            position += 1
+            tree = expression()
+            expect(("op", ")"))
+            return tree
+        raise ValueError(f"Expected a set in set expression {text!r}")
+    
+    tree = expression()
+    if position != len(tokens):
+        raise ValueError(f"Unexpected {tokens[position][1]!r} in set expression {text!r}")
+    return tree
+
+def expression_sets(tree, universe="U"):
+    """Names of the sets used in a parsed expression, in order of appearance."""
+    if tree[0] == "set":
+        return [] if tree[1] == universe else [tree[1]]
+    names = []
+    for child in tree[1:]:
+        names.extend(name for name in expression_sets(child, universe) if name not in names)
+    return names
+
+def membership(names):
+    """Truth table of every set: membership[name][m] tells whether region m lies in it."""
+    masks = np.arange(1 << len(names))
+    return {name: (masks >> i) & 1 == 1 for i, name in enumerate(names)}
+
+def evaluate(tree, members, universe="U"):
+    """Evaluate a parsed expression on the membership tables of its sets."""
+    kind = tree[0]
+    if kind == "set":
+        if tree[1] == universe:
+            return np.ones_like(next(iter(members.values())))
+        if tree[1] not in members:
+            raise ValueError(f"Set {tree[1]!r} is not part of the diagram")
+        return members[tree[1]]
+    if kind == "empty":
+        return np.zeros_like(next(iter(members.values())))
+    if kind == "complement":
+        return ~evaluate(tree[1], members, universe)
+    
+    left = evaluate(tree[1], members, universe)
+    right = evaluate(tree[2], members, universe)
+    if kind == "union":
+        return left | right
+    if kind == "intersection":
+        return left & right
+    if kind == "difference":
+        return left & ~right
+    return left ^ right
+
+def truth_table(expression, names, universe="U"):
+    """Truth table over the 2^n regions of the named sets for an expression string."""
+    # Even an expression of only U or ∅ has a region outside every set
+    members = membership(names) if names else {None: np.array([False])}
+    return evaluate(parse_expression(expression), members, universe)
+
+def region_mask(expression, names, universe="U"):
+    """The regions selected by an expression, as a bitmask with bit m for region m."""
+    return sum(1 << int(m) for m in np.flatnonzero(truth_table(expression, names, universe)))
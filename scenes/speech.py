@@ -0,0 +1,162 @@
+"""Pluggable text-to-speech backends behind a persistent on-disk audio cache."""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import wave
+from pathlib import Path
+
+from manim_voiceover.helper import remove_bookmarks
+from manim_voiceover.services.base import SpeechService
+
+# Backend used by the chapters, "gtts" unless SET_THEORY_TTS says otherwise
+TTS_ENV = "SET_THEORY_TTS"
+DEFAULT_BACKEND = "gtts"
+
+TTS_CACHE_DIR = Path(".render_cache/tts")
+
+class GTTSBackend:
+    """Google TTS, needs the network the first time a line is synthesized."""
+    
+    name = "gtts"
+    suffix = ".mp3"
+    
+    def __init__(self, lang="en", tld="com"):
+        self.voice = f"{lang}-{tld}"
+        self.params = {"lang": lang, "tld": tld}
+    
+    def synthesize(self, text, path):
+        from gtts import gTTS
+        gTTS(text, lang=self.params["lang"], tld=self.params["tld"]).save(str(path))
+
+class OfflineBackend:
+    """
+    Local synthesizer that never touches the network.
+    Uses espeak-ng (or espeak) when installed, otherwise writes silence lasting as
+    long as the line would take to read, so timings stay realistic.
+    """
+    
+    name = "offline"
+    suffix = ".wav"
+    sample_rate = 22050
+    
+    def __init__(self, voice="en", words_per_minute=160):
+        self.voice = voice
+        self.engine = shutil.which("espeak-ng") or shutil.which("espeak")
+        self.params = {
+            "engine": Path(self.engine).name if self.engine else "silence",
+            "words_per_minute": words_per_minute,
+        }
+    
+    def estimated_duration(self, text):
+        """Reading time of a line: words at the speaking rate plus short pauses at punctuation."""
+        words = len(text.split())
+        pauses = len(re.findall(r"[.,;:!?]", text))
+        return max(0.5, words * 60 / self.params["words_per_minute"] + 0.3 * pauses)
+    
+    def synthesize(self, text, path):
+        if self.engine:
+            subprocess.run(
+                [self.engine, "-v", self.voice, "-s", str(self.params["words_per_minute"]), "-w", str(path), text],
+                capture_output=True,
+                check=True
+            )
+            return
+        
+        frames = int(self.estimated_duration(text) * self.sample_rate)
+        with wave.open(str(path), "wb") as f:
+            f.setnchannels(1)
+            f.setsampwidth(2)
+            f.setframerate(self.sample_rate)
+            f.writeframes(b"\x00\x00" * frames)
+
+SPEECH_BACKENDS = {
+    GTTSBackend.name: GTTSBackend,
+    OfflineBackend.name: OfflineBackend,
+}
+
+def speech_key(text, backend):
+    """Hash of everything that changes the audio of a line."""
+    data = {
+        "text": text,
+        "service": backend.name,
+        "voice": backend.voice,
+        "params": backend.params,
+    }
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode("utf-8")).hexdigest()
+
+def line_key(text, backend):
+    """Hash of the audio of a voiceover text as the chapters request it, bookmarks removed."""
+    return speech_key(remove_bookmarks(text), backend)
+
+def cached_speech(text, backend):
+    """Return the cached audio file of a line, or None if it was never synthesized."""
+    audio_file = TTS_CACHE_DIR / backend.name / f"{speech_key(text, backend)}{backend.suffix}"
+    if audio_file.exists():
+        return audio_file
+    return None
+
+def synthesize_cached(text, backend):
+    """Return the audio file of a line, synthesizing and storing it on a cache miss."""
+    audio_file = cached_speech(text, backend)
+    if audio_file:
+        return audio_file
+    
+    audio_file = TTS_CACHE_DIR / backend.name / f"{speech_key(text, backend)}{backend.suffix}"
+    audio_file.parent.mkdir(parents=True, exist_ok=True)
+    
+    # Write next to the final file and rename, so parallel renders never see half a file
+    fd, partial = tempfile.mkstemp(suffix=backend.suffix, dir=audio_file.parent)
+    os.close(fd)
+    try:
+        backend.synthesize(text, partial)
+        os.replace(partial, audio_file)
+    finally:
+        if os.path.exists(partial):
+            os.unlink(partial)
+    return audio_file
+
+def synthesize_line(text, backend):
+    """Return the cached audio of a voiceover text, as the chapters request it."""
+    return synthesize_cached(remove_bookmarks(text), backend)
+
+def build_backend(name=None):
+    """Create the backend selected by name or by SET_THEORY_TTS."""
+    name = name or os.environ.get(TTS_ENV, DEFAULT_BACKEND)
+    if name not in SPEECH_BACKENDS:
+        raise ValueError(f"Unknown TTS backend {name!r}, expected one of {sorted(SPEECH_BACKENDS)}")
+    return SPEECH_BACKENDS[name]()
+
+class CachedSpeechService(SpeechService):
+    """manim_voiceover speech service that reads every line through the shared audio cache."""
+    
+    def __init__(self, backend, **kwargs):
+        self.backend = backend
+        super().__init__(**kwargs)
+    
+    def generate_from_text(self, text, cache_dir=None, path=None, **kwargs):
+        if cache_dir is None:
+            cache_dir = self.cache_dir
+        
+        audio_file = synthesize_line(text, self.backend)
+        
+        # The tracker reads the audio from the scene's own voiceover directory
+        audio_path = path or audio_file.name
+        target = Path(cache_dir) / audio_path
+        if not target.exists():
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(audio_file, target)
+        
+        return {
+            "input_text": text,
+            "input_data": {"input_text": text, "service": self.backend.name, "voice": self.backend.voice},
+            "original_audio": audio_path,
+        }
+
+def build_speech_service(name=None):
+    """Speech service used by every chapter."""
+    return CachedSpeechService(build_backend(name))
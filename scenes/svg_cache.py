@@ -0,0 +1,87 @@
+"""
+Geometry cache for SVG images: parsed bezier points stored as .npz files.
+
+SVGMobject parses the XML and converts every path to bezier curves each time a
+process first builds an image. CachedSVGMobject stores the result in
+.render_cache/svg, keyed on the file content and the parse options, so later
+renders load ready-made point arrays instead.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+
+import numpy as np
+from manim import *
+
+SVG_CACHE_DIR = Path(".render_cache/svg")
+
+# Bump when the stored layout changes
+SVG_CACHE_FORMAT = 1
+
+def svg_cache_file(file_path, options):
+    """Return the cache file of an SVG file parsed with the given options."""
+    hasher = hashlib.sha256()
+    hasher.update(f"{SVG_CACHE_FORMAT}\n{options!r}\n".encode())
+    hasher.update(Path(file_path).read_bytes())
+    return SVG_CACHE_DIR / f"{hasher.hexdigest()}.npz"
+
+def save_geometry(mobjects, cache_file):
+    """Write the points and style arrays of parsed submobjects, concatenated with offsets."""
+    def offsets(arrays):
+        return np.cumsum([0] + [len(array) for array in arrays])
+    
+    points = [mob.points for mob in mobjects]
+    fills = [mob.fill_rgbas for mob in mobjects]
+    strokes = [mob.stroke_rgbas for mob in mobjects]
+    
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    partial = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    with open(partial, "wb") as f:
+        np.savez(
+            f,
+            points=np.concatenate(points) if points else np.zeros((0, 3)),
+            point_offsets=offsets(points),
+            fill_rgbas=np.concatenate(fills) if fills else np.zeros((0, 4)),
+            fill_offsets=offsets(fills),
+            stroke_rgbas=np.concatenate(strokes) if strokes else np.zeros((0, 4)),
+            stroke_offsets=offsets(strokes),
+            stroke_widths=np.array([mob.stroke_width for mob in mobjects], dtype=float),
+        )
+    os.replace(partial, cache_file)
+
+def load_geometry(cache_file):
+    """Rebuild the submobjects stored by save_geometry."""
+    with np.load(cache_file) as data:
+        point_offsets = data["point_offsets"]
+        fill_offsets = data["fill_offsets"]
+        stroke_offsets = data["stroke_offsets"]
+        mobjects = []
+        for i, stroke_width in enumerate(data["stroke_widths"]):
+            mob = VMobject()
+            mob.points = data["points"][point_offsets[i]:point_offsets[i + 1]].copy()
+            mob.fill_rgbas = data["fill_rgbas"][fill_offsets[i]:fill_offsets[i + 1]].copy()
+            mob.stroke_rgbas = data["stroke_rgbas"][stroke_offsets[i]:stroke_offsets[i + 1]].copy()
+            mob.stroke_width = float(stroke_width)
+            mobjects.append(mob)
+    return mobjects
+
+class SVGGeometryCache:
+    """Mixin for SVGMobject subclasses: load the parsed geometry from the SVG cache when it can."""
+    
+    def generate_mobject(self):
+        options = (self.svg_default, self.path_string_config)
+        cache_file = svg_cache_file(self.get_file_path(), options)
+        if cache_file.exists():
+            try:
+                self.add(*load_geometry(cache_file))
+                return
+            except (OSError, ValueError, KeyError):
+                # Unreadable entry, parse the file again and replace it
+                pass
+        
+        super().generate_mobject()
+        save_geometry(self.submobjects, cache_file)
+
+class CachedSVGMobject(SVGGeometryCache, SVGMobject):
+    """SVGMobject that loads its parsed geometry from the SVG cache when it can."""
@@ -0,0 +1,191 @@
+"""
+Batched LaTeX: compile every formula of a chapter in one TeX run.
+
+Each MathTex normally runs its own latex and dvisvgm processes on a cold cache.
+The chapter source is scanned for MathTex/Tex calls with literal arguments or
+formula constants (see scenes.formulas), the missing formulas are typeset as the
+pages of a single multi-page document, and every page is stored under the SVG file
+name manim looks up for that formula.
+"""
+
+import ast
+import os
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+
+from manim import config, logger
+from manim.mobject.text import tex_mobject
+from manim.utils.tex_file_writing import compile_tex, delete_nonsvg_files, generate_tex_file, tex_hash
+
+from scenes.formulas import formula_constants, formula_value
+from scenes.tex_cache import claim_tex_locks, evict, fetch_svg, store_svg, tex_key
+
+TEX_CLASSES = {"MathTex", "Tex", "SingleStringMathTex"}
+
+# Keyword arguments that change the TeX source of a formula
+TEX_KEYWORDS = {"arg_separator", "substrings_to_isolate", "tex_environment"}
+
+# Document class of manim's templates, and its multi-page version used for batches
+STANDALONE = "\\documentclass[preview]{standalone}"
+BATCH_PAGE_ENV = "texbatchpage"
+BATCH_STANDALONE = (
+    f"\\documentclass[preview,multi={BATCH_PAGE_ENV}]{{standalone}}\n"
+    f"\\newenvironment{{{BATCH_PAGE_ENV}}}{{}}{{}}"
+)
+
+PLACEHOLDER_SVG = '<svg xmlns="http://www.w3.org/2000/svg" width="1" height="1"><path d="M0 0H1V1Z"/></svg>'
+
+def tex_calls(source_file):
+    """Return (class name, args, kwargs) for every MathTex/Tex call built from literals or formula constants."""
+    tree = ast.parse(Path(source_file).read_text(encoding="utf-8"))
+    constants = formula_constants(tree)
+    calls = []
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in TEX_CLASSES):
+            continue
+        try:
+            args = [formula_value(arg, constants) for arg in node.args]
+            kwargs = {}
+            for keyword in node.keywords:
+                if keyword.arg in TEX_KEYWORDS:
+                    kwargs[keyword.arg] = ast.literal_eval(keyword.value)
+                elif keyword.arg == "tex_to_color_map":
+                    # Only the keys change the TeX source, the colours are constants like BLUE
+                    kwargs[keyword.arg] = {ast.literal_eval(key): "#FFFFFF" for key in keyword.value.keys}
+                elif keyword.arg in (None, "tex_template"):
+                    raise ValueError("formula depends on runtime values")
+        except (ValueError, TypeError, AttributeError):
+            continue
+        calls.append((node.func.id, args, kwargs))
+    return calls
+
+def tex_sources(calls):
+    """
+    Return (expression, environment, template) for every TeX file the calls need.
+    The mobjects are built against a placeholder SVG, only to learn which
+    expressions manim would compile for them (a multi-part MathTex needs one
+    per part on top of the whole formula).
+    """
+    needed = []
+    with tempfile.TemporaryDirectory() as tmp:
+        placeholder = Path(tmp) / "placeholder.svg"
+        placeholder.write_text(PLACEHOLDER_SVG)
+        
+        def record(expression, environment=None, tex_template=None):
+            needed.append((expression, environment, tex_template or config.tex_template))
+            return placeholder
+        
+        original = tex_mobject.tex_to_svg_file
+        tex_mobject.tex_to_svg_file = record
+        try:
+            for class_name, args, kwargs in calls:
+                try:
+                    getattr(tex_mobject, class_name)(*args, **kwargs)
+                except Exception:
+                    continue
+        finally:
+            tex_mobject.tex_to_svg_file = original
+    return needed
+
+def batch_source(head, pages):
+    """Build a document with one page per formula body, or None for custom templates."""
+    if STANDALONE not in head:
+        return None
+    head = head.replace(STANDALONE, BATCH_STANDALONE, 1)
+    body = "\n".join(f"\\begin{{{BATCH_PAGE_ENV}}}\n{page}\n\\end{{{BATCH_PAGE_ENV}}}" for page in pages)
+    return f"{head}\\begin{{document}}\n{body}\n\\end{{document}}\n"
+
+def compile_batch(source, template, svg_files):
+    """
+    Typeset a batch document and move each page to its formula's SVG file.
+    Returns the number of SVG files written; 0 leaves every formula to manim.
+    """
+    tex_dir = config.get_dir("tex_dir")
+    # Parallel renders of the same chapter may batch the same formulas at once
+    name = f"batch_{tex_hash(source)}_{os.getpid()}"
+    batch_file = tex_dir / f"{name}.tex"
+    pages_dir = tex_dir / name
+    batch_file.write_text(source, encoding="utf-8")
+    
+    try:
+        dvi_file = compile_tex(batch_file, template.tex_compiler, template.output_format)
+        pages_dir.mkdir(exist_ok=True)
+        cmd = [
+            "dvisvgm",
+            *(["--pdf"] if template.output_format == ".pdf" else []),
+            "-p", "1-",
+            "-n",
+            "-v", "0",
+            "-o", str(pages_dir / "page-%p.svg"),
+            str(dvi_file),
+        ]
+        subprocess.run(cmd, capture_output=True, check=True)
+    except (OSError, ValueError, subprocess.CalledProcessError) as e:
+        logger.info(f"Batched LaTeX run failed, compiling formulas one by one: {e}")
+        return 0
+    finally:
+        batch_file.unlink(missing_ok=True)
+    
+    pages = sorted(pages_dir.glob("page-*.svg"), key=lambda page: int(page.stem.split("-")[1]))
+    written = 0
+    if len(pages) == len(svg_files):
+        for page, svg_file in zip(pages, svg_files):
+            os.replace(page, svg_file)
+        written = len(pages)
+    
+    shutil.rmtree(pages_dir, ignore_errors=True)
+    for leftover in tex_dir.glob(f"{name}.*"):
+        leftover.unlink(missing_ok=True)
+    if not config.no_latex_cleanup:
+        delete_nonsvg_files()
+    return written
+
+def precompile_tex(source_file):
+    """
+    Compile the missing formulas of a chapter in one LaTeX run per template.
+    Formulas already in the shared cache are copied from it, and the batch
+    results are added to it. Returns the number of SVG files compiled. Formulas
+    built from runtime values are not batched and are compiled by manim when
+    the scene needs them.
+    """
+    groups = {}
+    keys = {}
+    for expression, environment, template in tex_sources(tex_calls(source_file)):
+        tex_file = generate_tex_file(expression, environment, template)
+        svg_file = tex_file.with_suffix(".svg")
+        if svg_file.exists():
+            continue
+        
+        head, _, rest = tex_file.read_text(encoding="utf-8").partition("\\begin{document}")
+        body = rest.rpartition("\\end{document}")[0]
+        group = groups.setdefault((head, template.tex_compiler, template.output_format), (template, {}))
+        group[1][svg_file] = body
+        keys[svg_file] = tex_key(tex_file, template)
+    
+    written = 0
+    # Batch only the formulas whose locks are free: nothing waits here, and a formula
+    # another render is batching right now is compiled or fetched by manim when needed
+    with claim_tex_locks(keys.values()) as held:
+        for (head, _, _), (template, pages) in groups.items():
+            for svg_file in [
+                svg_file for svg_file in pages
+                if keys[svg_file] not in held or fetch_svg(keys[svg_file], svg_file)
+            ]:
+                del pages[svg_file]
+            
+            # A single formula is no faster in a batch
+            if len(pages) < 2:
+                continue
+            source = batch_source(head, list(pages.values()))
+            if source is None or not compile_batch(source, template, list(pages)):
+                continue
+            for svg_file in pages:
+                store_svg(keys[svg_file], svg_file)
+            written += len(pages)
+    
+    if written:
+        logger.info(f"Compiled {written} formulas of {Path(source_file).name} in one LaTeX run")
+        evict()
+    return written
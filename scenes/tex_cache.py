@@ -0,0 +1,164 @@
+"""
+Shared LaTeX cache: compiled formula SVGs reused by every render process.
+
+Entries live in .render_cache/tex, named by a hash of the full TeX source and
+compiler, so the same formula in different chapters, sections or parallel jobs
+is compiled once. Writes are atomic, formulas are compiled under a file lock so
+two processes never compile the same one, and the least recently used entries
+are evicted once the cache grows past TEX_CACHE_LIMIT.
+"""
+
+import fcntl
+import hashlib
+import os
+import shutil
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+
+from manim import config
+from manim.mobject.text import tex_mobject
+from manim.utils.tex_file_writing import generate_tex_file, tex_to_svg_file
+
+TEX_CACHE_DIR = Path(".render_cache/tex")
+TEX_CACHE_LIMIT = 256 * 1024 * 1024
+
+# Eviction goes below the limit, so the next few stores do not evict again
+EVICT_TO = 0.8
+
+# Formulas hash onto this many lock files, so locks never pile up
+LOCK_STRIPES = 256
+
+# Per-process counters, reported in the render manifest
+TEX_CACHE_STATS = {"hits": 0, "misses": 0, "evictions": 0}
+
+def tex_key(tex_file, template):
+    """Hash a generated .tex file together with the compiler that turns it into SVG."""
+    hasher = hashlib.sha256()
+    hasher.update(f"{template.tex_compiler}\n{template.output_format}\n".encode())
+    hasher.update(tex_file.read_bytes())
+    return hasher.hexdigest()
+
+def entry_path(key):
+    """Return the cache file of a key."""
+    return TEX_CACHE_DIR / key[:2] / f"{key}.svg"
+
+def lock_file(stripe):
+    """Return the lock file of a stripe, creating the lock directory if needed."""
+    lock_dir = TEX_CACHE_DIR / "locks"
+    lock_dir.mkdir(parents=True, exist_ok=True)
+    return lock_dir / f"{stripe:03d}.lock"
+
+def lock_stripe(key):
+    """The lock stripe a key falls in."""
+    return int(key[:8], 16) % LOCK_STRIPES
+
+@contextmanager
+def tex_locks(keys):
+    """Hold the locks of several keys, always taken in the same order to avoid deadlocks."""
+    with ExitStack() as stack:
+        for stripe in sorted({lock_stripe(key) for key in keys}):
+            lock = stack.enter_context(open(lock_file(stripe), "w"))
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        yield
+
+@contextmanager
+def claim_tex_locks(keys):
+    """
+    Take the locks of as many keys as possible without waiting for any of them.
+    Yields the set of keys whose locks are held; the others belong to formulas another
+    process is compiling at this moment.
+    """
+    stripes = {}
+    for key in keys:
+        stripes.setdefault(lock_stripe(key), []).append(key)
+    
+    held = set()
+    with ExitStack() as stack:
+        for stripe, stripe_keys in stripes.items():
+            lock = stack.enter_context(open(lock_file(stripe), "w"))
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                continue
+            held.update(stripe_keys)
+        yield held
+
+def fetch_svg(key, svg_file):
+    """Copy a cached SVG to svg_file and mark it as recently used. Returns False on a miss."""
+    entry = entry_path(key)
+    partial = svg_file.with_name(f"{svg_file.name}.{os.getpid()}.tmp")
+    try:
+        shutil.copyfile(entry, partial)
+    except FileNotFoundError:
+        return False
+    os.replace(partial, svg_file)
+    try:
+        os.utime(entry)
+    except FileNotFoundError:
+        pass
+    TEX_CACHE_STATS["hits"] += 1
+    return True
+
+def store_svg(key, svg_file):
+    """Add a compiled SVG to the cache with an atomic rename."""
+    entry = entry_path(key)
+    entry.parent.mkdir(parents=True, exist_ok=True)
+    partial = entry.with_name(f".{entry.name}.{os.getpid()}.tmp")
+    shutil.copyfile(svg_file, partial)
+    os.replace(partial, entry)
+    TEX_CACHE_STATS["misses"] += 1
+
+def evict(limit=TEX_CACHE_LIMIT):
+    """
+    Delete the least recently used entries once the cache is larger than limit.
+    Only one process evicts at a time; the others skip it. Returns the number of
+    entries removed.
+    """
+    TEX_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with open(TEX_CACHE_DIR / "evict.lock", "w") as lock:
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return 0
+
+        entries = []
+        for path in TEX_CACHE_DIR.glob("*/*.svg"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        if total <= limit:
+            return 0
+
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= limit * EVICT_TO:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+    TEX_CACHE_STATS["evictions"] += removed
+    return removed
+
+def shared_tex_to_svg_file(expression, environment=None, tex_template=None):
+    """Drop-in for manim's tex_to_svg_file that goes through the shared cache."""
+    template = tex_template or config.tex_template
+    tex_file = generate_tex_file(expression, environment, template)
+    svg_file = tex_file.with_suffix(".svg")
+    if svg_file.exists():
+        return svg_file
+
+    key = tex_key(tex_file, template)
+    with tex_locks([key]):
+        if fetch_svg(key, svg_file):
+            return svg_file
+        svg_file = tex_to_svg_file(expression, environment, template)
+        store_svg(key, svg_file)
+    evict()
+    return svg_file
+
+def install_tex_cache():
+    """Make every MathTex and Tex built in this process use the shared cache."""
+    tex_mobject.tex_to_svg_file = shared_tex_to_svg_file
@@ -0,0 +1,111 @@
+"""
+Shared text layout cache for Text and MarkupText.
+
+Manim lays out every string with Pango into an SVG named after a hash of the
+text, font, size, weight, slant and colour, but it keeps those SVGs in the
+media directory of each render. CachedText and CachedMarkupText keep them in
+.render_cache/text instead, shared by every chapter and render, and load their
+glyph geometry through the SVG geometry cache.
+"""
+
+import ast
+import os
+import shutil
+from contextlib import contextmanager
+from pathlib import Path
+
+import manim
+from manim import *
+from manimpango import PangoUtils
+
+from scenes.svg_cache import SVGGeometryCache
+
+TEXT_CACHE_DIR = Path(".render_cache/text")
+
+TEXT_CLASSES = {"Text", "MarkupText", "CachedText", "CachedMarkupText"}
+
+def staging_dir():
+    """This process's private directory next to the shared cache."""
+    return TEXT_CACHE_DIR / f".staging-{os.getpid()}"
+
+@contextmanager
+def staging_text_dir():
+    """Point manim's text_dir at a private directory while Pango writes an SVG."""
+    staging = staging_dir()
+    staging.mkdir(parents=True, exist_ok=True)
+    previous = config.text_dir
+    config.text_dir = str(staging)
+    try:
+        yield staging
+    finally:
+        config.text_dir = previous
+
+class SharedTextLayout:
+    """
+    Mixin for Text classes: look the Pango SVG up in the shared cache before laying out.
+    
+    manim rewrites the file _text2svg returns (PangoUtils.remove_last_M), so the shared
+    entry is published already rewritten and every Text gets a private copy of it,
+    removed again once the glyphs are loaded.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        try:
+            super().__init__(*args, **kwargs)
+        finally:
+            shutil.rmtree(staging_dir(), ignore_errors=True)
+    
+    def _text2svg(self, color):
+        cached = TEXT_CACHE_DIR / f"{self._text2hash(color)}.svg"
+        with staging_text_dir() as staging:
+            if not cached.exists():
+                # Lay out privately, then publish with a rename so readers never see half a file
+                svg_file = Path(super()._text2svg(color))
+                PangoUtils.remove_last_M(str(svg_file))
+                os.replace(svg_file, cached)
+            
+            private = staging / cached.name
+            shutil.copyfile(cached, private)
+        return str(private.resolve())
+
+class CachedText(SVGGeometryCache, SharedTextLayout, Text):
+    """Text laid out once for every render, with cached glyph geometry."""
+
+class CachedMarkupText(SVGGeometryCache, SharedTextLayout, MarkupText):
+    """MarkupText laid out once for every render, with cached glyph geometry."""
+
+def literal(node):
+    """Evaluate a literal argument, resolving manim constants such as BOLD or BLUE."""
+    if isinstance(node, ast.Name) and hasattr(manim, node.id):
+        return getattr(manim, node.id)
+    return ast.literal_eval(node)
+
+def text_calls(source_file):
+    """Return (class name, args, kwargs) for every Text/MarkupText call built from literals."""
+    tree = ast.parse(Path(source_file).read_text(encoding="utf-8"))
+    calls = []
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in TEXT_CLASSES):
+            continue
+        if any(keyword.arg is None for keyword in node.keywords):
+            continue
+        try:
+            args = [literal(arg) for arg in node.args]
+            kwargs = {keyword.arg: literal(keyword.value) for keyword in node.keywords}
+        except (ValueError, TypeError):
+            continue
+        calls.append((node.func.id.removeprefix("Cached"), args, kwargs))
+    return calls
+
+def lay_out(calls):
+    """Build the given text mobjects once, filling the layout and geometry caches."""
+    classes = {"Text": CachedText, "MarkupText": CachedMarkupText}
+    built = 0
+    for class_name, args, kwargs in calls:
+        try:
+            classes[class_name](*args, **kwargs)
+        except Exception as e:
+            logger.warning(f"Could not lay out {class_name}{tuple(args)}: {e}")
+            continue
+        built += 1
+    return built
@@ -0,0 +1,506 @@
+"""
+Analytic Venn regions: set operations on circles and rectangles without boolean path ops.
+
+A diagram is described by its shapes, circles ("circle", x, y, r) and axis-aligned,
+possibly rounded, rectangles ("rect", x0, y0, x1, y1, corner_radius), plus a truth
+table saying which of the 2^n membership combinations belong to the region. The
+outline is built exactly: shape boundaries are split where they cross, each piece
+is kept when the table differs on its two sides, and the kept pieces are chained
+into loops of arcs and lines. Outlines are memoized by layout, so the same diagram
+moved elsewhere on screen is not computed again.
+
+VennUnion, VennIntersection and VennDifference are drop-in replacements for manim's
+Union, Intersection and Difference; other shapes fall back to manim's boolean ops.
+venn_region builds a region straight from a set expression such as "A ∩ (B ∪ C)".
+"""
+
+import math
+
+import numpy as np
+from manim import *
+
+from scenes.set_expressions import evaluate, parse_expression, truth_table
+
+TOLERANCE = 1e-6
+
+# Distance from an edge at which its two sides are probed
+PROBE = 1e-4
+
+# Fractions along an edge where it is probed; the majority decides, so one probe that
+# lands on another shape's boundary (a tangent point, say) cannot drop the edge
+PROBE_FRACTIONS = (0.29, 0.5, 0.71)
+
+# Diagrams with more shapes are left to manim's boolean ops
+MAX_SHAPES = 8
+
+# Outlines by layout, relative to the first shape
+REGION_CACHE = {}
+
+def signed_distance(shape, point):
+    """Distance from a point to a shape's boundary, negative inside."""
+    x, y = point[0], point[1]
+    if shape[0] == "circle":
+        _, cx, cy, r = shape
+        return math.hypot(x - cx, y - cy) - r
+    
+    _, x0, y0, x1, y1, rho = shape
+    qx = abs(x - (x0 + x1) / 2) - ((x1 - x0) / 2 - rho)
+    qy = abs(y - (y0 + y1) / 2) - ((y1 - y0) / 2 - rho)
+    return math.hypot(max(qx, 0), max(qy, 0)) + min(max(qx, qy), 0) - rho
+
+def analytic_shape(mobject):
+    """Describe a Circle or an axis-aligned (Rounded)Rectangle as a shape tuple, or None."""
+    if not isinstance(mobject, (Circle, Rectangle)) or not mobject.has_points():
+        return None
+    
+    # Handles can stick out of the outline, so measure on the anchors only
+    anchors = mobject.get_anchors()
+    x0, y0 = anchors[:, 0].min(), anchors[:, 1].min()
+    x1, y1 = anchors[:, 0].max(), anchors[:, 1].max()
+    if isinstance(mobject, Circle):
+        cx, cy = mobject.get_center()[:2]
+        radius = np.linalg.norm(anchors[:, :2] - [cx, cy], axis=1).mean()
+        shape = ("circle", cx, cy, radius)
+    else:
+        # The straight part of the bottom side ends where the corner arcs begin
+        bottom = anchors[np.abs(anchors[:, 1] - y0) < TOLERANCE][:, 0]
+        if len(bottom) == 0:
+            return None
+        shape = ("rect", x0, y0, x1, y1, ((x1 - x0) - (bottom.max() - bottom.min())) / 2)
+    
+    # Rotated or deformed shapes do not match their description
+    scale = max(x1 - x0, y1 - y0)
+    if any(abs(signed_distance(shape, point)) > 1e-4 * scale for point in anchors):
+        return None
+    return shape
+
+def boundary_pieces(shape):
+    """Split a shape's counterclockwise boundary into ("arc", c, r, a0, a1) and ("line", p0, p1) pieces."""
+    if shape[0] == "circle":
+        _, cx, cy, r = shape
+        return [("arc", np.array([cx, cy]), r, 0.0, TAU)]
+    
+    _, x0, y0, x1, y1, rho = shape
+    corners = [
+        np.array([x1 - rho, y0 + rho]),
+        np.array([x1 - rho, y1 - rho]),
+        np.array([x0 + rho, y1 - rho]),
+        np.array([x0 + rho, y0 + rho]),
+    ]
+    pieces = []
+    for i, corner in enumerate(corners):
+        # Side leading into the corner, then the corner's quarter arc
+        start_angle = -PI / 2 + i * PI / 2
+        previous = corners[i - 1]
+        side_start = previous + rho * np.array([math.cos(start_angle), math.sin(start_angle)])
+        side_end = corner + rho * np.array([math.cos(start_angle), math.sin(start_angle)])
+        if np.linalg.norm(side_end - side_start) > TOLERANCE:
+            pieces.append(("line", side_start, side_end))
+        if rho > TOLERANCE:
+            pieces.append(("arc", corner, rho, start_angle, start_angle + PI / 2))
+    return pieces
+
+def arc_offset(piece, point):
+    """Angle of a point along an arc piece, measured from its start."""
+    c, a0 = piece[1], piece[3]
+    return (math.atan2(point[1] - c[1], point[0] - c[0]) - a0) % TAU
+
+def on_piece(piece, point):
+    """Check that a point found on a piece's full circle or line lies on the piece itself."""
+    if piece[0] == "arc":
+        offset = arc_offset(piece, point)
+        span = piece[4] - piece[3]
+        return offset <= span + TOLERANCE or offset >= TAU - TOLERANCE
+    return True
+
+def circle_circle(c1, r1, c2, r2):
+    """Crossing points of two circles; tangent and nested circles have none."""
+    d = np.linalg.norm(c2 - c1)
+    if d < TOLERANCE or d >= r1 + r2 - TOLERANCE or d <= abs(r1 - r2) + TOLERANCE:
+        return []
+    a = (r1 ** 2 - r2 ** 2 + d ** 2) / (2 * d)
+    h = math.sqrt(max(r1 ** 2 - a ** 2, 0))
+    u = (c2 - c1) / d
+    base = c1 + a * u
+    perp = np.array([-u[1], u[0]])
+    return [base + h * perp, base - h * perp]
+
+def circle_segment(c, r, p0, p1):
+    """Crossing points of a circle and a segment."""
+    d = p1 - p0
+    f = p0 - c
+    a = d @ d
+    b = 2 * (f @ d)
+    disc = b ** 2 - 4 * a * (f @ f - r ** 2)
+    if disc <= TOLERANCE:
+        return []
+    root = math.sqrt(disc)
+    ts = [(-b - root) / (2 * a), (-b + root) / (2 * a)]
+    return [p0 + t * d for t in ts if -TOLERANCE <= t <= 1 + TOLERANCE]
+
+def segment_segment(p0, p1, q0, q1):
+    """Crossing point of two segments; parallel segments have none."""
+    r = p1 - p0
+    s = q1 - q0
+    denom = r[0] * s[1] - r[1] * s[0]
+    if abs(denom) < TOLERANCE:
+        return []
+    w = q0 - p0
+    t = (w[0] * s[1] - w[1] * s[0]) / denom
+    u = (w[0] * r[1] - w[1] * r[0]) / denom
+    if -TOLERANCE <= t <= 1 + TOLERANCE and -TOLERANCE <= u <= 1 + TOLERANCE:
+        return [p0 + t * r]
+    return []
+
+def same_carrier(a, b):
+    """Check whether two boundary pieces lie on the same circle or the same line."""
+    if a[0] != b[0]:
+        return False
+    if a[0] == "arc":
+        return np.linalg.norm(a[1] - b[1]) < TOLERANCE and abs(a[2] - b[2]) < TOLERANCE
+    r = a[2] - a[1]
+    cross = lambda v: abs(r[0] * v[1] - r[1] * v[0]) / np.linalg.norm(r)
+    return cross(b[1] - a[1]) < TOLERANCE and cross(b[2] - a[1]) < TOLERANCE
+
+def overlap_ends(a, b):
+    """Where two pieces on the same carrier start or stop overlapping: the ends of each lying on the other."""
+    points = []
+    for piece, other in ((a, b), (b, a)):
+        for point in (edge_point(other, 0), edge_point(other, 1)):
+            if piece[0] == "line":
+                d = piece[2] - piece[1]
+                inside = -TOLERANCE <= ((point - piece[1]) @ d) / (d @ d) <= 1 + TOLERANCE
+            else:
+                inside = on_piece(piece, point)
+            if inside:
+                points.append(point)
+    return points
+
+def piece_crossings(a, b):
+    """Points where two boundary pieces cross, or where they start or stop running together."""
+    if same_carrier(a, b):
+        return overlap_ends(a, b)
+    if a[0] == "arc" and b[0] == "arc":
+        points = circle_circle(a[1], a[2], b[1], b[2])
+    elif a[0] == "arc":
+        points = circle_segment(a[1], a[2], b[1], b[2])
+    elif b[0] == "arc":
+        points = circle_segment(b[1], b[2], a[1], a[2])
+    else:
+        points = segment_segment(a[1], a[2], b[1], b[2])
+    return [point for point in points if on_piece(a, point) and on_piece(b, point)]
+
+def split_piece(piece, points):
+    """Cut a boundary piece into edges at the given points."""
+    if piece[0] == "line":
+        _, p0, p1 = piece
+        d = p1 - p0
+        stops = sorted(((point - p0) @ d) / (d @ d) for point in points)
+        stops = [0.0] + [t for t in stops if TOLERANCE < t < 1 - TOLERANCE] + [1.0]
+        stops = [t for i, t in enumerate(stops) if i == 0 or t - stops[i - 1] > TOLERANCE]
+        return [("line", p0 + a * d, p0 + b * d) for a, b in zip(stops, stops[1:])]
+    
+    _, c, r, a0, a1 = piece
+    span = a1 - a0
+    offsets = sorted(arc_offset(piece, point) for point in points)
+    if span >= TAU - TOLERANCE:
+        # A full circle starts at its first crossing and wraps around to it
+        offsets = [t for i, t in enumerate(offsets) if i == 0 or t - offsets[i - 1] > TOLERANCE]
+        if len(offsets) > 1 and offsets[-1] - offsets[0] > TAU - TOLERANCE:
+            offsets.pop()
+        if not offsets:
+            return [piece]
+        angles = [a0 + t for t in offsets] + [a0 + offsets[0] + TAU]
+    else:
+        offsets = [t for t in offsets if TOLERANCE < t < span - TOLERANCE]
+        angles = [a0] + [a0 + t for t in offsets] + [a1]
+        angles = [a for i, a in enumerate(angles) if i == 0 or a - angles[i - 1] > TOLERANCE]
+    return [("arc", c, r, a, b) for a, b in zip(angles, angles[1:])]
+
+def edge_point(edge, s):
+    """Point at fraction s along an edge."""
+    if edge[0] == "arc":
+        _, c, r, a0, a1 = edge
+        angle = a0 + s * (a1 - a0)
+        return c + r * np.array([math.cos(angle), math.sin(angle)])
+    return edge[1] + s * (edge[2] - edge[1])
+
+def edge_direction(edge, s):
+    """Unit direction of travel at fraction s along an edge."""
+    if edge[0] == "arc":
+        _, c, r, a0, a1 = edge
+        angle = a0 + s * (a1 - a0)
+        return math.copysign(1, a1 - a0) * np.array([-math.sin(angle), math.cos(angle)])
+    d = edge[2] - edge[1]
+    return d / np.linalg.norm(d)
+
+def reverse_edge(edge):
+    """Traverse an edge the other way."""
+    if edge[0] == "arc":
+        _, c, r, a0, a1 = edge
+        return ("arc", c, r, a1, a0)
+    return ("line", edge[2], edge[1])
+
+def membership(shapes, point):
+    """Bitmask of the shapes containing a point."""
+    return sum(1 << i for i, shape in enumerate(shapes) if signed_distance(shape, point) < 0)
+
+def edge_sides(shapes, table, edge, s):
+    """Whether the region lies just inside and just outside an edge at fraction s."""
+    point = edge_point(edge, s)
+    tangent = edge_direction(edge, s)
+    # Boundaries run counterclockwise, so the outside is on the right
+    outward = np.array([tangent[1], -tangent[0]])
+    inner = table[membership(shapes, point - PROBE * outward)]
+    outer = table[membership(shapes, point + PROBE * outward)]
+    return bool(inner), bool(outer)
+
+def same_edge(a, b):
+    """Check whether two oriented edges trace the same path."""
+    return a[0] == b[0] and all(np.linalg.norm(edge_point(a, s) - edge_point(b, s)) < 1e-5 for s in (0, 0.5, 1))
+
+def region_edges(shapes, table):
+    """
+    Return the boundary edges of a region, oriented with the region on their left.
+    An edge belongs to the boundary when the truth table differs on its two sides
+    at most of its probe points. Shapes that share part of their boundary, like a
+    circle drawn twice, give that part once.
+    """
+    pieces = [(i, piece) for i, shape in enumerate(shapes) for piece in boundary_pieces(shape)]
+    edges = []
+    for i, piece in pieces:
+        points = [point for j, other in pieces if j != i for point in piece_crossings(piece, other)]
+        for edge in split_piece(piece, points):
+            sides = [edge_sides(shapes, table, edge, s) for s in PROBE_FRACTIONS]
+            votes = [inner for inner, outer in sides if inner != outer]
+            if 2 * len(votes) > len(sides):
+                edge = edge if 2 * sum(votes) > len(votes) else reverse_edge(edge)
+                if not any(same_edge(edge, kept) for kept in edges):
+                    edges.append(edge)
+    return edges
+
+def turn(heading, direction):
+    """Signed angle from one direction to another, positive to the left."""
+    cross = heading[0] * direction[1] - heading[1] * direction[0]
+    return math.atan2(cross, heading @ direction)
+
+def chain_loops(edges):
+    """
+    Join oriented edges end to start into closed loops. Where several edges
+    leave the same point, the sharpest left turn keeps to the current face.
+    Returns None if an edge cannot be continued.
+    """
+    starts = [edge_point(edge, 0) for edge in edges]
+    unused = list(range(len(edges)))
+    loops = []
+    while unused:
+        loop = [unused.pop(0)]
+        origin = starts[loop[0]]
+        end = edge_point(edges[loop[0]], 1)
+        while np.linalg.norm(end - origin) > 1e-5:
+            candidates = [i for i in unused if np.linalg.norm(starts[i] - end) <= 1e-5]
+            if not candidates:
+                return None
+            heading = edge_direction(edges[loop[-1]], 1)
+            following = max(candidates, key=lambda i: turn(heading, edge_direction(edges[i], 0)))
+            unused.remove(following)
+            loop.append(following)
+            end = edge_point(edges[following], 1)
+        loops.append([edges[i] for i in loop])
+    return loops
+
+def edge_beziers(edge):
+    """Cubic bezier control points of an edge, four per curve."""
+    if edge[0] == "line":
+        p0, p1 = edge[1], edge[2]
+        return [p0, p0 + (p1 - p0) / 3, p0 + 2 * (p1 - p0) / 3, p1]
+    
+    _, c, r, a0, a1 = edge
+    count = max(1, math.ceil(abs(a1 - a0) / (PI / 2) - TOLERANCE))
+    step = (a1 - a0) / count
+    handle = 4 / 3 * math.tan(step / 4) * r
+    points = []
+    for k in range(count):
+        alpha = a0 + k * step
+        beta = alpha + step
+        start = c + r * np.array([math.cos(alpha), math.sin(alpha)])
+        end = c + r * np.array([math.cos(beta), math.sin(beta)])
+        points.extend([
+            start,
+            start + handle * np.array([-math.sin(alpha), math.cos(alpha)]),
+            end - handle * np.array([-math.sin(beta), math.cos(beta)]),
+            end,
+        ])
+    return points
+
+def region_points(shapes, table):
+    """Bezier points of a region's outline, or None if its boundary could not be chained."""
+    if not table.any():
+        return np.zeros((0, 3))
+    loops = chain_loops(region_edges(shapes, table))
+    if loops is None:
+        return None
+    points = [point for loop in loops for edge in loop for point in edge_beziers(edge)]
+    return np.column_stack([np.array(points), np.zeros(len(points))])
+
+def cached_region_points(shapes, table):
+    """region_points memoized by layout: shapes relative to the first one, and the table."""
+    ox, oy = shapes[0][1], shapes[0][2]
+    relative = []
+    for shape in shapes:
+        if shape[0] == "circle":
+            _, x, y, r = shape
+            relative.append(("circle", round(x - ox, 6), round(y - oy, 6), round(r, 6)))
+        else:
+            _, x0, y0, x1, y1, rho = shape
+            relative.append(
+                ("rect", round(x0 - ox, 6), round(y0 - oy, 6), round(x1 - ox, 6), round(y1 - oy, 6), round(rho, 6))
+            )
+    key = (tuple(relative), table.tobytes())
+    if key not in REGION_CACHE:
+        REGION_CACHE[key] = region_points(relative, table)
+    points = REGION_CACHE[key]
+    if points is None:
+        return None
+    return points + np.array([ox, oy, 0])
+
+def same_shape(a, b):
+    """Check whether two shape tuples describe the same shape."""
+    return a[0] == b[0] and all(abs(x - y) < TOLERANCE for x, y in zip(a[1:], b[1:]))
+
+def venn_of(mobject):
+    """Return (shapes, table) of a VennRegion, circle or rectangle, or None."""
+    if isinstance(mobject, VennRegion):
+        return mobject.venn
+    shape = analytic_shape(mobject)
+    if shape is None:
+        return None
+    return (shape,), np.array([False, True])
+
+def merge_operands(operands):
+    """
+    Put the operands of a set operation on a common list of shapes.
+    Returns the shapes and every operand's truth table over all their combinations.
+    """
+    shapes = []
+    positions = []
+    for operand_shapes, _ in operands:
+        indices = []
+        for shape in operand_shapes:
+            for j, known in enumerate(shapes):
+                if same_shape(shape, known):
+                    indices.append(j)
+                    break
+            else:
+                shapes.append(shape)
+                indices.append(len(shapes) - 1)
+        positions.append(indices)
+    
+    masks = np.arange(1 << len(shapes))
+    tables = []
+    for (_, table), indices in zip(operands, positions):
+        # Each operand sees only the bits of its own shapes, in its own order
+        local = np.zeros_like(masks)
+        for bit, j in enumerate(indices):
+            local |= ((masks >> j) & 1) << bit
+        tables.append(table[local])
+    return tuple(shapes), tables
+
+class VennRegion(VMobject):
+    """
+    Region of a Venn diagram built from its shapes and truth table.
+    
+    ``venn`` holds the (shapes, table) pair, so regions can be combined further.
+    When the region is not analytic, ``fallback`` builds it with boolean ops and
+    ``venn`` is None.
+    """
+    
+    def __init__(self, shapes, table, fallback=None, **kwargs):
+        super().__init__(**kwargs)
+        self.venn = None
+        points = None
+        if shapes is not None and len(shapes) <= MAX_SHAPES:
+            table = np.asarray(table, dtype=bool)
+            points = cached_region_points(shapes, table)
+        if points is not None:
+            self.venn = (tuple(shapes), table)
+        elif fallback is not None:
+            points = fallback().points
+        else:
+            raise ValueError("Could not build the outline of this Venn region")
+        self.set_points(points)
+
+def combined(vmobjects, operation):
+    """Shapes and combined table of a set operation, or (None, None) if an operand is not analytic."""
+    operands = [venn_of(mobject) for mobject in vmobjects]
+    if any(operand is None for operand in operands):
+        return None, None
+    shapes, tables = merge_operands(operands)
+    return shapes, operation(tables)
+
+class VennUnion(VennRegion):
+    """Union of Venn regions, circles and rectangles."""
+    
+    def __init__(self, *vmobjects, **kwargs):
+        shapes, table = combined(vmobjects, lambda tables: np.logical_or.reduce(tables))
+        super().__init__(shapes, table, fallback=lambda: Union(*vmobjects), **kwargs)
+
+class VennIntersection(VennRegion):
+    """Intersection of Venn regions, circles and rectangles."""
+    
+    def __init__(self, *vmobjects, **kwargs):
+        shapes, table = combined(vmobjects, lambda tables: np.logical_and.reduce(tables))
+        super().__init__(shapes, table, fallback=lambda: Intersection(*vmobjects), **kwargs)
+
+class VennDifference(VennRegion):
+    """The part of subject outside clip."""
+    
+    def __init__(self, subject, clip, **kwargs):
+        shapes, table = combined([subject, clip], lambda tables: tables[0] & ~tables[1])
+        super().__init__(shapes, table, fallback=lambda: Difference(subject, clip), **kwargs)
+
+BOOLEAN_OPS = {
+    "union": Union,
+    "intersection": Intersection,
+    "difference": Difference,
+    "symmetric_difference": Exclusion,
+}
+
+def boolean_region(tree, sets, universe):
+    """Build a parsed expression with manim's boolean ops, for shapes that are not analytic."""
+    kind = tree[0]
+    if kind == "set":
+        return sets[tree[1]]
+    if kind == "empty":
+        return VMobject()
+    if kind == "complement":
+        return Difference(sets[universe], boolean_region(tree[1], sets, universe))
+    return BOOLEAN_OPS[kind](boolean_region(tree[1], sets, universe), boolean_region(tree[2], sets, universe))
+
+def venn_region(expression, sets, universe="U", **kwargs):
+    """
+    Shade a set expression on a diagram, e.g. venn_region("A ∩ (B ∪ C)", {"A": a, "B": b, "C": c}).
+    
+    ``sets`` maps the names of the expression to the diagram's circles and rectangles.
+    Complements are taken inside ``sets[universe]``, so expressions that reach outside
+    every set need it. Style the region with the usual VMobject keyword arguments.
+    """
+    names = [name for name in sets if name != universe]
+    if universe not in sets and truth_table(expression, names, universe)[0]:
+        raise ValueError(f"{expression!r} reaches outside every set, pass the universe as sets[{universe!r}]")
+    tree = parse_expression(expression)
+    fallback = lambda: boolean_region(tree, sets, universe)
+    
+    shapes = [analytic_shape(mobject) for mobject in sets.values()]
+    if any(shape is None for shape in shapes):
+        return VennRegion(None, None, fallback=fallback, **kwargs)
+    
+    # Sets drawn as the same shape become one shape of the diagram, or the boundary
+    # they share would be traced once for each of them
+    shapes, tables = merge_operands([((shape,), np.array([False, True])) for shape in shapes])
+    members = dict(zip(sets, tables))
+    table = evaluate(tree, members, universe)
+    if universe in sets:
+        # Nothing outside the universe is shaded
+        table = table & members[universe]
+    return VennRegion(shapes, table, fallback=fallback, **kwargs)
@@ -0,0 +1,120 @@
+"""Stream probing and the choice between stream copy and re-encoding in the final assembly."""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from pipeline import assemble
+from pipeline.assemble import assemble_video, common_profile, conform, starts_with_keyframe, stream_profile
+
+VIDEO = {
+    "codec_type": "video",
+    "codec_name": "h264",
+    "profile": "High",
+    "width": 1920,
+    "height": 1080,
+    "pix_fmt": "yuv420p",
+    "r_frame_rate": "60/1",
+    "time_base": "1/15360",
+    "bit_rate": "900000",
+}
+AUDIO = {"codec_type": "audio", "codec_name": "aac", "sample_rate": "48000", "channels": 2, "bit_rate": "128000"}
+
+def profile(audio=True, **video):
+    """Stream profile of a chapter with the default streams, changed by video."""
+    video = {**VIDEO, **video}
+    return {
+        "video": {key: video[key] for key in assemble.VIDEO_KEYS},
+        "audio": {key: AUDIO[key] for key in assemble.AUDIO_KEYS} if audio else None,
+    }
+
+@pytest.fixture
+def probes(monkeypatch):
+    """Answer ffprobe from a table of streams and first-packet flags per file name."""
+    probes = {}
+    
+    def run_ffprobe(args):
+        video_file = probes[Path(args[-1]).name]
+        if "-show_streams" in args:
+            return {"streams": video_file["streams"]}
+        return {"packets": [{"flags": video_file["flags"]}]}
+    
+    monkeypatch.setattr(assemble, "run_ffprobe", run_ffprobe)
+    return probes
+
+def test_profile_ignores_bit_rates(probes):
+    probes["a.mp4"] = {"streams": [VIDEO, AUDIO], "flags": "K__"}
+    probes["b.mp4"] = {"streams": [{**VIDEO, "bit_rate": "1"}, {**AUDIO, "bit_rate": "1"}], "flags": "K__"}
+    assert stream_profile(Path("a.mp4")) == stream_profile(Path("b.mp4")) == profile()
+
+def test_profile_without_audio_or_video(probes):
+    probes["silent.mp4"] = {"streams": [VIDEO], "flags": "K__"}
+    probes["audio.mp4"] = {"streams": [AUDIO], "flags": ""}
+    assert stream_profile(Path("silent.mp4"))["audio"] is None
+    with pytest.raises(ValueError, match="no video stream"):
+        stream_profile(Path("audio.mp4"))
+
+def test_keyframe_check(probes):
+    probes["cut.mp4"] = {"streams": [VIDEO], "flags": "K__"}
+    probes["uncut.mp4"] = {"streams": [VIDEO], "flags": "___"}
+    assert starts_with_keyframe(Path("cut.mp4"))
+    assert not starts_with_keyframe(Path("uncut.mp4"))
+
+def test_common_profile_is_the_majority():
+    small = profile(width=1280, height=720)
+    assert common_profile([small, profile(), profile()]) == profile()
+    assert common_profile([small, profile()]) == small
+
+@pytest.fixture
+def assembled(probes, monkeypatch):
+    """Record the chapters assemble_video re-encodes and the parts it concatenates."""
+    calls = {"conformed": [], "parts": None}
+    
+    def fake_conform(video_file, common, output):
+        calls["conformed"].append((video_file.name, common))
+        return output
+    
+    def fake_concat(parts, output, list_file):
+        calls["parts"] = [part.name for part in parts]
+        return output
+    
+    monkeypatch.setattr(assemble, "conform", fake_conform)
+    monkeypatch.setattr(assemble, "concat_copy", fake_concat)
+    return calls
+
+def test_matching_chapters_are_stream_copied(probes, assembled, tmp_path):
+    for name in ["ch1.mp4", "ch2.mp4"]:
+        probes[name] = {"streams": [VIDEO, AUDIO], "flags": "K__"}
+    assert assemble_video([Path("ch1.mp4"), Path("ch2.mp4")], tmp_path / "out.mp4", tmp_path)
+    assert assembled == {"conformed": [], "parts": ["ch1.mp4", "ch2.mp4"]}
+
+def test_odd_chapters_are_re_encoded(probes, assembled, tmp_path):
+    probes["ch1.mp4"] = {"streams": [VIDEO, AUDIO], "flags": "K__"}
+    probes["ch2.mp4"] = {"streams": [{**VIDEO, "pix_fmt": "yuv444p"}, AUDIO], "flags": "K__"}
+    probes["ch3.mp4"] = {"streams": [VIDEO, AUDIO], "flags": "___"}
+    probes["ch4.mp4"] = {"streams": [VIDEO, AUDIO], "flags": "K__"}
+    videos = [Path(f"ch{number}.mp4") for number in range(1, 5)]
+    assert assemble_video(videos, tmp_path / "out.mp4", tmp_path)
+    assert assembled["conformed"] == [("ch2.mp4", profile()), ("ch3.mp4", profile())]
+    assert assembled["parts"] == ["ch1.mp4", "conformed_02.mp4", "conformed_03.mp4", "ch4.mp4"]
+
+def test_probe_failures_fail_the_assembly(probes, assembled, tmp_path, capsys):
+    probes["ch1.mp4"] = {"streams": [AUDIO], "flags": ""}
+    assert not assemble_video([Path("ch1.mp4")], tmp_path / "out.mp4", tmp_path)
+    assert "no video stream" in capsys.readouterr().out
+    assert assembled["parts"] is None
+
+def test_silent_chapters_get_a_soundtrack(probes, monkeypatch):
+    probes["silent.mp4"] = {"streams": [{**VIDEO, "width": 1280, "height": 720}], "flags": "K__"}
+    commands = []
+    monkeypatch.setattr(subprocess, "run", lambda cmd, **kwargs: commands.append(cmd))
+    conform(Path("silent.mp4"), profile(), Path("out.mp4"))
+    
+    cmd, = commands
+    assert cmd[cmd.index("-i", 3) + 1] == "anullsrc=r=48000:cl=stereo"
+    assert cmd[cmd.index("-map") + 1:cmd.index("-map") + 4] == ["0:v:0", "-map", "1:a:0"]
+    assert cmd[cmd.index("-s") + 1] == "1920x1080"
+    assert cmd[cmd.index("-profile:v") + 1] == "high"
+    assert cmd[cmd.index("-video_track_timescale") + 1] == "15360"
+    assert cmd[-2:] == ["-y", "out.mp4"]
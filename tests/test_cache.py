@@ -0,0 +1,65 @@
+"""Content keys and storage of the render cache."""
+
+import pytest
+
+from pipeline.cache import cached_video, content_key, rendition_file, renditions, store_video, video_manifest
+
+@pytest.fixture(autouse=True)
+def empty_workdir(tmp_path, monkeypatch):
+    """Run every test in an empty directory, without shared scene helpers or renditions."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("SET_THEORY_RENDITIONS", raising=False)
+    monkeypatch.delenv("SET_THEORY_TTS", raising=False)
+
+def test_same_sources_give_the_same_key():
+    sources = [("source", "self.play(Write(title))")]
+    assert content_key(sources, "-qh") == content_key(list(sources), "-qh")
+
+def test_key_covers_sources_quality_and_tts(monkeypatch):
+    key = content_key([("source", "a")], "-qh")
+    assert content_key([("source", "b")], "-qh") != key
+    assert content_key([("source", "a")], "-ql") != key
+    monkeypatch.setenv("SET_THEORY_TTS", "offline")
+    assert content_key([("source", "a")], "-qh") != key
+
+def test_key_covers_referenced_images(tmp_path):
+    (tmp_path / "images").mkdir()
+    image = tmp_path / "images" / "icon.svg"
+    image.write_text("<svg/>")
+    sources = [("source", 'CachedSVGMobject("images/icon.svg")')]
+    key = content_key(sources, "-qh")
+    image.write_text("<svg><path/></svg>")
+    assert content_key(sources, "-qh") != key
+
+def test_renditions_keep_heights_below_the_quality(monkeypatch):
+    monkeypatch.setenv("SET_THEORY_RENDITIONS", "720, 480p,720,abc,1440")
+    assert renditions() == ["720p", "480p", "1440p"]
+    assert renditions("-qh") == ["720p", "480p"]
+    assert renditions("-ql") == []
+
+def test_stored_video_is_found_with_its_manifest(tmp_path):
+    video = tmp_path / "render.mp4"
+    video.write_bytes(b"video")
+    directory = tmp_path / "cache"
+    
+    assert cached_video(directory, "k1") is None
+    cached = store_video(directory, "k1", video, {"frames": 3})
+    assert cached_video(directory, "k1") == cached
+    assert video_manifest(cached) == {"frames": 3, "key": "k1"}
+
+def test_storing_a_build_drops_older_ones(tmp_path):
+    video = tmp_path / "render.mp4"
+    video.write_bytes(b"video")
+    directory = tmp_path / "cache"
+    store_video(directory, "old", video, {})
+    store_video(directory, "new", video, {})
+    assert sorted(path.name for path in directory.iterdir()) == ["new.json", "new.mp4"]
+
+def test_video_without_manifest_is_not_cached(tmp_path):
+    directory = tmp_path / "cache"
+    directory.mkdir()
+    (directory / "k1.mp4").write_bytes(b"video")
+    assert cached_video(directory, "k1") is None
+
+def test_rendition_file_sits_next_to_the_video(tmp_path):
+    assert rendition_file(tmp_path / "a.mp4", "720p") == tmp_path / "a_720p.mp4"
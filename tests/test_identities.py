@@ -0,0 +1,51 @@
+"""The check of the set identities displayed by the chapters."""
+
+from pathlib import Path
+
+from pipeline.identities import check_identities, counterexamples, describe_region, displayed_identities, identity_sides
+
+DE_MORGAN = r"(A \cup B)^c = A^c \cap B^c"
+WRONG_DE_MORGAN = r"(A \cup B)^c = A^c \cup B^c"
+
+def test_identity_sides():
+    assert identity_sides(DE_MORGAN) == [r"(A \cup B)^c", r"A^c \cap B^c"]
+    assert identity_sides(r"\overline{A \cap B} = \overline{A} \cup \overline{B}") == [
+        r"(A \cap B)^c", r"(A)^c \cup (B)^c"
+    ]
+
+def test_formulas_that_are_not_identities():
+    assert identity_sides(r"A = \{1, 2, 3\}") is None
+    assert identity_sides(r"|A \cup B| = 5") is None
+    assert identity_sides("A = B") is None
+    assert identity_sides(r"A \cup B") is None
+
+def test_de_morgan_holds():
+    names, tables, regions = counterexamples(identity_sides(DE_MORGAN))
+    assert names == ["A", "B"]
+    assert len(regions) == 0
+
+def test_wrong_law_has_counterexamples():
+    names, tables, regions = counterexamples(identity_sides(WRONG_DE_MORGAN))
+    assert [describe_region(region, names) for region in regions] == ["in A and outside B", "in B and outside A"]
+
+def test_check_reports_wrong_law(tmp_path, capsys):
+    scene = tmp_path / "scene.py"
+    scene.write_text(
+        f"WRONG = r'{WRONG_DE_MORGAN}'\n"
+        "title = Tex('Sets')\n"
+        f"law = MathTex(r'{DE_MORGAN}')\n"
+        "wrong = MathTex(WRONG)\n"
+        "shown = MathTex(name + r' \\cup B = B')\n"
+    )
+    assert [line for line, _, _ in displayed_identities(scene)] == [3, 4]
+    assert check_identities([scene]) == 1
+    
+    out = capsys.readouterr().out
+    assert f"{scene}:4: {WRONG_DE_MORGAN} does not hold" in out
+    assert "in A and outside B: inside A^c \\cup B^c, not inside (A \\cup B)^c" in out
+    assert "Checked 2 displayed identities, 1 problems" in out
+
+def test_chapter_identities_hold():
+    scenes = sorted(Path(__file__).parent.parent.glob("scenes/ch*.py"))
+    assert scenes
+    assert check_identities(scenes) == 0
@@ -0,0 +1,74 @@
+"""Joining the HLS playlists and DASH manifests of the packaged parts."""
+
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from pipeline.package import MPD_NAMESPACE, iso_seconds, media_playlist, write_media_playlist, write_mpd
+
+def write_part(directory, durations, duration):
+    """Fabricate the segments, video playlist and DASH manifest ffmpeg writes for one part."""
+    directory.mkdir(parents=True)
+    lines = ["#EXTM3U", "#EXT-X-VERSION:7", '#EXT-X-MAP:URI="init-0.m4s"']
+    for number, seconds in enumerate(durations, 1):
+        segment = f"chunk-0-{number:05d}.m4s"
+        (directory / segment).write_bytes(b"\0" * 1000 * number)
+        lines += [f"#EXTINF:{seconds},", segment]
+    (directory / "media_0.m3u8").write_text("\n".join(lines + ["#EXT-X-ENDLIST"]) + "\n")
+    (directory / "manifest.mpd").write_text(
+        f'<?xml version="1.0"?>\n<MPD xmlns="{MPD_NAMESPACE}" type="static" mediaPresentationDuration="{duration}">'
+        f'<Period id="0" start="PT0.0S"><AdaptationSet id="0"><Representation id="0" width="1920" height="1080"/>'
+        f'</AdaptationSet></Period></MPD>'
+    )
+
+@pytest.fixture
+def parts(tmp_path):
+    """Two parts: a section of two segments and one of a single segment."""
+    write_part(tmp_path / "segments" / "aaa", [6.0, 2.5], "PT8.5S")
+    write_part(tmp_path / "segments" / "bbb", [6.4], "PT6.4S")
+    return [tmp_path / "segments" / "aaa", tmp_path / "segments" / "bbb"]
+
+def test_media_playlist_of_a_part(parts):
+    assert media_playlist(parts[0], 0) == ("init-0.m4s", [(6.0, "chunk-0-00001.m4s"), (2.5, "chunk-0-00002.m4s")])
+
+def test_playlists_join_with_discontinuities(parts, tmp_path):
+    peak = write_media_playlist(tmp_path / "video.m3u8", parts, 0)
+    lines = (tmp_path / "video.m3u8").read_text().splitlines()
+    assert lines[:5] == [
+        "#EXTM3U",
+        "#EXT-X-VERSION:7",
+        "#EXT-X-TARGETDURATION:7",
+        "#EXT-X-MEDIA-SEQUENCE:0",
+        "#EXT-X-PLAYLIST-TYPE:VOD",
+    ]
+    assert lines[5:] == [
+        '#EXT-X-MAP:URI="segments/aaa/init-0.m4s"',
+        "#EXTINF:6.000000,",
+        "segments/aaa/chunk-0-00001.m4s",
+        "#EXTINF:2.500000,",
+        "segments/aaa/chunk-0-00002.m4s",
+        "#EXT-X-DISCONTINUITY",
+        '#EXT-X-MAP:URI="segments/bbb/init-0.m4s"',
+        "#EXTINF:6.400000,",
+        "segments/bbb/chunk-0-00001.m4s",
+        "#EXT-X-ENDLIST",
+    ]
+    # The second segment of the first part carries the most bits per second
+    assert peak == 6400
+
+def test_iso_durations():
+    assert iso_seconds("PT8.5S") == 8.5
+    assert iso_seconds("PT1M3.5S") == 63.5
+    assert iso_seconds("PT1H0M0S") == 3600
+
+def test_one_period_per_part(parts, tmp_path):
+    write_mpd(tmp_path / "manifest.mpd", [("chapter_01_intro", parts[0]), ("chapter_01_outro", parts[1])])
+    root = ET.parse(tmp_path / "manifest.mpd").getroot()
+    assert root.get("mediaPresentationDuration") == "PT14.900S"
+    
+    periods = root.findall(f"{{{MPD_NAMESPACE}}}Period")
+    assert [period.get("id") for period in periods] == ["chapter_01_intro", "chapter_01_outro"]
+    assert [period.get("start") for period in periods] == ["PT0.000S", "PT8.500S"]
+    assert [period.get("duration") for period in periods] == ["PT8.500S", "PT6.400S"]
+    assert [period.find(f"{{{MPD_NAMESPACE}}}BaseURL").text for period in periods] == ["segments/aaa/", "segments/bbb/"]
+    assert len(root.findall(f".//{{{MPD_NAMESPACE}}}Representation")) == 2
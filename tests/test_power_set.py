@@ -0,0 +1,28 @@
+"""Lazy subset enumeration and the power set formula."""
+
+import pytest
+
+from scenes.power_set import power_set_tex, subset_masks, subsets
+
+def test_binary_order_is_the_default():
+    assert list(subset_masks(3)) == list(range(8))
+    assert list(subsets("ab")) == [(), ("a",), ("b",), ("a", "b")]
+
+@pytest.mark.parametrize("n", [0, 1, 3, 6])
+def test_gray_order_changes_one_element_at_a_time(n):
+    masks = list(subset_masks(n, "gray"))
+    assert sorted(masks) == list(range(1 << n))
+    assert all(bin(a ^ b).count("1") == 1 for a, b in zip(masks, masks[1:]))
+
+def test_unknown_order():
+    with pytest.raises(ValueError, match="Unknown subset order 'random'"):
+        list(subset_masks(2, "random"))
+
+def test_power_set_tex():
+    assert power_set_tex([0, 1]) == r"P(A) = \{ \varnothing, \{0\}, \{1\}, \{0, 1\} \}"
+    assert power_set_tex([0, 1], name="B", order="gray") == r"P(B) = \{ \varnothing, \{0\}, \{0, 1\}, \{1\} \}"
+
+def test_subsets_are_generated_lazily():
+    stream = subsets(range(40))
+    assert next(stream) == ()
+    assert next(stream) == (0,)
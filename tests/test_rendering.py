@@ -0,0 +1,83 @@
+"""The chapter renderer: parallel rasterizing and the frames its file writer encodes."""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+av = pytest.importorskip("av")
+
+from manim import RED, Circle, Create, Scene, Square, config, tempconfig
+from manim.renderer.cairo_renderer import CairoRenderer
+
+from scenes.rendering import RENDITIONS_ENV, can_rasterize_in_parallel, chapter_renderer, rendition_heights
+
+@pytest.fixture(autouse=True)
+def media_dir(tmp_path):
+    """Render into an empty media directory at low quality (15 frames per second)."""
+    with tempconfig({"media_dir": str(tmp_path), "quality": "low_quality", "write_to_movie": True, "format": "mp4"}):
+        yield tmp_path
+
+def scene_playing(*animations, renderer=None):
+    """A scene about to play the given animations."""
+    scene = Scene(renderer=renderer or chapter_renderer())
+    scene.animations = list(animations)
+    scene.stop_condition = None
+    return scene
+
+def test_long_plays_are_split():
+    assert can_rasterize_in_parallel(scene_playing(Create(Circle(), run_time=4)), 4)
+
+def test_short_plays_are_not_worth_a_fork():
+    assert not can_rasterize_in_parallel(scene_playing(Create(Circle(), run_time=1)), 4)
+    
+    # Every process needs at least two frames
+    assert not can_rasterize_in_parallel(scene_playing(Create(Circle(), run_time=4)), 40)
+
+def test_updaters_keep_the_play_serial():
+    square = Square().add_updater(lambda mobject, dt: mobject.rotate(dt))
+    scene = scene_playing(Create(Circle(), run_time=4))
+    scene.add(square)
+    assert not can_rasterize_in_parallel(scene, 4)
+
+def test_stop_conditions_keep_the_play_serial():
+    scene = scene_playing(Create(Circle(), run_time=4))
+    scene.stop_condition = lambda: False
+    assert not can_rasterize_in_parallel(scene, 4)
+
+def test_only_the_chapter_renderer_rasterizes_in_parallel():
+    assert not can_rasterize_in_parallel(scene_playing(Create(Circle(), run_time=4), renderer=CairoRenderer()), 4)
+
+def test_png_output_is_rendered_serially():
+    with tempconfig({"format": "png"}):
+        assert not can_rasterize_in_parallel(scene_playing(Create(Circle(), run_time=4)), 4)
+
+class HeldWait(Scene):
+    def construct(self):
+        self.add(Square(side_length=4, color=RED, fill_opacity=1))
+        self.wait(2)
+
+def test_held_wait_keeps_every_frame():
+    scene = HeldWait(renderer=chapter_renderer())
+    scene.render()
+    writer = scene.renderer.file_writer
+    with av.open(str(writer.movie_file_path)) as container:
+        frames = [frame.to_ndarray(format="rgb24") for frame in container.decode(video=0)]
+    
+    # The frozen wait reaches the writer as one frame repeated 30 times
+    assert len(frames) == 2 * config.frame_rate
+    assert writer.held_frames == len(frames) - 1
+    
+    height, width, _ = frames[0].shape
+    assert np.abs(frames[0][height // 2, width // 2].astype(int) - [0xFC, 0x62, 0x55]).max() < 12
+    assert np.abs(frames[0][2, 2].astype(int)).max() < 12
+    assert all(np.abs(frame.astype(int) - frames[0]).max() < 12 for frame in frames)
+
+def test_renditions_are_smaller_than_the_render(monkeypatch):
+    monkeypatch.setenv(RENDITIONS_ENV, "720p, 240,480,abc")
+    assert rendition_heights() == [240]
+
+@pytest.mark.parametrize("settings", [{"format": "gif"}, {"format": "png"}, {"format": "webm"}, {"transparent": True}])
+def test_renditions_need_opaque_mp4_output(monkeypatch, settings):
+    monkeypatch.setenv(RENDITIONS_ENV, "240")
+    with tempconfig(settings):
+        assert rendition_heights() == []
@@ -0,0 +1,55 @@
+"""Scheduling of concurrent chapter renders."""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from pipeline import scheduler
+from pipeline.scheduler import default_jobs, job_names, render_chapters
+
+@pytest.fixture
+def chapters(tmp_path, monkeypatch):
+    """Three chapter sources in an empty directory, the second longest and the first shortest."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "scenes").mkdir()
+    chapters = []
+    for number, lines in enumerate([5, 20, 10], 1):
+        source = f"class Chapter{number}:\n    def construct(self):\n" + "        pass\n" * lines
+        (tmp_path / "scenes" / f"ch{number}.py").write_text(source)
+        chapters.append((f"scenes/ch{number}", f"Chapter{number}"))
+    return chapters
+
+@pytest.fixture
+def renders(monkeypatch):
+    """Render on a single thread, recording the jobs in the order they start."""
+    renders = []
+    
+    def render_chapter(number, module, class_name, quality, media_dir, section=None, *args):
+        renders.append((number, class_name, quality, media_dir))
+        video_file = media_dir / f"{class_name}.mp4"
+        video_file.parent.mkdir(parents=True, exist_ok=True)
+        video_file.write_text(class_name)
+        _, manifest_file = job_names(number, class_name, media_dir, section)
+        manifest_file.write_text(json.dumps({"movie_file": str(video_file), "timeline": []}))
+        return video_file, None
+    
+    monkeypatch.setattr(scheduler, "render_chapter", render_chapter)
+    monkeypatch.setattr(scheduler, "ProcessPoolExecutor", ThreadPoolExecutor)
+    return renders
+
+def test_workers_never_outnumber_the_chapters():
+    assert default_jobs([]) == 1
+    assert 1 <= default_jobs([("a", "A"), ("b", "B")]) <= 2
+
+def test_videos_come_back_in_chapter_order(chapters, renders):
+    videos = render_chapters(chapters, "-ql", jobs=1, media_root=Path("media"))
+    assert [video.read_text() for video in videos] == ["Chapter1", "Chapter2", "Chapter3"]
+    assert [render[0] for render in renders] == [2, 3, 1]
+    assert [render[3] for render in renders] == [Path("media") / f"chapter_0{number}" for number in [2, 3, 1]]
+    assert {render[2] for render in renders} == {"-ql"}
+
+def test_a_failed_chapter_fails_the_render(chapters, renders, monkeypatch):
+    monkeypatch.setattr(scheduler, "render_chapter", lambda *args: (None, "manim failed"))
+    assert render_chapters(chapters, "-ql", jobs=1, media_root=Path("media")) is None
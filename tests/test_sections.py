@@ -0,0 +1,92 @@
+"""Section discovery and per-section cache keys."""
+
+import pytest
+
+from pipeline.sections import chapter_sections
+
+CHAPTER = '''
+from manim import *
+
+class Demo(Scene):
+    def construct(self):
+        self.next_section("show_first")
+        self.show_first()
+        self.next_section("show_second")
+        self.show_second()
+        self.next_section("show_third")
+        self.show_third()
+    
+    def show_first(self):
+        self.title("first")
+    
+    def show_second(self):
+        self.wait(1)
+    
+    def show_third(self):
+        self.wait(2)
+    
+    def title(self, text):
+        self.add(Text(text))
+'''
+
+@pytest.fixture
+def chapter(tmp_path, monkeypatch):
+    """Write the demo chapter into an empty working directory and return its path."""
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / "demo.py"
+    path.write_text(CHAPTER)
+    return path
+
+def section_keys(quality="-ql"):
+    return {name: key for name, key, _ in chapter_sections("demo", "Demo", quality)}
+
+def test_sections_are_listed_in_call_order(chapter):
+    assert list(section_keys()) == ["show_first", "show_second", "show_third"]
+
+def test_helpers_count_towards_the_section_cost(chapter):
+    costs = {name: cost for name, _, cost in chapter_sections("demo", "Demo", "-ql")}
+    assert costs["show_first"] > costs["show_second"]
+
+def test_editing_a_section_changes_only_its_key(chapter):
+    before = section_keys()
+    chapter.write_text(CHAPTER.replace("self.wait(1)", "self.wait(1.5)"))
+    after = section_keys()
+    assert [after[name] == before[name] for name in before] == [True, False, True]
+
+def test_editing_a_helper_changes_the_sections_that_call_it(chapter):
+    before = section_keys()
+    chapter.write_text(CHAPTER.replace("Text(text)", "Tex(text)"))
+    assert section_keys()["show_first"] != before["show_first"]
+
+def test_editing_the_last_section_keeps_the_others(chapter):
+    before = section_keys()
+    chapter.write_text(CHAPTER.replace("self.wait(2)", "self.wait(3)"))
+    after = section_keys()
+    assert [after[name] == before[name] for name in before] == [True, True, False]
+
+def test_editing_shared_code_changes_every_key(chapter):
+    before = section_keys()
+    chapter.write_text(CHAPTER.replace("from manim import *", "from manim import *\nSCALE = 2"))
+    after = section_keys()
+    assert all(after[name] != before[name] for name in before)
+
+def test_sections_reading_earlier_state_follow_its_edits(chapter):
+    source = CHAPTER.replace("self.wait(1)", "self.shape = Circle()")
+    chapter.write_text(source.replace("self.wait(2)", "self.play(FadeOut(self.shape))"))
+    before = section_keys()
+    chapter.write_text(chapter.read_text().replace("Circle()", "Square()"))
+    after = section_keys()
+    assert [after[name] == before[name] for name in before] == [True, False, False]
+
+def test_sections_clearing_the_screen_follow_the_section_before(chapter):
+    chapter.write_text(CHAPTER.replace("self.wait(2)", "self.play(FadeOut(*self.mobjects))"))
+    before = section_keys()
+    chapter.write_text(chapter.read_text().replace('"first"', '"First"'))
+    after = section_keys()
+    assert [after[name] == before[name] for name in before] == [False, True, True]
+    
+    chapter.write_text(chapter.read_text().replace("self.wait(1)", "self.wait(1.5)"))
+    assert [section_keys()[name] == after[name] for name in before] == [True, False, False]
+
+def test_keys_depend_on_the_quality(chapter):
+    assert section_keys("-ql") != section_keys("-qh")
@@ -0,0 +1,66 @@
+"""Parsing and evaluating the set expressions shaded on Venn diagrams."""
+
+import numpy as np
+import pytest
+
+from scenes.set_expressions import expression_sets, parse_expression, region_mask, truth_table
+
+A, B, C = ("set", "A"), ("set", "B"), ("set", "C")
+
+def test_intersection_binds_tighter_than_union():
+    assert parse_expression("A ∪ B ∩ C") == ("union", A, ("intersection", B, C))
+    assert parse_expression("A ∩ B ∪ C") == ("union", ("intersection", A, B), C)
+
+def test_loose_operators_associate_left():
+    assert parse_expression("A \\ B \\ C") == ("difference", ("difference", A, B), C)
+    assert parse_expression("A ∪ B \\ C") == ("difference", ("union", A, B), C)
+    assert parse_expression("A Δ B ∪ C") == ("union", ("symmetric_difference", A, B), C)
+
+def test_complement_binds_tightest():
+    assert parse_expression("A ∩ Bᶜ") == ("intersection", A, ("complement", B))
+    assert parse_expression("(A ∪ B)ᶜ") == ("complement", ("union", A, B))
+
+@pytest.mark.parametrize("latex, unicode", [
+    (r"A \cup B", "A ∪ B"),
+    (r"A \cap B", "A ∩ B"),
+    (r"A \setminus B", "A \\ B"),
+    (r"A \triangle B", "A Δ B"),
+    (r"(A \cup B)^c", "(A ∪ B)ᶜ"),
+    (r"\varnothing", "∅"),
+])
+def test_latex_spellings(latex, unicode):
+    assert parse_expression(latex) == parse_expression(unicode)
+
+@pytest.mark.parametrize("text, message", [
+    ("A ∪", "Expected a set"),
+    ("(A ∪ B", r"Expected '\)'"),
+    ("A B", "Unexpected 'B'"),
+    ("A $ B", "Unexpected"),
+])
+def test_malformed_expressions(text, message):
+    with pytest.raises(ValueError, match=message):
+        parse_expression(text)
+
+def test_unknown_set():
+    with pytest.raises(ValueError, match="'C' is not part of the diagram"):
+        truth_table("A ∪ C", ["A", "B"])
+
+def test_sets_in_order_of_appearance():
+    assert expression_sets(parse_expression("C ∪ A ∩ (B ∪ C)")) == ["C", "A", "B"]
+    assert expression_sets(parse_expression("Uᶜ ∪ A")) == ["A"]
+
+def test_truth_tables():
+    # Region m lies in the i-th set when bit i of m is set
+    assert truth_table("A \\ B", ["A", "B"]).tolist() == [False, True, False, False]
+    assert truth_table("A Δ B", ["A", "B"]).tolist() == [False, True, True, False]
+    assert truth_table("Aᶜ", ["A", "B"]).tolist() == [True, False, True, False]
+    assert truth_table("U", []).tolist() == [True]
+
+def test_de_morgan_tables_agree():
+    names = ["A", "B", "C"]
+    assert np.array_equal(truth_table("(A ∪ B ∪ C)ᶜ", names), truth_table("Aᶜ ∩ Bᶜ ∩ Cᶜ", names))
+
+def test_region_masks():
+    assert region_mask("A ∩ B", ["A", "B"]) == 0b1000
+    assert region_mask("A ∪ B", ["A", "B"]) == 0b1110
+    assert region_mask("∅", ["A", "B"]) == 0
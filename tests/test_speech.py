@@ -0,0 +1,81 @@
+"""Cache keys and storage of the voiceover audio cache."""
+
+import wave
+
+import pytest
+
+pytest.importorskip("manim_voiceover")
+
+from scenes import speech
+from scenes.speech import OfflineBackend, build_backend, cached_speech, speech_key, synthesize_cached
+
+class FakeBackend:
+    """Backend that writes the text it was asked for and counts its calls."""
+    
+    name = "fake"
+    suffix = ".txt"
+    
+    def __init__(self, voice="en", fail=False):
+        self.voice = voice
+        self.params = {"rate": 1}
+        self.fail = fail
+        self.calls = []
+    
+    def synthesize(self, text, path):
+        self.calls.append(text)
+        with open(path, "w") as f:
+            f.write(text[:2])
+            if self.fail:
+                raise RuntimeError("synthesizer crashed")
+            f.write(text[2:])
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keep the audio cache of the tests in a temporary directory."""
+    monkeypatch.setattr(speech, "TTS_CACHE_DIR", tmp_path / "tts")
+    return tmp_path / "tts"
+
+def test_key_covers_text_service_voice_and_params():
+    backend = FakeBackend()
+    key = speech_key("A set is a collection.", backend)
+    assert speech_key("A set is a collection.", FakeBackend()) == key
+    assert speech_key("A set is a collection!", backend) != key
+    assert speech_key("A set is a collection.", FakeBackend(voice="de")) != key
+    
+    backend.params = {"rate": 2}
+    assert speech_key("A set is a collection.", backend) != key
+    backend.params = {"rate": 1}
+    backend.name = "other"
+    assert speech_key("A set is a collection.", backend) != key
+
+def test_lines_are_synthesized_once(cache_dir):
+    backend = FakeBackend()
+    assert cached_speech("Hello", backend) is None
+    
+    audio_file = synthesize_cached("Hello", backend)
+    assert audio_file == cache_dir / "fake" / f"{speech_key('Hello', backend)}.txt"
+    assert audio_file.read_text() == "Hello"
+    assert synthesize_cached("Hello", backend) == audio_file
+    assert cached_speech("Hello", backend) == audio_file
+    assert backend.calls == ["Hello"]
+
+def test_failed_synthesis_leaves_nothing_behind(cache_dir):
+    backend = FakeBackend(fail=True)
+    with pytest.raises(RuntimeError):
+        synthesize_cached("Hello", backend)
+    assert cached_speech("Hello", backend) is None
+    assert list((cache_dir / "fake").iterdir()) == []
+
+def test_offline_silence_lasts_as_long_as_the_line(tmp_path):
+    backend = OfflineBackend()
+    backend.engine = None
+    path = tmp_path / "line.wav"
+    backend.synthesize("One, two, three words.", path)
+    with wave.open(str(path)) as f:
+        duration = f.getnframes() / f.getframerate()
+    assert duration == pytest.approx(backend.estimated_duration("One, two, three words."), abs=1e-3)
+
+def test_unknown_backends_are_rejected():
+    assert isinstance(build_backend("offline"), OfflineBackend)
+    with pytest.raises(ValueError, match="Unknown TTS backend"):
+        build_backend("festival")
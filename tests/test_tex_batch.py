@@ -0,0 +1,58 @@
+"""Formula discovery and batch documents of the chapter LaTeX pre-compile."""
+
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("manim")
+
+from scenes.power_set import power_set_tex
+from scenes.tex_batch import BATCH_PAGE_ENV, STANDALONE, batch_source, tex_calls
+
+SCENE = '''
+LAW = r"A \\cup \\varnothing = A"
+POWER_SET = power_set_tex([1, 2], name="B")
+LABEL = f"{LAW}"
+
+class Demo(Scene):
+    def construct(self):
+        law = MathTex(r"A \\cup B", "=", r"B \\cup A", font_size=48, substrings_to_isolate=["A"])
+        colored = MathTex(r"A \\cap B", tex_to_color_map={"A": BLUE})
+        runtime = MathTex(f"{self.name}")
+        templated = Tex("x", tex_template=TEMPLATE)
+        spread = MathTex(*parts)
+        constants = MathTex(LAW, POWER_SET)
+        unresolved = MathTex(LABEL)
+'''
+
+def test_literal_formulas_are_found(tmp_path):
+    source_file = tmp_path / "demo.py"
+    source_file.write_text(SCENE)
+    calls = tex_calls(source_file)
+    assert ("MathTex", [r"A \cup B", "=", r"B \cup A"], {"substrings_to_isolate": ["A"]}) in calls
+    assert ("MathTex", [r"A \cap B"], {"tex_to_color_map": {"A": "#FFFFFF"}}) in calls
+
+def test_formulas_built_at_runtime_are_left_to_manim(tmp_path):
+    source_file = tmp_path / "demo.py"
+    source_file.write_text(SCENE)
+    assert len(tex_calls(source_file)) == 3
+
+def test_formula_constants_are_resolved(tmp_path):
+    source_file = tmp_path / "demo.py"
+    source_file.write_text(SCENE)
+    assert ("MathTex", [r"A \cup \varnothing = A", power_set_tex([1, 2], name="B")], {}) in tex_calls(source_file)
+
+def test_every_chapter_formula_is_visible_to_the_batch():
+    # ch07's power set is generated into a module-level constant the scan resolves
+    chapter = Path(__file__).parents[1] / "scenes" / "ch07_sets_of_sets_and_power_sets.py"
+    formulas = [part for _, args, _ in tex_calls(chapter) for part in args]
+    assert power_set_tex([0, 1]) in formulas
+
+def test_batch_has_one_page_per_formula():
+    head = f"{STANDALONE}\n\\usepackage{{amsmath}}\n"
+    source = batch_source(head, ["$a$", "$b$"])
+    assert source.count(f"\\begin{{{BATCH_PAGE_ENV}}}") == 2
+    assert f"multi={BATCH_PAGE_ENV}" in source
+
+def test_custom_templates_are_not_batched():
+    assert batch_source("\\documentclass{article}\n", ["$a$"]) is None
@@ -0,0 +1,80 @@
+"""Section and voiceover times of spliced chapters and of the final video."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from pipeline import timeline
+from pipeline.timeline import splice_manifests, video_timeline, write_timeline
+
+def section_manifest(section, frames, voiceovers=()):
+    """Render manifest of one section at 15 fps, with voiceovers as (text, start, end)."""
+    return {
+        "scene": "Demo",
+        "sections": [section],
+        "duration": frames / 15,
+        "frame_rate": 15,
+        "frames": frames,
+        "timeline": [{
+            "section": section,
+            "start": 0.0,
+            "end": frames / 15,
+            "voiceovers": [
+                {"text": text, "audio_key": f"tts-{text}", "audio": f"{text}.mp3", "start": start, "end": end}
+                for text, start, end in voiceovers
+            ],
+        }],
+    }
+
+def test_sections_move_to_where_they_start():
+    manifest = splice_manifests([
+        ("key-intro", section_manifest("intro", 30, [("Hi", 0.5, 1.5)])),
+        ("key-outro", section_manifest("outro", 45, [("Bye", 1.0, 2.0)])),
+    ])
+    assert manifest["frames"] == 75
+    assert manifest["duration"] == 5.0
+    assert manifest["sections"] == ["intro", "outro"]
+    
+    intro, outro = manifest["timeline"]
+    assert (intro["key"], intro["start"], intro["end"]) == ("key-intro", 0.0, 2.0)
+    assert (outro["key"], outro["start"], outro["end"]) == ("key-outro", 2.0, 5.0)
+    assert (outro["voiceovers"][0]["start"], outro["voiceovers"][0]["end"]) == (3.0, 4.0)
+
+@pytest.fixture
+def chapter_manifests(monkeypatch):
+    """Two cached chapters: one spliced from two sections, one rendered whole."""
+    manifests = {
+        "ch1.mp4": {**splice_manifests([
+            ("key-intro", section_manifest("intro", 30, [("Hi", 0.5, 1.5)])),
+            ("key-outro", section_manifest("outro", 44)),
+        ]), "key": "chapter-1"},
+        "ch2.mp4": {**section_manifest("all", 20, [("Sets", 0.12, 0.95)]), "key": "chapter-2"},
+    }
+    monkeypatch.setattr(timeline, "video_manifest", lambda video: manifests[video.name])
+    return manifests
+
+def test_final_timeline_frame_spans(chapter_manifests):
+    chapters = [("scenes/ch1", "One"), ("scenes/ch2", "Two")]
+    result = video_timeline(chapters, [Path("ch1.mp4"), Path("ch2.mp4")], Path("final.mp4"))
+    assert (result["frames"], result["frame_rate"]) == (94, 15)
+    
+    one, two = result["chapters"]
+    assert (one["start_frame"], one["end_frame"], one["key"]) == (0, 74, "chapter-1")
+    assert (two["start_frame"], two["end_frame"], two["key"]) == (74, 94, "chapter-2")
+    assert [(s["section"], s["key"], s["start_frame"], s["end_frame"]) for s in one["sections"]] == [
+        ("intro", "key-intro", 0, 30),
+        ("outro", "key-outro", 30, 74),
+    ]
+    
+    # Voiceover times snap to the frame grid of the whole video
+    sets, = two["sections"][0]["voiceovers"]
+    assert (sets["start_frame"], sets["end_frame"]) == (76, 88)
+    assert sets["start"] == 76 / 15
+    assert (sets["audio_key"], sets["audio"]) == ("tts-Sets", "Sets.mp3")
+    assert two["sections"][0]["key"] is None
+
+def test_timeline_file_next_to_the_video(chapter_manifests, tmp_path):
+    timeline_file = write_timeline([("scenes/ch2", "Two")], [Path("ch2.mp4")], tmp_path / "Final.mp4")
+    assert timeline_file == tmp_path / "Final.timeline.json"
+    assert json.loads(timeline_file.read_text())["frames"] == 20
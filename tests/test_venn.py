@@ -0,0 +1,92 @@
+"""Analytic Venn outlines against areas sampled from the truth tables."""
+
+import math
+
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from scenes.set_expressions import truth_table
+from manim import Circle, Square
+
+from scenes.venn import region_points, signed_distance, venn_region
+
+# Samples per unit length of the grid used for the reference areas
+GRID = 100
+
+def outline_area(points):
+    """Area enclosed by bezier outlines (four points per curve), counterclockwise positive."""
+    t = np.linspace(0, 1, 65)[:, None]
+    area = 0.0
+    for k in range(0, len(points), 4):
+        p0, p1, p2, p3 = points[k:k + 4, :2]
+        curve = (1 - t) ** 3 * p0 + 3 * (1 - t) ** 2 * t * p1 + 3 * (1 - t) * t ** 2 * p2 + t ** 3 * p3
+        area += np.sum(curve[:-1, 0] * curve[1:, 1] - curve[1:, 0] * curve[:-1, 1]) / 2
+    return area
+
+def sampled_area(shapes, table):
+    """Area of the region selected by the table, counted on a grid of cell centres."""
+    x = np.arange(-1.5, 2.5, 1 / GRID) + 1 / (2 * GRID)
+    xs, ys = np.meshgrid(x, x)
+    regions = np.zeros(xs.shape, dtype=int)
+    for i, shape in enumerate(shapes):
+        inside = np.vectorize(lambda px, py: signed_distance(shape, (px, py)) < 0)(xs, ys)
+        regions |= inside.astype(int) << i
+    return table[regions].sum() / GRID ** 2
+
+TWO_CIRCLES = [("circle", 0.0, 0.0, 1.0), ("circle", 1.0, 0.0, 1.0)]
+THREE_CIRCLES = [("circle", 0.0, 0.0, 1.0), ("circle", 1.0, 0.0, 1.0), ("circle", 0.5, 0.8, 1.0)]
+CIRCLE_AND_CARD = [("circle", 0.0, 0.0, 1.0), ("rect", 0.2, -0.8, 2.0, 0.6, 0.3)]
+INNER_CIRCLE = [("circle", 0.0, 0.0, 1.0), ("circle", 0.5, 0.0, 0.5)]
+INNER_SQUARE = [("rect", -1.0, -1.0, 1.0, 1.0, 0.2), ("rect", -1.0, -1.0, 0.0, 0.0, 0.0)]
+ROUNDED_CORNER = [("rect", -1.0, -1.0, 1.0, 1.0, 0.5), ("circle", 0.5, 0.5, 0.5)]
+
+@pytest.mark.parametrize("shapes, expression", [
+    (TWO_CIRCLES, "A ∪ B"),
+    (TWO_CIRCLES, "A ∩ B"),
+    (TWO_CIRCLES, "A \\ B"),
+    (TWO_CIRCLES, "A Δ B"),
+    (THREE_CIRCLES, "A ∩ (B ∪ C)"),
+    (THREE_CIRCLES, "(A ∪ B)ᶜ ∩ C"),
+    (CIRCLE_AND_CARD, "A ∪ B"),
+    (CIRCLE_AND_CARD, "B \\ A"),
+    (INNER_CIRCLE, "A \\ B"),
+    (INNER_SQUARE, "A ∪ B"),
+    (INNER_SQUARE, "A Δ B"),
+    (ROUNDED_CORNER, "A \\ B"),
+])
+def test_outline_encloses_the_sampled_area(shapes, expression):
+    table = truth_table(expression, list("ABC"[:len(shapes)]))
+    assert outline_area(region_points(shapes, table)) == pytest.approx(sampled_area(shapes, table), rel=0.02)
+
+def test_lens_area_is_exact():
+    # Intersection of two unit circles one radius apart: 2π/3 - √3/2
+    table = truth_table("A ∩ B", ["A", "B"])
+    assert outline_area(region_points(TWO_CIRCLES, table)) == pytest.approx(2 * math.pi / 3 - math.sqrt(3) / 2, rel=1e-3)
+
+def test_tangent_circles_keep_both_outlines():
+    # The second circle's only edge has its midpoint on the tangent point
+    shapes = [("circle", 0.0, 0.0, 1.0), ("circle", 2.0, 0.0, 1.0)]
+    table = truth_table("A ∪ B", ["A", "B"])
+    assert outline_area(region_points(shapes, table)) == pytest.approx(2 * math.pi, rel=1e-3)
+
+def test_internally_tangent_circles():
+    for expression, area in [("A ∪ B", math.pi), ("A ∩ B", math.pi / 4), ("A \\ B", 3 * math.pi / 4)]:
+        table = truth_table(expression, ["A", "B"])
+        assert outline_area(region_points(INNER_CIRCLE, table)) == pytest.approx(area, rel=1e-3)
+
+def test_coincident_shapes_are_traced_once():
+    shapes = [("circle", 0.0, 0.0, 1.0), ("circle", 0.0, 0.0, 1.0)]
+    assert outline_area(region_points(shapes, truth_table("A ∪ B", ["A", "B"]))) == pytest.approx(math.pi, rel=1e-3)
+
+@pytest.mark.parametrize("expression, area", [("A ∪ B", math.pi), ("A ∩ B", math.pi), ("A \\ B", 0), ("Aᶜ", 16 - math.pi)])
+def test_sets_drawn_as_the_same_circle(expression, area):
+    sets = {"A": Circle(radius=1), "B": Circle(radius=1), "U": Square(side_length=4)}
+    region = venn_region(expression, sets)
+    assert len(region.venn[0]) == 2
+    assert outline_area(region.points) == pytest.approx(area, rel=1e-3, abs=1e-9)
+
+def test_empty_region_has_no_outline():
+    table = truth_table("A ∩ ∅", ["A", "B"])
+    assert len(region_points(TWO_CIRCLES, table)) == 0
@@ -0,0 +1,156 @@
+"""The warm worker's client side: requests, timeouts and the fallback to local renders."""
+
+import os
+import queue
+import signal
+import socket
+import threading
+import time
+from multiprocessing.connection import Client, Listener
+from pathlib import Path
+
+import pytest
+
+from pipeline import worker
+from pipeline.scheduler import MANIFEST_ENV, SECTIONS_ENV
+from pipeline.worker import reap, receive_request, render_with_worker, worker_connection, worker_key, worker_request
+
+@pytest.fixture(autouse=True)
+def key_file(tmp_path, monkeypatch):
+    """Keep the worker key of the tests in a temporary directory."""
+    monkeypatch.setattr(worker, "WORKER_KEY_FILE", tmp_path / "worker.key")
+    return tmp_path / "worker.key"
+
+def fake_worker(handle):
+    """Answer one connection on a free local port with handle(conn, request); returns the address."""
+    listener = Listener(("127.0.0.1", 0), authkey=worker_key(create=True))
+    
+    def run():
+        with listener, listener.accept() as conn:
+            handle(conn, conn.recv())
+    
+    threading.Thread(target=run, daemon=True).start()
+    return listener.address
+
+def free_address():
+    """A local address nothing listens on."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()
+
+def test_no_key_means_no_worker():
+    assert worker_connection(free_address()) is None
+    assert worker_request({"ping": True}, free_address()) is None
+
+def test_nobody_listening():
+    worker_key(create=True)
+    assert worker_request({"ping": True}, free_address(), timeout=1) is None
+
+def test_ping():
+    address = fake_worker(lambda conn, request: conn.send({"ok": True, "jobs": 0, "request": request}))
+    assert worker_request({"ping": True}, address) == {"ok": True, "jobs": 0, "request": {"ping": True}}
+
+def test_queued_jobs_wait_for_their_reply():
+    def handle(conn, request):
+        conn.send({"queued": True})
+        time.sleep(0.5)
+        conn.send({"error": None, "output": request["output"]})
+    
+    address = fake_worker(handle)
+    assert worker_request({"output": "Demo"}, address, timeout=0.2) == {"error": None, "output": "Demo"}
+
+def test_worker_that_does_not_acknowledge():
+    address = fake_worker(lambda conn, request: time.sleep(2))
+    start = time.perf_counter()
+    assert worker_request({"ping": True}, address, timeout=0.3) is None
+    assert time.perf_counter() - start < 1.5
+
+def test_worker_that_stalls_the_handshake():
+    worker_key(create=True)
+    with socket.socket() as server:
+        server.bind(("127.0.0.1", 0))
+        server.listen()
+        start = time.perf_counter()
+        assert worker_connection(server.getsockname(), timeout=0.3) is None
+        assert time.perf_counter() - start < 1.5
+
+def test_jobs_render_locally_without_a_worker(tmp_path, monkeypatch):
+    calls = []
+    
+    def render_chapter(number, module, class_name, quality, media_dir, section=None, *args):
+        calls.append((number, class_name, media_dir, section))
+        return Path("local.mp4"), None
+    
+    monkeypatch.setattr(worker, "worker_request", lambda job: None)
+    monkeypatch.setattr(worker, "render_chapter", render_chapter)
+    result = render_with_worker(3, "scenes/ch03_empty_set", "EmptySetWithVoiceover", "-ql", tmp_path, "show_title")
+    assert result == (Path("local.mp4"), None)
+    assert calls == [(3, "EmptySetWithVoiceover", tmp_path, "show_title")]
+
+def test_jobs_sent_to_the_worker(tmp_path, monkeypatch):
+    jobs = []
+    monkeypatch.setattr(worker, "worker_request", lambda job: jobs.append(job) or {"error": None})
+    monkeypatch.setattr(worker, "generated_video", lambda manifest_file: tmp_path / "Demo.mp4")
+    assert render_with_worker(3, "scenes/ch03_empty_set", "EmptySetWithVoiceover", "-ql", tmp_path, "show_title") == (
+        tmp_path / "Demo.mp4", None
+    )
+    
+    job, = jobs
+    assert job["module"] == "scenes/ch03_empty_set"
+    assert job["env"][SECTIONS_ENV] == "show_title"
+    assert job["env"][MANIFEST_ENV].endswith(".json")
+    assert Path(job["log_file"]).parent == tmp_path
+
+def test_worker_errors_point_at_the_log(tmp_path, monkeypatch):
+    monkeypatch.setattr(worker, "worker_request", lambda job: {"error": "Traceback: boom"})
+    video_file, error = render_with_worker(3, "scenes/ch03_empty_set", "EmptySetWithVoiceover", "-ql", tmp_path)
+    assert video_file is None
+    assert error.startswith("Traceback: boom\nLOG: ")
+
+def received_request(connect, key, timeout):
+    """Run receive_request on the connection connect(address) makes; returns the queue and connect's result."""
+    requests = queue.Queue()
+    client = []
+    with Listener(("127.0.0.1", 0)) as listener:
+        thread = threading.Thread(target=lambda: client.append(connect(listener.address)), daemon=True)
+        thread.start()
+        receive_request(listener.accept(), key, requests, timeout)
+        thread.join(timeout=5)
+    return requests, client[0]
+
+def test_requests_are_authenticated_and_queued():
+    key = worker_key(create=True)
+    
+    def connect(address):
+        client = Client(address, authkey=key)
+        client.send({"ping": True})
+        return client
+    
+    requests, client = received_request(connect, key, timeout=1)
+    conn, request = requests.get_nowait()
+    assert request == {"ping": True}
+    conn.send({"ok": True})
+    assert client.recv() == {"ok": True}
+    client.close()
+    conn.close()
+
+def test_stalled_handshakes_are_dropped():
+    key = worker_key(create=True)
+    start = time.perf_counter()
+    requests, client = received_request(socket.create_connection, key, timeout=0.3)
+    assert time.perf_counter() - start < 1.5
+    assert requests.empty()
+    client.close()
+
+def test_killed_jobs_free_their_slot():
+    pid = os.fork()
+    if pid == 0:
+        time.sleep(30)
+        os._exit(0)
+    running = {pid: "Demo"}
+    os.kill(pid, signal.SIGKILL)
+    deadline = time.perf_counter() + 5
+    while running and time.perf_counter() < deadline:
+        reap(running)
+        time.sleep(0.05)
+    assert running == {}